@@ -1,20 +1,270 @@
 # api/tauri_builder_api.py
-from flask import Flask, jsonify, request
-from tauri_builder import TauriBuilder, BuildConfig
+import os
+import json
+import time
+import uuid
+import hashlib
+import threading
+from collections import deque
+from dataclasses import fields
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, get_type_hints
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import Flask, Response, jsonify, request
+from tauri_builder import TauriBuilder, BuildConfig, metrics
+
+MAX_WORKERS = int(os.environ.get('TAURIDOCK_API_WORKERS', 2))
+MAX_QUEUED = int(os.environ.get('TAURIDOCK_API_MAX_QUEUED', 50))
+MAX_FINISHED = int(os.environ.get('TAURIDOCK_API_MAX_FINISHED', 200))
+SSE_KEEPALIVE = 15.0
+
+# JSON strings converted to the types BuildConfig declares; missing fields take its defaults
+_FIELD_TYPES = get_type_hints(BuildConfig)
+PATH_FIELDS = {name for name, hint in _FIELD_TYPES.items() if hint in (Path, Optional[Path])}
+LIST_FIELDS = {name for name, hint in _FIELD_TYPES.items() if hint == List[str]}
+
+
+class QueueFull(Exception):
+    """Raised when the job queue has no room for another build"""
+
+
+def build_config(data: Dict) -> BuildConfig:
+    """Create a BuildConfig from a JSON request body
+
+    Raises ValueError for unknown or missing fields.
+    """
+    known = {f.name for f in fields(BuildConfig)}
+    unknown = set(data) - known
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+
+    if 'dockerfile' not in data:
+        raise ValueError("Missing required field: dockerfile")
+
+    values = dict(data)
+    for name in PATH_FIELDS & set(values):
+        if values[name] is not None:
+            values[name] = Path(values[name])
+    for name in LIST_FIELDS & set(values):
+        if isinstance(values[name], str):
+            values[name] = [item.strip() for item in values[name].split(',') if item.strip()]
+
+    try:
+        return BuildConfig(**values)
+    except TypeError as e:
+        raise ValueError(str(e)) from e
+
+
+class Job:
+    """A queued build with its status, results and a bounded log buffer"""
+
+    MAX_LOG_LINES = 10000
+
+    def __init__(self, key: str, payload: Dict):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.payload = payload
+        self.status = 'queued'
+        self.created = time.time()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.artifacts: Dict[str, List[str]] = {}
+        self.timings: Dict[str, float] = {}
+        self.release_url: Optional[str] = None
+        self.error: Optional[str] = None
+
+        self._lines = deque(maxlen=self.MAX_LOG_LINES)
+        self._next_seq = 0
+        self._changed = threading.Condition()
+
+    @property
+    def done(self) -> bool:
+        return self.status in ('succeeded', 'failed')
+
+    def log(self, line: str):
+        """Append a log line and wake up any streaming clients"""
+        with self._changed:
+            self._lines.append(line)
+            self._next_seq += 1
+            self._changed.notify_all()
+
+    def finish(self, status: str):
+        with self._changed:
+            self.status = status
+            self.finished = time.time()
+            self._changed.notify_all()
+
+    def wait_for_lines(self, cursor: int, timeout: float) -> Tuple[List[str], int]:
+        """Return lines logged since cursor, waiting up to timeout for new ones
+
+        Lines that fell out of the buffer are skipped.
+        """
+        with self._changed:
+            self._changed.wait_for(lambda: self._next_seq > cursor or self.done, timeout)
+            first_seq = self._next_seq - len(self._lines)
+            start = max(cursor, first_seq) - first_seq
+            return list(self._lines)[start:], self._next_seq
+
+    def to_dict(self) -> Dict:
+        return {
+            'id': self.id,
+            'status': self.status,
+            'created': self.created,
+            'started': self.started,
+            'finished': self.finished,
+            'artifacts': self.artifacts,
+            'timings': self.timings,
+            'release_url': self.release_url,
+            'error': self.error,
+        }
+
+
+class JobQueue:
+    """Bounded build queue that merges identical in-flight requests"""
+
+    def __init__(self, max_workers: int = MAX_WORKERS, max_queued: int = MAX_QUEUED,
+                 max_finished: int = MAX_FINISHED, builder_factory=TauriBuilder):
+        self.max_queued = max_queued
+        self.max_finished = max_finished
+        self.builder_factory = builder_factory
+        self.jobs: Dict[str, Job] = {}
+        self._inflight: Dict[str, Job] = {}
+        self._finished = deque()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='tauridock-job')
+
+    def submit(self, payload: Dict) -> Tuple[Job, bool]:
+        """Queue a build, returning the job and whether it was newly created"""
+        config = build_config(payload)
+        key = hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+        with self._lock:
+            job = self._inflight.get(key)
+            if job is not None:
+                return job, False
+            if len(self._inflight) >= self.max_queued:
+                raise QueueFull(f"{len(self._inflight)} jobs already queued or running")
+
+            job = Job(key, payload)
+            self.jobs[job.id] = job
+            self._inflight[key] = job
+
+        self._executor.submit(self._run, job, config)
+        return job, True
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self.jobs.get(job_id)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            running = sum(1 for job in self._inflight.values() if job.status == 'running')
+            return {'running': running, 'queued': len(self._inflight) - running}
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, job: Job, config: BuildConfig):
+        job.status = 'running'
+        job.started = time.time()
+        builder = None
+        status = 'failed'
+        try:
+            builder = self.builder_factory(config, log_consumers=[job.log])
+            artifacts = builder.execute()
+            job.artifacts = {key: [str(path) for path in paths] for key, paths in artifacts.items()}
+            job.release_url = builder.release_url
+            status = 'succeeded'
+        except (Exception, SystemExit) as e:
+            # connect_docker() exits when the daemon is unreachable
+            job.error = str(e) or type(e).__name__
+            job.log(f"Build failed: {job.error}")
+        finally:
+            if builder is not None:
+                job.timings = dict(builder.timings)
+            with self._lock:
+                self._inflight.pop(job.key, None)
+                self._finished.append(job.id)
+                while len(self._finished) > self.max_finished:
+                    self.jobs.pop(self._finished.popleft(), None)
+            job.finish(status)
+
 
 app = Flask(__name__)
+jobs = JobQueue()
+
+metrics.describe('tauridock_api_queue_depth', 'gauge', 'Build jobs waiting for a worker')
+metrics.describe('tauridock_api_jobs_running', 'gauge', 'Build jobs being executed by the API')
+
+
+def _collect_queue_metrics():
+    stats = jobs.stats()
+    metrics.set('tauridock_api_queue_depth', stats['queued'])
+    metrics.set('tauridock_api_jobs_running', stats['running'])
+
+
+metrics.add_collector(_collect_queue_metrics)
+
 
 @app.route('/build', methods=['POST'])
 def build():
-    data = request.json
-    config = BuildConfig(**data)
-    builder = TauriBuilder(config)
-    result = builder.run()
-    return jsonify({"status": "success", "artifacts": result})
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({"error": "Expected a JSON object"}), 400
+
+    try:
+        job, created = jobs.submit(data)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except QueueFull as e:
+        return jsonify({"error": str(e)}), 503
+
+    return jsonify({
+        "job_id": job.id,
+        "status": job.status,
+        "merged": not created,
+        "links": {"self": f"/jobs/{job.id}", "logs": f"/jobs/{job.id}/logs"},
+    }), 202
+
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job"}), 404
+    return jsonify(job.to_dict())
+
+
+@app.route('/jobs/<job_id>/logs', methods=['GET'])
+def job_logs(job_id):
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job"}), 404
+
+    def stream():
+        cursor = 0
+        while True:
+            lines, cursor = job.wait_for_lines(cursor, timeout=SSE_KEEPALIVE)
+            for line in lines:
+                yield f"data: {line}\n\n"
+            if job.done and not lines:
+                yield f"event: end\ndata: {job.status}\n\n"
+                return
+            if not lines:
+                yield ": keepalive\n\n"
+
+    return Response(stream(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+
+@app.route('/metrics', methods=['GET'])
+def metrics_endpoint():
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
 
 @app.route('/status', methods=['GET'])
 def status():
-    return jsonify({"status": "healthy", "version": "1.0.0"})
+    return jsonify({"status": "healthy", "version": "1.0.0", "jobs": jobs.stats()})
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000)
\ No newline at end of file
+    app.run(host='0.0.0.0', port=5000, threaded=True)
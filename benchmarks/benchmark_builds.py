@@ -1,23 +1,441 @@
 # benchmarks/benchmark_builds.py
+"""
+Phase-level benchmarks for tauridock
+
+    python benchmarks/benchmark_builds.py run --mocked --artifact-size 2 -o current.json
+    python benchmarks/benchmark_builds.py run --dockerfile Dockerfile --platforms linux -o current.json
+    python benchmarks/benchmark_builds.py compare baseline.json current.json
+
+Every run records the timings collected by TauriBuilder (image build,
+container phases, collection, cache store/restore, upload) for four
+scenarios, sharing a fresh workspace per repetition:
+
+    cold    empty build cache, Docker layer cache disabled
+    warm    Docker layer cache primed by the cold run, build cache disabled
+    cached  build cache primed by the cold run
+    upload  cached build published to a local fake of the GitHub API
+
+The mocked mode replaces Docker with a fake that streams
+synthetic cargo output and writes synthetic artifacts, measuring only the
+orchestrator's own overhead. Without --dockerfile it uses a one-line
+Dockerfile in the workspace.
+"""
+
+import os
+import sys
+import json
 import time
+import shutil
+import logging
+import platform
+import tempfile
+import threading
 import subprocess
-from statistics import mean, stdev
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from pathlib import Path
+from statistics import mean, median, stdev
+from contextlib import ExitStack
+from typing import Callable, Dict, List, Optional
+from unittest.mock import patch
+
+import click
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import tauridock
+from tauridock import BuildConfig, TauriBuilder, PlatformBuilder
+
+MIB = 1024 ** 2
+GIB = 1024 ** 3
+SCENARIOS = {
+    'cold': {'docker_cache': False, 'build_cache': True},
+    'warm': {'docker_cache': True, 'build_cache': False},
+    'cached': {'docker_cache': True, 'build_cache': True},
+    'upload': {'docker_cache': True, 'build_cache': True, 'mode': 'publish'},
+}
+BENCHMARK_REPO = 'tauridock/benchmark'
+
+
+class FakeDockerManager:
+    """DockerManager stand-in that 'builds' by writing synthetic output"""
+
+    def __init__(self, config: BuildConfig, artifact_size: int, log_lines: int):
+        self.config = config
+        self.artifact_size = artifact_size
+        self.log_lines = log_lines
+        self.pool = None
+        self.remote = False
+        self.toolchains = {}
+
+    def build_image(self, platform: str, arch: str) -> str:
+        return f"tauridock-benchmark:{platform}-{arch}"
+
+    def run_container(self, image: str, command: str, volumes: Dict, ports: Dict = None,
+                      environment: Dict = None, log: tauridock.BuildLog = None):
+        platform, arch = image.rsplit(':', 1)[1].split('-')
+        with log:
+            log.feed(b"info: component 'rust-std' is up to date\n")
+            for i in range(self.log_lines):
+                log.feed(f"   Compiling crate-{i} v0.1.{i % 100}\n".encode())
+            log.feed(b"    Finished release [optimized] target(s) in 0.00s\n")
+
+            bundle_types = self.config.bundle_types[platform]
+            per_file = self.artifact_size // len(bundle_types)
+            for bundle_type in bundle_types:
+                log.feed(f"    Bundling app.{bundle_type}\n".encode())
+                bundle_dir = Path('target') / f'{platform}-{arch}' / 'release' / 'bundle' / bundle_type
+                bundle_dir.mkdir(parents=True, exist_ok=True)
+                write_synthetic_file(bundle_dir / f'app-{arch}.{bundle_type}', per_file)
+
+            return 0, log.get_tail()
+
+    def close(self):
+        pass
+
+
+class FakeGitHub(ThreadingHTTPServer):
+    """Local stand-in for the GitHub releases API, discarding uploaded data
+
+    Serves the endpoints used by GitHubPublisher (through PyGithub) and
+    ReleaseUploader, so the upload phase is measured without the network.
+    """
+
+    daemon_threads = True
+    MAX_KEPT = MIB
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), FakeGitHubHandler)
+        self.url = f"http://127.0.0.1:{self.server_address[1]}"
+        self.releases: Dict[int, Dict] = {}
+        self.assets: Dict[int, Dict] = {}
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
+
+
+class FakeGitHubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server: FakeGitHub
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        repo = f"/repos/{BENCHMARK_REPO}"
+        if path == repo:
+            return self._json(200, {'id': 1, 'name': BENCHMARK_REPO.split('/')[1], 'full_name': BENCHMARK_REPO,
+                                    'url': self.server.url + repo})
+        if path.startswith(f"{repo}/releases/tags/"):
+            tag = path.rsplit('/', 1)[1]
+            for release in self.server.releases.values():
+                if release['tag_name'] == tag:
+                    return self._json(200, release)
+            return self._json(404, {'message': 'Not Found'})
+        if path.startswith(f"{repo}/releases/assets/"):
+            asset = self.server.assets.get(int(path.rsplit('/', 1)[1]))
+            if asset is None:
+                return self._json(404, {'message': 'Not Found'})
+            return self._send(200, asset['content'], 'application/octet-stream')
+        if path.startswith(f"{repo}/releases/") and path.endswith('/assets'):
+            release_id = int(path.split('/')[-2])
+            assets = [{key: value for key, value in asset.items() if key != 'content'}
+                      for asset in self.server.assets.values() if asset['release_id'] == release_id]
+            return self._json(200, assets)
+        self._json(404, {'message': 'Not Found'})
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        length = int(self.headers.get('Content-Length', 0))
+        if url.path == f"/repos/{BENCHMARK_REPO}/releases":
+            data = json.loads(self.rfile.read(length))
+            with self.server.lock:
+                release_id = len(self.server.releases) + 1
+                release = {
+                    'id': release_id,
+                    'tag_name': data['tag_name'],
+                    'name': data.get('name'),
+                    'body': data.get('body'),
+                    'draft': data.get('draft', False),
+                    'prerelease': data.get('prerelease', False),
+                    'url': f"{self.server.url}/repos/{BENCHMARK_REPO}/releases/{release_id}",
+                    'html_url': f"{self.server.url}/{BENCHMARK_REPO}/releases/tag/{data['tag_name']}",
+                    'upload_url': (f"{self.server.url}/uploads/repos/{BENCHMARK_REPO}/releases/"
+                                   f"{release_id}/assets{{?name,label}}"),
+                }
+                self.server.releases[release_id] = release
+            return self._json(201, release)
 
+        if url.path.startswith('/uploads/'):
+            content = self._drain(length)
+            name = parse_qs(url.query)['name'][0]
+            with self.server.lock:
+                asset_id = len(self.server.assets) + 1
+                self.server.assets[asset_id] = {
+                    'id': asset_id,
+                    'name': name,
+                    'size': length,
+                    'release_id': int(url.path.split('/')[-2]),
+                    'content': content,
+                }
+            return self._json(201, {'id': asset_id, 'name': name, 'size': length})
+        self._json(404, {'message': 'Not Found'})
+
+    def do_PATCH(self):
+        release_id = int(urlsplit(self.path).path.rsplit('/', 1)[1])
+        data = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+        release = self.server.releases[release_id]
+        release.update({key: value for key, value in data.items() if key in release})
+        self._json(200, release)
+
+    def do_DELETE(self):
+        asset_id = int(urlsplit(self.path).path.rsplit('/', 1)[1])
+        with self.server.lock:
+            found = self.server.assets.pop(asset_id, None)
+        self._send(204 if found else 404, b'')
+
+    def _drain(self, length: int) -> bytes:
+        """Read the request body, keeping it only if it is small (SHA256SUMS)"""
+        kept = []
+        remaining = length
+        while remaining > 0:
+            chunk = self.rfile.read(min(remaining, MIB))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            if length <= self.server.MAX_KEPT:
+                kept.append(chunk)
+        return b''.join(kept)
+
+    def _json(self, status: int, payload):
+        self._send(status, json.dumps(payload).encode('utf-8'), 'application/json')
+
+    def _send(self, status: int, body: bytes, content_type: str = 'application/json'):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def write_synthetic_file(path: Path, size: int):
+    """Write size bytes of incompressible data without generating all of it"""
+    block = os.urandom(MIB)
+    with open(path, 'wb') as f:
+        remaining = size
+        while remaining > 0:
+            f.write(block[:min(remaining, MIB)])
+            remaining -= MIB
+
+
+def make_config(workspace: Path, platforms: List[str], architectures: List[str],
+                dockerfile: Path, **overrides) -> BuildConfig:
+    values = dict(
+        dockerfile=dockerfile,
+        frontend_port=3003,
+        mode='build',
+        platforms=platforms,
+        architectures=architectures,
+        app_name='benchmark',
+        version='0.0.0',
+        output_dir=workspace / 'dist',
+        optimize=True,
+        sign=False,
+        bundle_types={p: PlatformBuilder.PLATFORM_CONFIG[p]['bundle_types'] for p in platforms},
+        docker_image='rust:latest',
+        docker_cache=True,
+        cache_dir=workspace / '.tauri-cache',
+        docker_gc=False,
+    )
+    values.update(overrides)
+    return BuildConfig(**values)
+
+
+def run_once(config: BuildConfig, docker_manager_factory: Optional[Callable] = None) -> Dict[str, float]:
+    """Run one build in-process and return its phase timings
+
+    Publishing runs against a FakeGitHub started for the run.
+    """
+    with ExitStack() as stack:
+        if docker_manager_factory:
+            stack.enter_context(patch.object(tauridock, 'DockerManager', docker_manager_factory))
+        if config.mode == 'publish':
+            import github
+
+            server = stack.enter_context(FakeGitHub())
+            config.github_api_url = server.url
+            stack.enter_context(patch.object(github, 'Github', partial(github.Github, base_url=server.url)))
+        builder = TauriBuilder(config)
+        stack.enter_context(patch.object(builder, '_display_results'))
+        builder.execute()
+    return dict(builder.timings)
+
+
+def summarize(samples: List[Dict[str, float]]) -> Dict[str, Dict]:
+    phases = sorted({phase for sample in samples for phase in sample})
+    summary = {}
+    for phase in phases:
+        values = [sample[phase] for sample in samples if phase in sample]
+        summary[phase] = {
+            'mean': mean(values),
+            'median': median(values),
+            'stdev': stdev(values) if len(values) > 1 else 0.0,
+            'min': min(values),
+            'runs': values,
+        }
+    return summary
+
+
+def environment_info() -> Dict[str, str]:
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ''
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'system': platform.system(),
+        'cpus': os.cpu_count(),
+    }
+
+
+@click.group()
+def cli():
+    """Benchmark tauridock build phases"""
+
+
+@cli.command()
+@click.option('--mocked', is_flag=True, help='Replace Docker with a fake to measure orchestrator overhead')
+@click.option('--dockerfile', type=click.Path(exists=True, dir_okay=False),
+              help='Dockerfile to build (default: the project\'s Dockerfile, a stub when mocked)')
+@click.option('--project', type=click.Path(exists=True, file_okay=False),
+              help='Tauri project to build (real mode, defaults to the current directory)')
+@click.option('--platforms', default='linux', help='Target platforms (comma-separated)')
+@click.option('--arch', 'architectures', default='x64', help='Target architectures (comma-separated)')
+@click.option('--runs', type=int, default=3, help='Runs per scenario')
+@click.option('--scenario', 'scenarios', type=click.Choice(list(SCENARIOS)), multiple=True,
+              help='Scenarios to run (default: all)')
+@click.option('--artifact-size', type=float, default=1.0,
+              help='Synthetic artifact size per target in GiB (mocked mode)')
+@click.option('--log-lines', type=int, default=20000,
+              help='Synthetic build log lines per target (mocked mode)')
+@click.option('-o', '--output', type=click.Path(dir_okay=False), default='benchmark-results.json',
+              help='Where to write the JSON results')
+def run(mocked, dockerfile, project, platforms, architectures, runs, scenarios, artifact_size,
+        log_lines, output):
+    """Run the cache scenarios and write JSON results"""
+    logging.getLogger('tauridock').setLevel(logging.WARNING)
+    scenarios = scenarios or SCENARIOS
+    platforms = platforms.split(',')
+    architectures = architectures.split(',')
+    project = Path(project).resolve() if project else Path.cwd()
+    if dockerfile:
+        dockerfile = Path(dockerfile).resolve()
+    elif not mocked:
+        dockerfile = project / 'Dockerfile'
+        if not dockerfile.is_file():
+            raise click.UsageError(f"No Dockerfile in {project}, pass --dockerfile")
+    size = int(artifact_size * GIB)
+    factory = None
+    if mocked:
+        def factory(config):
+            return FakeDockerManager(config, size, log_lines)
+
+    samples = {scenario: [] for scenario in scenarios}
+    original_cwd = Path.cwd()
 
-def benchmark_build(platform, runs=5):
-    times = []
     for i in range(runs):
-        start = time.time()
-        subprocess.run([
-            "python", "tauridock.py",
-            "--mode", "build",
-            "--platforms", platform
-        ])
-        times.append(time.time() - start)
+        workspace = Path(tempfile.mkdtemp(prefix='tauridock-bench-'))
+        try:
+            os.chdir(workspace if mocked else project)
+            run_dockerfile = dockerfile
+            if run_dockerfile is None:
+                run_dockerfile = workspace / 'Dockerfile'
+                run_dockerfile.write_text('FROM rust:latest\n')
+            # The cold run always happens, it primes the caches for the others
+            for scenario, options in SCENARIOS.items():
+                if scenario != 'cold' and scenario not in samples:
+                    continue
+                config = make_config(workspace, platforms, architectures, run_dockerfile,
+                                     cache_volumes=not mocked, github_token='benchmark',
+                                     github_repo=BENCHMARK_REPO, release_tag=f'v0.0.{i}', **options)
+                start = time.perf_counter()
+                timings = run_once(config, factory)
+                if scenario in samples:
+                    samples[scenario].append(timings)
+                    click.echo(f"run {i + 1}/{runs} {scenario}: {time.perf_counter() - start:.2f}s")
+        finally:
+            os.chdir(original_cwd)
+            shutil.rmtree(workspace, ignore_errors=True)
+
+    results = {
+        'environment': environment_info(),
+        'parameters': {
+            'mode': 'mocked' if mocked else 'docker',
+            'platforms': platforms,
+            'architectures': architectures,
+            'runs': runs,
+            'artifact_size': size if mocked else None,
+            'log_lines': log_lines if mocked else None,
+        },
+        'scenarios': {scenario: summarize(values) for scenario, values in samples.items()},
+    }
+    Path(output).write_text(json.dumps(results, indent=2))
+
+    for scenario, phases in results['scenarios'].items():
+        click.echo(f"\n{scenario}")
+        for phase, stats in phases.items():
+            click.echo(f"  {phase:<32} {stats['median']:8.3f}s ± {stats['stdev']:.3f}s")
+    click.echo(f"\nResults written to {output}")
+
+
+@cli.command()
+@click.argument('baseline', type=click.Path(exists=True, dir_okay=False))
+@click.argument('current', type=click.Path(exists=True, dir_okay=False))
+@click.option('--threshold', type=float, default=0.10,
+              help='Relative slowdown that counts as a regression (0.10 = 10%)')
+@click.option('--min-delta', type=float, default=0.05,
+              help='Ignore slowdowns smaller than this many seconds')
+def compare(baseline, current, threshold, min_delta):
+    """Compare results against a baseline, exiting 1 on regressions"""
+    before = json.loads(Path(baseline).read_text())['scenarios']
+    after = json.loads(Path(current).read_text())['scenarios']
+    regressions = []
+
+    for scenario in sorted(set(before) & set(after)):
+        click.echo(scenario)
+        for phase in sorted(set(before[scenario]) | set(after[scenario])):
+            old = before[scenario].get(phase, {}).get('median')
+            new = after[scenario].get(phase, {}).get('median')
+            if old is None or new is None:
+                click.echo(f"  {phase:<32} {'only in ' + ('current' if old is None else 'baseline')}")
+                continue
+
+            delta = new - old
+            change = delta / old if old else 0.0
+            flag = ''
+            if delta > min_delta and change > threshold:
+                flag = '  REGRESSION'
+                regressions.append(f"{scenario}/{phase}")
+            click.echo(f"  {phase:<32} {old:8.3f}s -> {new:8.3f}s ({change:+.1%}){flag}")
 
-    print(f"{platform}: {mean(times):.2f}s ± {stdev(times):.2f}s")
+    if regressions:
+        click.echo(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+        sys.exit(1)
+    click.echo("\nNo regressions")
 
 
 if __name__ == "__main__":
-    for platform in ["windows", "linux", "macos"]:
-        benchmark_build(platform)
\ No newline at end of file
+    cli()
@@ -70,6 +70,12 @@ setup(
             "mypy>=1.7.1",
             "isort>=5.13.2",
         ],
+        "watch": [
+            "watchdog>=3.0.0",
+        ],
+        "delta": [
+            "bsdiff4>=1.2.4",
+        ],
         "notifications": [
             "discord-webhook>=1.3.0",
             "slack-sdk>=3.26.1",
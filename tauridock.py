@@ -8,24 +8,45 @@ import sys
 import json
 import time
 import shutil
+import re
+import shlex
+import gzip
 import hashlib
+import io
+import tarfile
+import threading
 import subprocess
-from pathlib import Path
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path, PurePosixPath
+from contextlib import contextmanager
+from typing import List, Dict, Optional, Tuple, Callable, Iterable, Set
+from collections import deque
+from functools import partial
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
 
+import importlib
 import click
-import docker
-import yaml
-import requests
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich.table import Table
-from rich.panel import Panel
 from rich.logging import RichHandler
 import logging
-from github import Github, GithubException
+
+
+class _LazyModule:
+    """Stand-in that imports a module on first attribute access
+
+    Keeps heavy dependencies off the import path of code that never uses
+    them; names used in a single place are imported where they are used.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __getattr__(self, attr):
+        return getattr(importlib.import_module(self._name), attr)
+
+
+docker = _LazyModule('docker')
+requests = _LazyModule('requests')
 
 # Setup logging with rich
 console = Console()
@@ -36,106 +57,1971 @@ logging.basicConfig(
 )
 logger = logging.getLogger("tauridock")
 
+# Directories that never contribute to build inputs
+EXCLUDED_DIRS = {'.git', 'target', 'node_modules', 'dist', '__pycache__'}
+
+
+@contextmanager
+def timed(timings: Dict[str, float], name: str):
+    """Record the wall-clock duration of the block in timings[name]"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = time.perf_counter() - start
+
+
+class Span:
+    """A timed operation with attributes, part of a trace tree"""
+
+    def __init__(self, tracer: 'Tracer', name: str, parent: Optional['Span'],
+                 attributes: Dict):
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = parent.trace_id if parent else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = attributes
+        self.thread = threading.current_thread().name
+        self.start = time.perf_counter_ns()
+        self.end: Optional[int] = None
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value):
+        self.attributes[key] = value
+
+    def __enter__(self):
+        self.tracer._push(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_val is not None:
+            self.error = str(exc_val) or exc_type.__name__
+        self.tracer._pop(self)
+        self.tracer.finish(self)
+        return False
+
+
+class _NoopSpan:
+    """Span returned while tracing is disabled"""
+
+    def set_attribute(self, key: str, value):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Tracer:
+    """Collects nested spans and exports them as Chrome or OTLP JSON
+
+    Disabled tracers hand out a shared no-op span, so instrumentation costs a
+    single attribute check. Spans nest per thread; use bind() to carry the
+    current span into work submitted to a thread pool.
+
+    Builds that want a trace bracket their work with start() and stop(), so
+    a long-lived process (the API) only records spans while one is traced.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.spans: List[Span] = []
+        self._sessions = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # perf_counter is monotonic, this anchors it to wall-clock time
+        self._epoch_offset = time.time_ns() - time.perf_counter_ns()
+
+    def span(self, name: str, parent: Optional[Span] = None, **attributes):
+        if not self.enabled:
+            return NOOP_SPAN
+        return Span(self, name, parent or self.current(), attributes)
+
+    def record(self, name: str, start: float, end: float, parent: Optional[Span] = None, **attributes):
+        """Add a finished span from perf_counter() timestamps"""
+        if not self.enabled:
+            return
+        span = Span(self, name, parent or self.current(), attributes)
+        span.start, span.end = int(start * 1e9), int(end * 1e9)
+        with self._lock:
+            self.spans.append(span)
+
+    def current(self) -> Optional[Span]:
+        stack = getattr(self._local, 'stack', None)
+        return stack[-1] if stack else None
+
+    def bind(self, fn: Callable) -> Callable:
+        """Wrap fn so that spans it opens on another thread nest under the current span"""
+        parent = self.current()
+        if not self.enabled or parent is None:
+            return fn
+
+        def bound(*args, **kwargs):
+            self._push(parent)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._pop(parent)
+
+        return bound
+
+    def finish(self, span: Span):
+        span.end = time.perf_counter_ns()
+        with self._lock:
+            self.spans.append(span)
+
+    def start(self):
+        """Enable tracing for a traced build"""
+        with self._lock:
+            self._sessions += 1
+            self.enabled = True
+
+    def stop(self):
+        """End a traced build, disabling and clearing the tracer after the last one"""
+        with self._lock:
+            self._sessions = max(0, self._sessions - 1)
+            if not self._sessions:
+                self.enabled = False
+                self.spans = []
+
+    def export(self, path: Path, fmt: str = 'chrome', trace_id: Optional[str] = None):
+        """Write finished spans to path as 'chrome' trace events or 'otlp' JSON
+
+        With a trace_id, only that trace's spans are written and then
+        dropped, leaving concurrent builds' spans alone.
+        """
+        with self._lock:
+            if trace_id is None:
+                spans = list(self.spans)
+            else:
+                spans = [span for span in self.spans if span.trace_id == trace_id]
+                self.spans = [span for span in self.spans if span.trace_id != trace_id]
+        data = self._to_otlp(spans) if fmt == 'otlp' else self._to_chrome(spans)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data))
+        logger.info(f"🔎 Trace with {len(spans)} spans written to {path}")
+
+    def _push(self, span: Span):
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        self._local.stack.append(span)
+
+    def _pop(self, span: Span):
+        stack = self._local.stack
+        if stack and stack[-1] is span:
+            stack.pop()
+
+    def _to_chrome(self, spans: List[Span]) -> Dict:
+        threads = {}
+        events = []
+        for span in sorted(spans, key=lambda s: s.start):
+            tid = threads.setdefault(span.thread, len(threads) + 1)
+            args = dict(span.attributes)
+            if span.error:
+                args['error'] = span.error
+            events.append({
+                'name': span.name,
+                'cat': 'tauridock',
+                'ph': 'X',
+                'ts': (span.start + self._epoch_offset) / 1000,
+                'dur': (span.end - span.start) / 1000,
+                'pid': os.getpid(),
+                'tid': tid,
+                'args': args,
+            })
+        for thread, tid in threads.items():
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(), 'tid': tid,
+                           'args': {'name': thread}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def _to_otlp(self, finished: List[Span]) -> Dict:
+        spans = []
+        for span in finished:
+            otlp_span = {
+                'traceId': span.trace_id,
+                'spanId': span.span_id,
+                'name': span.name,
+                'kind': 1,
+                'startTimeUnixNano': str(span.start + self._epoch_offset),
+                'endTimeUnixNano': str(span.end + self._epoch_offset),
+                'attributes': [self._otlp_attribute(k, v) for k, v in span.attributes.items()],
+                'status': {'code': 2, 'message': span.error} if span.error else {'code': 1},
+            }
+            if span.parent_id:
+                otlp_span['parentSpanId'] = span.parent_id
+            spans.append(otlp_span)
+
+        return {'resourceSpans': [{
+            'resource': {'attributes': [self._otlp_attribute('service.name', 'tauridock')]},
+            'scopeSpans': [{'scope': {'name': 'tauridock'}, 'spans': spans}],
+        }]}
+
+    @staticmethod
+    def _otlp_attribute(key: str, value) -> Dict:
+        if isinstance(value, bool):
+            typed = {'boolValue': value}
+        elif isinstance(value, int):
+            typed = {'intValue': str(value)}
+        elif isinstance(value, float):
+            typed = {'doubleValue': value}
+        else:
+            typed = {'stringValue': str(value)}
+        return {'key': key, 'value': typed}
+
+
+tracer = Tracer()
+
+
+class Metrics:
+    """Process-wide counters, gauges and histograms in Prometheus text format
+
+    Values are kept in plain dicts keyed by label sets; instrumentation costs
+    a lock and a dict update, so it stays on even outside the API service.
+    """
+
+    DURATION_BUCKETS = (0.1, 0.5, 1, 5, 10, 30, 60, 120, 300, 600, 1200, 1800, 3600)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._meta: Dict[str, Tuple[str, str]] = {}
+        self._values: Dict[str, Dict[Tuple, float]] = {}
+        self._histograms: Dict[str, Dict[Tuple, List]] = {}
+        self._collectors: List[Callable[[], None]] = []
+
+    def describe(self, name: str, kind: str, help_text: str):
+        """Register a metric of kind 'counter', 'gauge' or 'histogram'"""
+        self._meta[name] = (kind, help_text)
+        if kind == 'histogram':
+            self._histograms.setdefault(name, {})
+        else:
+            self._values.setdefault(name, {})
+
+    def add_collector(self, collector: Callable[[], None]):
+        """Run collector before each render, to refresh gauges computed on demand"""
+        self._collectors.append(collector)
+
+    def inc(self, name: str, value: float = 1.0, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._values[name]
+            series[key] = series.get(key, 0.0) + value
+
+    def set(self, name: str, value: float, **labels):
+        with self._lock:
+            self._values[name][tuple(sorted(labels.items()))] = value
+
+    def observe(self, name: str, value: float, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._histograms[name]
+            if key not in series:
+                # Per-bucket counts, then sum and count
+                series[key] = [0] * len(self.DURATION_BUCKETS) + [0.0, 0]
+            state = series[key]
+            for i, bound in enumerate(self.DURATION_BUCKETS):
+                if value <= bound:
+                    state[i] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def get(self, name: str, **labels) -> float:
+        return self._values[name].get(tuple(sorted(labels.items())), 0.0)
+
+    def render(self) -> str:
+        for collector in self._collectors:
+            collector()
+
+        lines = []
+        with self._lock:
+            for name, (kind, help_text) in self._meta.items():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                if kind != 'histogram':
+                    for key, value in self._values[name].items():
+                        lines.append(f"{name}{self._format_labels(key)} {value:g}")
+                    continue
+
+                for key, state in self._histograms[name].items():
+                    for bound, count in zip(self.DURATION_BUCKETS, state):
+                        lines.append(f"{name}_bucket{self._format_labels(key + (('le', f'{bound:g}'),))} {count}")
+                    lines.append(f"{name}_bucket{self._format_labels(key + (('le', '+Inf'),))} {state[-1]}")
+                    lines.append(f"{name}_sum{self._format_labels(key)} {state[-2]:g}")
+                    lines.append(f"{name}_count{self._format_labels(key)} {state[-1]}")
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _format_labels(key: Tuple) -> str:
+        if not key:
+            return ''
+        pairs = []
+        for name, value in key:
+            value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+            pairs.append(f'{name}="{value}"')
+        return '{' + ','.join(pairs) + '}'
+
+
+def _collect_process_metrics():
+    try:
+        with open('/proc/self/statm') as f:
+            rss = int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        import resource
+        # Peak rather than current RSS, in KiB on Linux and bytes on macOS
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform != 'darwin':
+            rss *= 1024
+    metrics.set('process_resident_memory_bytes', rss)
+
+
+metrics = Metrics()
+metrics.describe('tauridock_builds_active', 'gauge', 'Builds currently executing')
+metrics.describe('tauridock_builds_total', 'counter', 'Finished builds by mode and status')
+metrics.describe('tauridock_phase_duration_seconds', 'histogram', 'Duration of build phases')
+metrics.describe('tauridock_cache_requests_total', 'counter',
+                 'Cache lookups by cache (image, dependencies, frontend, artifacts) and result')
+metrics.describe('tauridock_uploaded_bytes_total', 'counter', 'Bytes uploaded to GitHub releases')
+metrics.describe('tauridock_container_failures_total', 'counter', 'Build containers that failed')
+metrics.describe('tauridock_host_builds_active', 'gauge', 'Targets currently building on each Docker host')
+metrics.describe('tauridock_transferred_bytes_total', 'counter',
+                 'Bytes copied into (upload) and out of (download) remote build containers')
+metrics.describe('process_resident_memory_bytes', 'gauge', 'Resident memory of the orchestrator')
+metrics.add_collector(_collect_process_metrics)
+
+
+def file_digest(file_path: Path) -> str:
+    """Calculate SHA256 digest of a file"""
+    sha256 = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+class FileDigests:
+    """File SHA256 digests memoized by (size, mtime_ns)
+
+    One instance is shared by everything that hashes the project tree in an
+    invocation, so each file is read once.
+    """
+
+    def __init__(self):
+        self._digests: Dict[str, Tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: Path) -> str:
+        stat = path.stat()
+        with self._lock:
+            cached = self._digests.get(str(path))
+        if cached and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+            return cached[2]
+        digest = file_digest(path)
+        self.add(path, stat.st_size, stat.st_mtime_ns, digest)
+        return digest
+
+    def add(self, path: Path, size: int, mtime_ns: int, digest: str):
+        """Record a digest computed elsewhere for the file at the given stat"""
+        with self._lock:
+            self._digests[str(path)] = (size, mtime_ns, digest)
+
+
+def tree_digest(root: Path, excluded_paths: Tuple[Path, ...] = (),
+                digests: Optional[FileDigests] = None) -> str:
+    """Hash relative paths and contents of all files below root"""
+    root = root.resolve()
+    excluded = {p.resolve() for p in excluded_paths}
+    sha256 = hashlib.sha256()
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        current = Path(dirpath)
+        dirnames[:] = sorted(
+            d for d in dirnames
+            if d not in EXCLUDED_DIRS and (current / d).resolve() not in excluded
+        )
+        for name in sorted(filenames):
+            file = current / name
+            if not file.is_file():
+                continue
+            sha256.update(file.relative_to(root).as_posix().encode('utf-8'))
+            sha256.update(b'\0')
+            sha256.update((digests.get(file) if digests else file_digest(file)).encode('ascii'))
+
+    return sha256.hexdigest()
+
 
 @dataclass
 class BuildConfig:
-    """Configuration for build process"""
+    """Configuration for build process
+
+    Defaults match the CLI options; REST API requests rely on them.
+    """
     dockerfile: Path
-    frontend_port: int
-    mode: str
-    platforms: List[str]
-    architectures: List[str]
-    app_name: str
-    version: str
-    output_dir: Path
-    optimize: bool
-    sign: bool
-    bundle_types: Dict[str, List[str]]
-    docker_image: str
-    docker_cache: bool
+    frontend_port: int = 3003
+    mode: str = 'build'
+    platforms: List[str] = field(default_factory=lambda: ['windows', 'macos', 'linux'])
+    architectures: List[str] = field(default_factory=lambda: ['x64'])
+    app_name: str = 'TauriApp'
+    version: str = '1.0.0'
+    output_dir: Path = Path('dist')
+    optimize: bool = False
+    sign: bool = False
+    bundle_types: Dict[str, List[str]] = field(default_factory=dict)
+    docker_image: str = 'rust:latest'
+    docker_cache: bool = True
     github_token: Optional[str] = None
     github_repo: Optional[str] = None
     release_tag: Optional[str] = None
     release_notes: Optional[str] = None
     draft: bool = False
     prerelease: bool = False
+    build_cache: bool = True
+    cache_dir: Path = Path('.tauri-cache')
+    github_api_url: str = 'https://api.github.com'
+    upload_concurrency: int = 4
+    upload_retries: int = 3
+    blake3: bool = False
+    max_parallel_jobs: Optional[int] = None
+    memory_budget: Optional[int] = None
+    priorities: Dict[str, int] = field(default_factory=dict)
+    cache_volumes: bool = True
+    sccache: bool = False
+    shared_frontend: bool = True
+    merge_architectures: bool = False
+    pipeline_publish: bool = False
+    artifact_store: bool = True
+    keep_versions: Optional[int] = 5
+    store_budget: Optional[int] = None
+    docker_gc: bool = True
+    docker_budget: Optional[int] = None
+    deltas: bool = False
+    update_url: Optional[str] = None
+    warm_pool: bool = False
+    pool_size: int = 4
+    pool_idle_timeout: int = 600
+    layer_cache: Optional[Path] = None
+    docker_hosts: List[Dict] = field(default_factory=list)
+    watch: bool = False
+    trace_file: Optional[Path] = None
+    trace_format: str = 'chrome'
+
+
+@dataclass
+class ArtifactRecord:
+    """Collected artifact with its size, digests and modification time"""
+    path: Path
+    size: int
+    sha256: str
+    mtime: float
+    blake3: Optional[str] = None
+
+
+class ArtifactManifest:
+    """Thread-safe record of collected artifacts, reused by publishing and display"""
+
+    def __init__(self):
+        self._records: Dict[Path, ArtifactRecord] = {}
+        self._lock = threading.Lock()
+
+    def add(self, record: ArtifactRecord):
+        with self._lock:
+            self._records[Path(record.path)] = record
+
+    def get(self, path: Path, verify: bool = True) -> Optional[ArtifactRecord]:
+        """Return the record for path unless the file changed since it was recorded"""
+        with self._lock:
+            record = self._records.get(Path(path))
+        if record is None or not verify:
+            return record
+
+        stat = Path(path).stat()
+        if stat.st_size != record.size or stat.st_mtime != record.mtime:
+            return None
+        return record
+
+    def save(self, manifest_path: Path):
+        """Write the manifest as JSON, with paths relative to its directory"""
+        with self._lock:
+            records = sorted(self._records.values(), key=lambda r: str(r.path))
+
+        entries = []
+        for record in records:
+            entry = dict(record.__dict__)
+            entry['path'] = os.path.relpath(record.path, manifest_path.parent)
+            entries.append(entry)
+
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        manifest_path.write_text(json.dumps({'artifacts': entries}, indent=2))
+
+
+# Linux ioctl cloning a file's extents (reflink) on filesystems that support it
+FICLONE = 0x40049409
+COPY_BUFFER_SIZE = 4 * 1024 * 1024
+
+
+def collect_file(source: Path, dest: Path, with_blake3: bool = False,
+                 hardlink: bool = True) -> ArtifactRecord:
+    """Place source at dest, hashing it in the same pass
+
+    Tries a hardlink (unless dest must not share the source's inode), then
+    a reflink, and falls back to a large-buffer copy that feeds the hashers
+    as it writes, so the data is read only once.
+    """
+    hashers = [hashlib.sha256()]
+    if with_blake3:
+        try:
+            import blake3
+            hashers.append(blake3.blake3())
+        except ImportError:
+            logger.warning("blake3 is not installed, skipping BLAKE3 digests")
+            with_blake3 = False
+
+    dest.unlink(missing_ok=True)
+
+    with tracer.span('artifact copy', file=source.name) as span:
+        linked = _link_file(source, dest, hardlink=hardlink)
+        span.set_attribute('linked', linked)
+        if not linked:
+            with open(source, 'rb') as src, open(dest, 'wb') as dst:
+                buffer = bytearray(COPY_BUFFER_SIZE)
+                view = memoryview(buffer)
+                while True:
+                    read = src.readinto(buffer)
+                    if not read:
+                        break
+                    for hasher in hashers:
+                        hasher.update(view[:read])
+                    dst.write(view[:read])
+            shutil.copystat(source, dest)
+        else:
+            with tracer.span('hash', file=source.name):
+                with open(dest, 'rb') as f:
+                    for chunk in iter(lambda: f.read(COPY_BUFFER_SIZE), b''):
+                        for hasher in hashers:
+                            hasher.update(chunk)
+
+        stat = dest.stat()
+        span.set_attribute('bytes', stat.st_size)
+    return ArtifactRecord(
+        path=dest,
+        size=stat.st_size,
+        sha256=hashers[0].hexdigest(),
+        mtime=stat.st_mtime,
+        blake3=hashers[1].hexdigest() if with_blake3 else None
+    )
+
+
+def _link_file(source: Path, dest: Path, hardlink: bool = True) -> bool:
+    """Hardlink or reflink source to dest without copying data"""
+    if hardlink:
+        try:
+            os.link(source, dest)
+            return True
+        except OSError:
+            pass
+
+    try:
+        import fcntl
+        with open(source, 'rb') as src, open(dest, 'wb') as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        shutil.copystat(source, dest)
+        return True
+    except (ImportError, OSError):
+        dest.unlink(missing_ok=True)
+        return False
+
+
+class BuildLog:
+    """Single-pass container log pipeline with bounded memory
+
+    Raw output chunks are split into lines, written to an optional gzip file,
+    kept in a fixed-size ring buffer and handed to pluggable line consumers.
+    """
+
+    # Longest partial line buffered while waiting for a newline
+    MAX_LINE_BYTES = 64 * 1024
+
+    def __init__(self, path: Optional[Path] = None, tail_lines: int = 200,
+                 consumers: Optional[List[Callable[[str], None]]] = None):
+        self.path = path
+        self.tail = deque(maxlen=tail_lines)
+        self.consumers = list(consumers or [])
+        self.line_count = 0
+        self._pending = b''
+        self._file = None
+
+        if path:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = gzip.open(path, 'wt', encoding='utf-8')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def feed(self, chunk: bytes):
+        """Consume a raw output chunk, emitting every completed line"""
+        *lines, self._pending = (self._pending + chunk).split(b'\n')
+        for raw in lines:
+            self._emit(raw)
+
+        if len(self._pending) > self.MAX_LINE_BYTES:
+            self._emit(self._pending)
+            self._pending = b''
+
+    def close(self):
+        """Flush the trailing partial line and close the log file"""
+        if self._pending:
+            self._emit(self._pending)
+            self._pending = b''
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def get_tail(self) -> str:
+        """Return the last buffered lines"""
+        return '\n'.join(self.tail)
+
+    def _emit(self, raw: bytes):
+        line = raw.decode('utf-8', errors='replace').rstrip('\r')
+        self.line_count += 1
+        self.tail.append(line)
+
+        if self._file:
+            self._file.write(line + '\n')
+
+        for consumer in self.consumers:
+            consumer(line)
+
+
+class ErrorPatternMatcher:
+    """Log line consumer collecting lines that look like build errors"""
+
+    DEFAULT_PATTERNS = [
+        r'^error(\[E\d+\])?:',
+        r'^npm ERR!',
+        r'panicked at',
+        r'^\s*(Error|ERROR)\b',
+    ]
+
+    def __init__(self, patterns: Optional[List[str]] = None, max_matches: int = 50):
+        self.patterns = [re.compile(p) for p in (patterns or self.DEFAULT_PATTERNS)]
+        self.matches = deque(maxlen=max_matches)
+
+    def __call__(self, line: str):
+        if any(p.search(line) for p in self.patterns):
+            self.matches.append(line)
+
+
+class BuildProgressParser:
+    """Log line consumer tracking the current build phase"""
+
+    PHASE_PATTERNS = [
+        ('npm install', re.compile(r'^(added|up to date|removed) .*packages?')),
+        ('frontend build', re.compile(r'^> .* build')),
+        ('cargo compile', re.compile(r'^\s*Compiling ')),
+        ('bundle', re.compile(r'^\s*(Bundling|Finished \d+ bundles?)')),
+    ]
+
+    def __init__(self, on_phase: Optional[Callable[[str], None]] = None):
+        self.phase = None
+        self.crates_compiled = 0
+        self.crates_downloaded = 0
+        self.on_phase = on_phase
+        self.durations: Dict[str, float] = {}
+        self.intervals: List[Tuple[str, float, float]] = []
+        self._phase_started = time.perf_counter()
+
+    def __call__(self, line: str):
+        stripped = line.lstrip()
+        if stripped.startswith('Compiling '):
+            self.crates_compiled += 1
+        elif stripped.startswith('Downloaded '):
+            self.crates_downloaded += 1
+
+        for phase, pattern in self.PHASE_PATTERNS:
+            if phase != self.phase and pattern.search(line):
+                self._end_phase()
+                self.phase = phase
+                if self.on_phase:
+                    self.on_phase(phase)
+                break
+
+    def finish(self) -> Dict[str, float]:
+        """Close the current phase and return the time spent in each
+
+        Output before the first recognised line is accounted as 'setup'.
+        """
+        self._end_phase()
+        return self.durations
+
+    def _end_phase(self):
+        now = time.perf_counter()
+        name = self.phase or 'setup'
+        self.durations[name] = self.durations.get(name, 0.0) + now - self._phase_started
+        self.intervals.append((name, self._phase_started, now))
+        self._phase_started = now
+
+
+def connect_docker():
+    """Connect to the Docker daemon from the environment, exiting if unreachable"""
+    try:
+        client = docker.from_env()
+        client.ping()
+        return client
+    except docker.errors.DockerException as e:
+        logger.error(f"Docker is not running or not accessible: {e}")
+        sys.exit(1)
+
+
+class CacheVolumeManager:
+    """Manages named Docker volumes that persist build caches between runs"""
+
+    CACHE_LABEL = 'tauridock.cache'
+    CARGO_HOME = '/usr/local/cargo'
+
+    def __init__(self, client):
+        self.client = client
+
+    def ensure(self, name: str, kind: str) -> str:
+        """Create the volume unless it exists (volume creation is idempotent)"""
+        self.client.volumes.create(name=name, labels={self.CACHE_LABEL: kind})
+        return name
+
+    def get_mounts(self, platform: str, arch: str, toolchain: str, sccache: bool = False,
+                   project: Optional[Path] = None) -> Tuple[Dict, Dict[str, str]]:
+        """Return volume mounts and environment for a build container
+
+        The target volume is per project, so builds of other projects on
+        the same host never leave their bundles in it.
+        """
+        toolchain = re.sub(r'[^a-zA-Z0-9_.-]+', '-', toolchain)
+        target = f'tauridock-target-{platform}-{arch}'
+        if project is not None:
+            target += '-' + hashlib.sha256(str(Path(project).resolve()).encode()).hexdigest()[:12]
+        mounts = {
+            (f'tauridock-cargo-registry-{toolchain}', 'cargo-registry'): f'{self.CARGO_HOME}/registry',
+            (f'tauridock-cargo-git-{toolchain}', 'cargo-git'): f'{self.CARGO_HOME}/git',
+            (target, 'target'): '/cache/target',
+            ('tauridock-npm-cache', 'npm'): '/cache/npm',
+        }
+        environment = {
+            'CARGO_TARGET_DIR': '/cache/target',
+            'npm_config_cache': '/cache/npm',
+        }
+
+        if sccache:
+            mounts[(f'tauridock-sccache-{toolchain}', 'sccache')] = '/cache/sccache'
+            environment.update({'RUSTC_WRAPPER': 'sccache', 'SCCACHE_DIR': '/cache/sccache'})
+
+        volumes = {
+            self.ensure(name, kind): {'bind': bind, 'mode': 'rw'}
+            for (name, kind), bind in mounts.items()
+        }
+        return volumes, environment
+
+    def list(self) -> List[Dict]:
+        """List cache volumes with their kind and size in bytes (-1 if unknown)"""
+        usage = {
+            volume['Name']: volume.get('UsageData', {}).get('Size', -1)
+            for volume in self.client.df().get('Volumes') or []
+        }
+        return [
+            {
+                'name': volume.name,
+                'kind': volume.attrs.get('Labels', {}).get(self.CACHE_LABEL),
+                'size': usage.get(volume.name, -1),
+            }
+            for volume in self.client.volumes.list(filters={'label': self.CACHE_LABEL})
+        ]
+
+    def prune(self, kinds: Optional[List[str]] = None) -> List[str]:
+        """Remove cache volumes, optionally only those of the given kinds"""
+        removed = []
+        for volume in self.client.volumes.list(filters={'label': self.CACHE_LABEL}):
+            kind = volume.attrs.get('Labels', {}).get(self.CACHE_LABEL)
+            if kinds and kind not in kinds:
+                continue
+            try:
+                volume.remove(force=True)
+                removed.append(volume.name)
+            except docker.errors.APIError as e:
+                logger.warning(f"Could not remove {volume.name} (in use?): {e}")
+        return removed
+
+
+class DockerCacheManager:
+    """Tracks tauridock's images, containers and volumes and keeps them within a disk budget
+
+    Objects are recognised by their labels (or ``tauridock-`` image tags).
+    Last use is recorded per daemon in ``docker-usage.json`` under the cache
+    directory, falling back to the creation time for objects used before
+    tracking. Objects in use by a container or used within GRACE_PERIOD
+    are never evicted.
+    """
+
+    MANAGED_LABEL = 'tauridock.managed'
+    # Objects used this recently may belong to a build in progress
+    GRACE_PERIOD = 3600
+
+    # Managers of every host (and every API job) share the usage file
+    _locks: Dict[Path, threading.Lock] = {}
+    _locks_guard = threading.Lock()
+
+    def __init__(self, client, cache_dir: Path):
+        self.client = client
+        self.usage_path = Path(cache_dir).resolve() / 'docker-usage.json'
+        self.daemon = str(getattr(getattr(client, 'api', None), 'base_url', 'local'))
+        with self._locks_guard:
+            self._lock = self._locks.setdefault(self.usage_path, threading.Lock())
+
+    def record(self, kind: str, name: str):
+        """Note that an image (by ID) or volume was just used
+
+        Bookkeeping is best-effort and never fails the build using the object.
+        """
+        try:
+            with self._lock, self._file_lock():
+                usage = self._load_usage()
+                usage.setdefault(self.daemon, {})[f"{kind}:{name}"] = time.time()
+                tmp = self.usage_path.with_name(
+                    f"{self.usage_path.name}.tmp-{os.getpid()}-{threading.get_ident()}")
+                tmp.write_text(json.dumps(usage, indent=2))
+                os.replace(tmp, self.usage_path)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not record use of {kind} {name}: {e}")
+
+    @contextmanager
+    def _file_lock(self):
+        """Serialize read-modify-write of the usage file across processes"""
+        self.usage_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.usage_path.with_name(f"{self.usage_path.name}.lock"), 'a') as lock:
+            try:
+                import fcntl
+            except ImportError:
+                yield
+                return
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    def usage(self) -> List[Dict]:
+        """tauridock's Docker objects with their size, last use and whether they are in use
+
+        BuildKit's cache cannot be attributed to projects and is reported
+        as a single daemon-wide entry.
+        """
+        df = self.client.df()
+        used = self._load_usage().get(self.daemon, {})
+        running = {c.get('ImageID') for c in df.get('Containers') or [] if c.get('State') == 'running'}
+        objects = []
+
+        for image in df.get('Images') or []:
+            labels = image.get('Labels') or {}
+            tags = [tag for tag in image.get('RepoTags') or [] if tag != '<none>:<none>']
+            if not (self.MANAGED_LABEL in labels or DockerManager.BUILD_KEY_LABEL in labels
+                    or any(tag.startswith('tauridock-') for tag in tags)):
+                continue
+            shared = image.get('SharedSize', -1)
+            objects.append({
+                'kind': 'image',
+                'id': image['Id'],
+                'name': ', '.join(tags) or image['Id'][7:19],
+                'size': image['Size'] - shared if shared >= 0 else image['Size'],
+                'last_used': used.get(f"image:{image['Id']}", image.get('Created', 0)),
+                'in_use': image.get('Containers', 0) > 0 or image['Id'] in running,
+                'dangling': not tags,
+            })
+
+        for volume in df.get('Volumes') or []:
+            if CacheVolumeManager.CACHE_LABEL not in (volume.get('Labels') or {}):
+                continue
+            data = volume.get('UsageData') or {}
+            objects.append({
+                'kind': 'volume',
+                'id': volume['Name'],
+                'name': volume['Name'],
+                'size': max(data.get('Size', 0), 0),
+                'last_used': used.get(f"volume:{volume['Name']}", self._timestamp(volume.get('CreatedAt'))),
+                'in_use': data.get('RefCount', 0) > 0,
+                'dangling': False,
+            })
+
+        for container in df.get('Containers') or []:
+            labels = container.get('Labels') or {}
+            if self.MANAGED_LABEL not in labels and ContainerPool.POOL_LABEL not in labels:
+                continue
+            objects.append({
+                'kind': 'container',
+                'id': container['Id'],
+                'name': (container.get('Names') or [container['Id'][:12]])[0].lstrip('/'),
+                'size': container.get('SizeRw', 0),
+                'last_used': container.get('Created', 0),
+                'in_use': container.get('State') in ('running', 'paused', 'restarting'),
+                'dangling': False,
+            })
+
+        records = df.get('BuildCache') or []
+        if records:
+            objects.append({
+                'kind': 'build-cache',
+                'id': 'build-cache',
+                'name': f"{len(records)} records",
+                'size': sum(r.get('Size', 0) for r in records if not r.get('Shared')),
+                'last_used': max(self._timestamp(r.get('LastUsedAt')) for r in records),
+                'in_use': any(r.get('InUse') for r in records),
+                'dangling': False,
+            })
+
+        return objects
+
+    def gc(self, budget: Optional[int] = None, dry_run: bool = False) -> Dict:
+        """Remove leftovers, then evict least recently used objects until within budget
+
+        Stopped containers and untagged images are always removed. With a
+        budget (bytes), images and volumes go least recently used first;
+        BuildKit is then asked to trim its cache to what remains of the
+        budget. Returns the removed objects and the bytes freed.
+        """
+        objects = self.usage()
+        now = time.time()
+        evictable = [o for o in objects if not o['in_use'] and now - o['last_used'] >= self.GRACE_PERIOD]
+
+        removed = [o for o in evictable if o['kind'] == 'container' or (o['kind'] == 'image' and o['dangling'])]
+
+        build_cache = next((o for o in objects if o['kind'] == 'build-cache'), None)
+        if budget is not None:
+            total = sum(o['size'] for o in objects if o not in removed)
+            candidates = sorted((o for o in evictable if o['kind'] in ('image', 'volume') and o not in removed),
+                                key=lambda o: o['last_used'])
+            while candidates and total > budget:
+                victim = candidates.pop(0)
+                removed.append(victim)
+                total -= victim['size']
+
+        if dry_run:
+            return {'removed': removed, 'bytes': sum(o['size'] for o in removed)}
+
+        freed = 0
+        done = []
+        for obj in removed:
+            try:
+                self._remove(obj)
+            except docker.errors.APIError as e:
+                # Docker refuses to remove objects a container still uses
+                logger.debug(f"Could not remove {obj['kind']} {obj['name']}: {e}")
+                continue
+            logger.debug(f"Removed {obj['kind']} {obj['name']}")
+            done.append(obj)
+            freed += obj['size']
+
+        if budget is not None and build_cache and total > budget:
+            keep = max(0, budget - (total - build_cache['size']))
+            result = self.client.api.prune_builds(keep_storage=keep)
+            freed += (result or {}).get('SpaceReclaimed', 0)
+
+        return {'removed': done, 'bytes': freed}
+
+    def _remove(self, obj: Dict):
+        if obj['kind'] == 'container':
+            self.client.containers.get(obj['id']).remove()
+        elif obj['kind'] == 'image':
+            self.client.images.remove(obj['id'])
+        elif obj['kind'] == 'volume':
+            self.client.volumes.get(obj['id']).remove()
+
+    def _load_usage(self) -> Dict:
+        try:
+            return json.loads(self.usage_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _timestamp(value: Optional[str]) -> float:
+        """Parse Docker's RFC 3339 timestamps (nanosecond precision, Z or offset)"""
+        if not value:
+            return 0.0
+        from datetime import datetime
+
+        match = re.match(r'(\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d)(?:\.\d+)?(Z|[+-]\d\d:\d\d)?', value)
+        if not match:
+            return 0.0
+        offset = match.group(2) or 'Z'
+        return datetime.fromisoformat(match.group(1) + ('+00:00' if offset == 'Z' else offset)).timestamp()
+
+
+@dataclass
+class PooledContainer:
+    """Long-lived builder container owned by a ContainerPool"""
+    key: str
+    container: object = None
+    last_used: float = 0.0
+    busy: bool = False
+
+
+class ContainerPool:
+    """Pool of warm builder containers that run build commands through exec
+
+    Containers are keyed by image and mounts, health-checked before reuse,
+    reset between jobs and removed after sitting idle for too long.
+    """
+
+    POOL_LABEL = 'tauridock.pool'
+    # Containers bind-mount the project at /app, so only container-private
+    # scratch space is reset between jobs
+    RESET_COMMAND = 'rm -rf /tmp/* /tmp/.[!.]* 2>/dev/null; true'
+
+    def __init__(self, client, max_size: int = 4, idle_timeout: float = 600,
+                 reset_command: str = RESET_COMMAND):
+        self.client = client
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.reset_command = reset_command
+        self._entries: List[PooledContainer] = []
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._reaper = threading.Thread(target=self._reap_loop, daemon=True)
+        self._reaper.start()
+
+    def run(self, image: str, command: str, volumes: Dict, environment: Dict,
+            log: BuildLog) -> Optional[int]:
+        """Run command in a pooled container, None if the pool is exhausted"""
+        entry = self._acquire(image, volumes)
+        if entry is None:
+            return None
+
+        healthy = False
+        try:
+            with log:
+                exit_code = self._exec(entry.container, command, environment, log.feed)
+            healthy = self._exec(entry.container, self.reset_command, {}) == 0
+            return exit_code
+        finally:
+            self._release(entry, healthy)
+
+    def close(self):
+        """Remove all pooled containers"""
+        self._closed.set()
+        with self._lock:
+            entries, self._entries = self._entries, []
+        for entry in entries:
+            self._remove(entry)
+
+    def reap_idle(self):
+        """Remove containers idle for longer than the idle timeout"""
+        now = time.time()
+        with self._lock:
+            expired = [e for e in self._entries
+                       if not e.busy and now - e.last_used > self.idle_timeout]
+            for entry in expired:
+                self._entries.remove(entry)
+        for entry in expired:
+            logger.debug(f"Removing idle pooled container {entry.key[:12]}")
+            self._remove(entry)
+
+    def _acquire(self, image: str, volumes: Dict) -> Optional[PooledContainer]:
+        key = hashlib.sha256(json.dumps([image, volumes], sort_keys=True).encode('utf-8')).hexdigest()
+        evicted = None
+
+        with self._lock:
+            entry = next((e for e in self._entries if e.key == key and not e.busy), None)
+            if entry is None:
+                if len(self._entries) >= self.max_size:
+                    idle = [e for e in self._entries if not e.busy]
+                    if not idle:
+                        return None
+                    evicted = min(idle, key=lambda e: e.last_used)
+                    self._entries.remove(evicted)
+                entry = PooledContainer(key)
+                self._entries.append(entry)
+            entry.busy = True
+
+        if evicted:
+            self._remove(evicted)
+
+        try:
+            if entry.container is not None and not self._is_healthy(entry.container):
+                logger.debug(f"Replacing unhealthy pooled container {key[:12]}")
+                self._remove(entry)
+            if entry.container is None:
+                entry.container = self.client.containers.run(
+                    image=image,
+                    entrypoint=['/bin/sh', '-c'],
+                    command=['exec sleep infinity'],
+                    volumes=volumes,
+                    labels={self.POOL_LABEL: key, DockerCacheManager.MANAGED_LABEL: 'true'},
+                    detach=True
+                )
+        except Exception:
+            self._release(entry, healthy=False)
+            raise
+
+        return entry
+
+    def _release(self, entry: PooledContainer, healthy: bool):
+        with self._lock:
+            entry.busy = False
+            entry.last_used = time.time()
+            if not healthy and entry in self._entries:
+                self._entries.remove(entry)
+            else:
+                return
+        self._remove(entry)
+
+    def _exec(self, container, command: str, environment: Dict,
+              on_output: Optional[Callable[[bytes], None]] = None) -> int:
+        exec_id = self.client.api.exec_create(
+            container.id, ['/bin/sh', '-c', command], environment=environment
+        )['Id']
+        for chunk in self.client.api.exec_start(exec_id, stream=True):
+            if on_output:
+                on_output(chunk)
+        return self.client.api.exec_inspect(exec_id)['ExitCode']
+
+    @staticmethod
+    def _is_healthy(container) -> bool:
+        try:
+            container.reload()
+            return container.status == 'running'
+        except Exception:
+            return False
+
+    @staticmethod
+    def _remove(entry: PooledContainer):
+        if entry.container is None:
+            return
+        try:
+            entry.container.remove(force=True)
+        except Exception as e:
+            logger.debug(f"Failed to remove pooled container: {e}")
+        entry.container = None
+
+    def _reap_loop(self):
+        while not self._closed.wait(max(1.0, self.idle_timeout / 2)):
+            self.reap_idle()
+
+
+@dataclass
+class BuildStep:
+    """Timing of one Dockerfile instruction in an image build"""
+    number: int
+    instruction: str
+    duration: float = 0.0
+    cached: bool = False
+
+
+class ImageBuildParser:
+    """Consumes decoded events from the Docker build API
+
+    Tracks 'Step n/m' markers to time each instruction and to tell cached
+    steps apart, and picks up the resulting image ID. Errors reported by
+    the daemon are raised as BuildError.
+    """
+
+    STEP_PATTERN = re.compile(r'^Step (\d+)/(\d+) : (.*)$')
+    BUILT_PATTERN = re.compile(r'^Successfully built ([0-9a-f]+)')
+
+    def __init__(self, on_step: Optional[Callable[['ImageBuildParser'], None]] = None):
+        self.steps: List[BuildStep] = []
+        self.total_steps = 0
+        self.image_id: Optional[str] = None
+        self.on_step = on_step
+        self._log: List[Dict] = []
+        self._step_started = None
+
+    def feed(self, event: Dict):
+        self._log.append(event)
+        if 'error' in event:
+            self.finish()
+            raise docker.errors.BuildError(event['error'], self._log)
+
+        if 'aux' in event and 'ID' in event['aux']:
+            self.image_id = event['aux']['ID']
+
+        for line in event.get('stream', '').splitlines():
+            if line.strip():
+                self._parse_line(line.rstrip())
+
+    def finish(self) -> List[BuildStep]:
+        """Close the running step and return all step timings"""
+        if self._step_started is not None:
+            now = time.perf_counter()
+            step = self.steps[-1]
+            step.duration = now - self._step_started
+            tracer.record('image step', self._step_started, now, step=step.number,
+                          instruction=step.instruction, cache_hit=step.cached)
+            self._step_started = None
+        return self.steps
+
+    def _parse_line(self, line: str):
+        match = self.STEP_PATTERN.match(line)
+        if match:
+            self.finish()
+            self.total_steps = int(match.group(2))
+            self.steps.append(BuildStep(int(match.group(1)), match.group(3)))
+            self._step_started = time.perf_counter()
+            if self.on_step:
+                self.on_step(self)
+        elif line.strip() == '---> Using cache' and self._step_started is not None:
+            self.steps[-1].cached = True
+        else:
+            built = self.BUILT_PATTERN.match(line)
+            if built and not self.image_id:
+                self.image_id = built.group(1)
+
+
+class DockerIgnore:
+    """Matches paths against .dockerignore rules
+
+    Patterns follow Docker's semantics: '*' and '?' stay within a path
+    segment, '**' spans segments, a match on a directory covers everything
+    below it, and '!' re-includes; the last matching rule wins.
+    """
+
+    def __init__(self, patterns: List[str]):
+        self.rules: List[Tuple[re.Pattern, bool]] = []
+        for pattern in patterns:
+            pattern = pattern.strip()
+            if not pattern or pattern.startswith('#'):
+                continue
+            negated = pattern.startswith('!')
+            pattern = os.path.normpath(pattern.lstrip('!').strip()).lstrip('/')
+            if pattern in ('', '.'):
+                continue
+            self.rules.append((re.compile(self._translate(pattern)), negated))
+        self.has_exceptions = any(negated for _, negated in self.rules)
+
+    @classmethod
+    def from_file(cls, path: Path, defaults: Tuple[str, ...] = ()) -> 'DockerIgnore':
+        patterns = list(defaults)
+        if path.exists():
+            patterns.extend(path.read_text().splitlines())
+        return cls(patterns)
+
+    def excluded(self, rel_path: str) -> bool:
+        result = False
+        for regex, negated in self.rules:
+            if regex.match(rel_path):
+                result = not negated
+        return result
+
+    @staticmethod
+    def _translate(pattern: str) -> str:
+        regex = ''
+        i = 0
+        while i < len(pattern):
+            char = pattern[i]
+            if pattern.startswith('**', i):
+                # '**/' also matches zero directories
+                if pattern.startswith('**/', i):
+                    regex += '(?:.*/)?'
+                    i += 3
+                else:
+                    regex += '.*'
+                    i += 2
+                continue
+            if char == '*':
+                regex += '[^/]*'
+            elif char == '?':
+                regex += '[^/]'
+            elif char == '[':
+                end = pattern.find(']', i)
+                if end == -1:
+                    regex += re.escape(char)
+                else:
+                    regex += pattern[i:end + 1].replace('[!', '[^')
+                    i = end
+            else:
+                regex += re.escape(char)
+            i += 1
+        # A matching directory excludes its contents too
+        return f"^{regex}(?:/.*)?$"
+
+
+@dataclass
+class ContextArchive:
+    """A tarred build context on disk"""
+    path: Path
+    size: int
+    sha256: str
+    digest: str
+    files: int
+
+
+class _HashingReader:
+    """File wrapper hashing data as tarfile reads it"""
+
+    def __init__(self, f, hasher):
+        self.f = f
+        self.hasher = hasher
+
+    def read(self, size=-1):
+        data = self.f.read(size)
+        self.hasher.update(data)
+        return data
+
+
+class _HashingWriter:
+    """File wrapper hashing and counting data as tarfile writes it"""
+
+    def __init__(self, f):
+        self.f = f
+        self.hasher = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data):
+        self.hasher.update(data)
+        self.size += len(data)
+        return self.f.write(data)
+
+
+class _ChunkReader:
+    """File-like view of an iterator of byte chunks, for streaming tar extraction"""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._chunk = b''
+        self._offset = 0
+        self.size = 0
+
+    def read(self, size=-1):
+        parts = []
+        while size != 0:
+            if self._offset >= len(self._chunk):
+                chunk = next(self._chunks, None)
+                if chunk is None:
+                    break
+                self._chunk, self._offset = chunk, 0
+                continue
+            end = len(self._chunk) if size < 0 else min(len(self._chunk), self._offset + size)
+            parts.append(self._chunk[self._offset:end])
+            if size > 0:
+                size -= end - self._offset
+            self._offset = end
+        data = b''.join(parts)
+        self.size += len(data)
+        return data
+
+
+class BuildContext:
+    """Filtered Docker build context, tarred once and reused while unchanged
+
+    Files are selected with .dockerignore plus DEFAULT_EXCLUDES. A stat index
+    (path, size, mtime, mode) of the selection keys the cached archive, so an
+    unchanged tree is only walked, never re-read. Besides the archive hash a
+    content digest (paths, modes and file hashes) is recorded; it ignores
+    mtimes and is what image build keys depend on.
+    """
+
+    DEFAULT_EXCLUDES = (
+        '.git', '**/node_modules', '**/target', 'dist', '**/__pycache__',
+        '.tauri-cache', '.pytest_cache', '.venv', '**/*.pyc',
+    )
+    KEEP_ARCHIVES = 3
+
+    def __init__(self, root: Path, dockerfile: Optional[Path], cache_dir: Path,
+                 excluded_paths: Tuple[Path, ...] = (), digests: Optional[FileDigests] = None):
+        self.root = root.resolve()
+        self.dockerfile = dockerfile.resolve() if dockerfile else None
+        self.cache_dir = Path(cache_dir) / 'context'
+        self.excluded_paths = {p.resolve() for p in excluded_paths}
+        # File hashes computed while tarring are handed to the other tree hashers
+        self.digests = digests
+        self._lock = threading.Lock()
+
+    def build(self) -> ContextArchive:
+        """Return the context archive, re-tarring only if the stat index changed"""
+        with self._lock, tracer.span('build context') as span:
+            files = self._select_files()
+            index = hashlib.sha256(json.dumps(files).encode('utf-8')).hexdigest()
+            span.set_attribute('files', len(files))
+
+            archive = self._load(index)
+            span.set_attribute('cache_hit', archive is not None)
+            if archive is None:
+                archive = self._write(index, files)
+                logger.debug(f"Build context: {archive.files} files, "
+                             f"{archive.size / 1024 ** 2:.1f} MiB ({archive.sha256[:12]})")
+                self._prune()
+            else:
+                os.utime(archive.path)
+            span.set_attribute('bytes', archive.size)
+            return archive
+
+    def _select_files(self) -> List[Tuple[str, int, int, int]]:
+        """Walk the context and return (path, size, mtime_ns, mode) of included entries"""
+        ignore = DockerIgnore.from_file(self.root / '.dockerignore', self.DEFAULT_EXCLUDES)
+        always = {'.dockerignore'}
+        if self.dockerfile:
+            # A Dockerfile outside the context is sent by the client, not from the context
+            try:
+                always.add(self.dockerfile.relative_to(self.root).as_posix())
+            except ValueError:
+                pass
+        entries = []
+
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            current = Path(dirpath)
+            rel_dir = current.relative_to(self.root).as_posix()
+            prefix = '' if rel_dir == '.' else f"{rel_dir}/"
+
+            kept = []
+            for name in sorted(dirnames):
+                path = current / name
+                rel = prefix + name
+                if path.resolve() in self.excluded_paths:
+                    continue
+                if ignore.excluded(rel):
+                    # Exceptions may re-include something below, keep walking then
+                    if ignore.has_exceptions:
+                        kept.append(name)
+                    continue
+                kept.append(name)
+                stat = path.lstat()
+                entries.append((rel + '/', 0, stat.st_mtime_ns, stat.st_mode))
+            dirnames[:] = kept
+
+            for name in sorted(filenames):
+                rel = prefix + name
+                if rel not in always and ignore.excluded(rel):
+                    continue
+                stat = (current / name).lstat()
+                entries.append((rel, stat.st_size, stat.st_mtime_ns, stat.st_mode))
+
+        return entries
+
+    def _load(self, index: str) -> Optional[ContextArchive]:
+        meta_path = self.cache_dir / f"{index}.json"
+        if not meta_path.exists():
+            return None
+        meta = json.loads(meta_path.read_text())
+        archive = ContextArchive(path=self.cache_dir / f"{index}.tar", **meta)
+        if not archive.path.exists() or archive.path.stat().st_size != archive.size:
+            return None
+        return archive
+
+    def _write(self, index: str, files: List[Tuple[str, int, int, int]]) -> ContextArchive:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_dir / f"{index}.tar.tmp-{os.getpid()}-{threading.get_ident()}"
+        content = hashlib.sha256()
+
+        with open(tmp, 'wb') as f:
+            writer = _HashingWriter(f)
+            with tarfile.open(fileobj=writer, mode='w|', format=tarfile.PAX_FORMAT) as tar:
+                for rel, size, mtime_ns, _ in files:
+                    arcname = rel.rstrip('/')
+                    info = tar.gettarinfo(self.root / arcname, arcname=arcname)
+                    info.uid = info.gid = 0
+                    info.uname = info.gname = ''
+                    content.update(f"{arcname}\0{info.mode:o}\0".encode('utf-8'))
+                    if info.isfile():
+                        hasher = hashlib.sha256()
+                        with open(self.root / arcname, 'rb') as src:
+                            tar.addfile(info, _HashingReader(src, hasher))
+                        content.update(hasher.digest())
+                        if self.digests is not None and info.size == size:
+                            self.digests.add(self.root / arcname, size, mtime_ns, hasher.hexdigest())
+                    else:
+                        content.update(info.linkname.encode('utf-8'))
+                        tar.addfile(info)
+
+        archive = ContextArchive(
+            path=self.cache_dir / f"{index}.tar",
+            size=writer.size,
+            sha256=writer.hasher.hexdigest(),
+            digest=content.hexdigest(),
+            files=sum(1 for rel, _, _, _ in files if not rel.endswith('/')),
+        )
+        os.replace(tmp, archive.path)
+        meta = {'size': archive.size, 'sha256': archive.sha256, 'digest': archive.digest, 'files': archive.files}
+        (self.cache_dir / f"{index}.json").write_text(json.dumps(meta))
+        return archive
+
+    def _prune(self):
+        """Keep only the most recently used archives"""
+        archives = sorted(self.cache_dir.glob('*.tar'), key=lambda p: p.stat().st_mtime, reverse=True)
+        for old in archives[self.KEEP_ARCHIVES:]:
+            old.unlink(missing_ok=True)
+            old.with_suffix('.json').unlink(missing_ok=True)
 
 
 class DockerManager:
     """Manages Docker containers and images"""
 
-    def __init__(self, config: BuildConfig):
+    # Image label recording the inputs an image was built from
+    BUILD_KEY_LABEL = 'tauridock.build-key'
+    # Image label recording the toolchain found in the image (JSON)
+    TOOLCHAIN_LABEL = 'tauridock.toolchain'
+    TOOLCHAIN_PROBE = (
+        "rustup target list --installed 2>/dev/null | sed 's/^/target=/'; "
+        "echo \"rustc=$(rustc --version 2>/dev/null)\"; "
+        "echo \"tauri=$(cargo tauri --version 2>/dev/null)\"; "
+        "echo \"node=$(node --version 2>/dev/null)\"; "
+        "echo \"npm=$(npm --version 2>/dev/null)\""
+    )
+
+    def __init__(self, config: BuildConfig, client=None, remote: bool = False,
+                 context: Optional[BuildContext] = None):
         self.config = config
-        try:
-            self.client = docker.from_env()
-            self.client.ping()
-        except docker.errors.DockerException as e:
-            logger.error(f"Docker is not running or not accessible: {e}")
-            sys.exit(1)
+        self.remote = remote
+        self.image_digests: Dict[str, str] = {}
+        # In-flight builds only; finished images are found again by their build-key label
+        self._image_builds: Dict[str, Future] = {}
+        self._image_builds_lock = threading.Lock()
+        self._built_keys: Set[str] = set()
+        self.image_steps: Dict[str, List[BuildStep]] = {}
+        self.toolchains: Dict[str, Dict] = {}
+        self._progress = None
+        self._progress_users = 0
+        self._progress_lock = threading.Lock()
+        self.client = client if client is not None else connect_docker()
+        self.context = context or BuildContext(config.dockerfile.parent, config.dockerfile, config.cache_dir,
+                                               excluded_paths=(config.cache_dir, config.output_dir))
+
+        self.cache_volumes = CacheVolumeManager(self.client)
+        self.objects = DockerCacheManager(self.client, config.cache_dir)
+        self.pool = None
+        # Pooled containers bind-mount the project, which a remote daemon cannot see
+        if config.warm_pool and not remote:
+            self.pool = ContainerPool(self.client, max_size=config.pool_size,
+                                      idle_timeout=config.pool_idle_timeout)
 
     def build_image(self, platform: str, arch: str) -> str:
-        """Build Docker image for specific platform"""
+        """Build Docker image for specific platform
+
+        Only the Dockerfile stage matching the platform is built when one
+        exists. Concurrent requests resolving to the same build inputs share
+        a single build, and images whose build-key label matches are reused
+        as-is.
+        """
         tag = f"tauridock-{platform}-{arch}:latest"
 
+        rust_targets = PlatformBuilder.PLATFORM_CONFIG[platform]['rust_target']
         build_args = {
             'PLATFORM': platform,
             'ARCH': arch,
-            'FRONTEND_PORT': str(self.config.frontend_port)
+            'FRONTEND_PORT': str(self.config.frontend_port),
+            # Baked into images whose Dockerfile declares it, so builds skip rustup
+            'RUST_TARGETS': ' '.join(sorted(
+                rust_targets[a] for a in self.config.architectures if a in rust_targets
+            )),
         }
+        target = self._get_target_stage(self.config.dockerfile.read_text(), platform, arch)
+        context = self.context.build()
+        build_key = self._get_build_key(build_args, context, target)
 
+        with self._image_builds_lock:
+            pending = self._image_builds.get(build_key)
+            is_owner = pending is None
+            if is_owner:
+                pending = Future()
+                self._image_builds[build_key] = pending
+
+        if is_owner:
+            try:
+                image_id, toolchain = self._build_or_reuse_image(platform, arch, tag, build_args, build_key,
+                                                                 context, target)
+            except Exception as e:
+                pending.set_exception(e)
+                raise
+            else:
+                pending.set_result((image_id, toolchain))
+            finally:
+                # Waiters hold the future; later requests look the image up, as it may have been removed since
+                with self._image_builds_lock:
+                    del self._image_builds[build_key]
+        else:
+            logger.debug(f"Waiting for shared image build {build_key[:12]} ({tag})")
+            with tracer.span('image wait', image=tag):
+                image_id, toolchain = pending.result()
+            self._tag_image(image_id, tag)
+
+        self.image_digests[tag] = image_id
+        self.toolchains[tag] = toolchain
+        self.objects.record('image', image_id)
+        return tag
+
+    def _build_or_reuse_image(self, platform: str, arch: str, tag: str, build_args: Dict[str, str],
+                              build_key: str, context: ContextArchive,
+                              target: Optional[str]) -> Tuple[str, Dict]:
+        """Build image unless one labelled with the same build key exists
+
+        Returns the image ID and its toolchain manifest.
+        """
+        with tracer.span('image build', image=tag, platform=platform, arch=arch, target=target or '') as span:
+            cache_from = []
+            if self.config.docker_cache and self.config.layer_cache:
+                cache_from = self._import_layer_cache(tag)
+
+            # Without the Docker cache, images built earlier in this process are still reused
+            if self.config.docker_cache or build_key in self._built_keys:
+                existing = self.client.images.list(filters={'label': f"{self.BUILD_KEY_LABEL}={build_key}"})
+                # Prefer the toolchain-labelled child over the plain build
+                existing.sort(key=lambda image: self._read_toolchain_label(image) is None)
+                for image in existing:
+                    logger.info(f"♻️  Docker image up to date: {tag}")
+                    span.set_attribute('cache_hit', True)
+                    metrics.inc('tauridock_cache_requests_total', cache='image', result='hit')
+                    image_id, toolchain = image.id, self._read_toolchain_label(image)
+                    if toolchain is None:
+                        image_id, toolchain = self._record_toolchain(image_id, tag)
+                    self._tag_image(image_id, tag)
+                    if self.config.layer_cache:
+                        self._export_layer_cache(tag, image_id)
+                    return image_id, toolchain
+
+            span.set_attribute('cache_hit', False)
+            metrics.inc('tauridock_cache_requests_total', cache='image', result='miss')
+            image_id = self._build_image(platform, arch, tag, build_args, build_key, context,
+                                         target, cache_from)
+            self._built_keys.add(build_key)
+            image_id, toolchain = self._record_toolchain(image_id, tag)
+            if self.config.layer_cache:
+                self._export_layer_cache(tag, image_id)
+            return image_id, toolchain
+
+    def _read_toolchain_label(self, image) -> Optional[Dict]:
         try:
-            with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    BarColumn(),
-                    console=console
-            ) as progress:
-                task = progress.add_task(
-                    f"Building Docker image for {platform}/{arch}...",
-                    total=100
+            return json.loads(image.labels[self.TOOLCHAIN_LABEL])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def _record_toolchain(self, image_id: str, tag: str) -> Tuple[str, Dict]:
+        """Probe the image's toolchain and label a child image with it
+
+        The label lets later builds skip setup without probing again. Images
+        without a Rust toolchain (or a shell) are left unlabelled and get an
+        empty manifest, so builds run every setup step.
+        """
+        with tracer.span('toolchain probe', image=tag):
+            try:
+                output = self.client.containers.run(
+                    image=image_id, entrypoint=['/bin/sh', '-c'], command=[self.TOOLCHAIN_PROBE], remove=True
                 )
+                toolchain = self._parse_toolchain(output.decode('utf-8', errors='replace'))
+            except docker.errors.DockerException as e:
+                logger.debug(f"Toolchain probe failed for {tag}: {e}")
+                return image_id, {}
+
+            if not toolchain.get('rustc'):
+                return image_id, {}
+
+            image, _ = self.client.images.build(
+                fileobj=io.BytesIO(f"FROM {image_id}\n".encode('utf-8')),
+                labels={self.TOOLCHAIN_LABEL: json.dumps(toolchain, sort_keys=True),
+                        DockerCacheManager.MANAGED_LABEL: 'true'},
+                tag=tag,
+                rm=True
+            )
+
+        logger.info(f"🧰 {tag}: {toolchain['rustc']}, {len(toolchain['targets'])} targets, "
+                    f"{toolchain.get('tauri') or 'no tauri-cli'}, node {toolchain.get('node') or 'missing'}")
+        return image.id, toolchain
+
+    @staticmethod
+    def _parse_toolchain(output: str) -> Dict:
+        """Parse the key=value lines printed by TOOLCHAIN_PROBE"""
+        toolchain = {'targets': []}
+        for line in output.splitlines():
+            key, sep, value = line.strip().partition('=')
+            if not sep or not value.strip():
+                continue
+            if key == 'target':
+                toolchain['targets'].append(value.strip())
+            else:
+                toolchain[key] = value.strip()
+        toolchain['targets'].sort()
+        return toolchain
+
+    def _build_image(self, platform: str, arch: str, tag: str, build_args: Dict[str, str],
+                     build_key: str, context: ContextArchive, target: Optional[str],
+                     cache_from: List[str]) -> str:
+        """Build and label the image for platform/arch, streaming per-step progress"""
+        log_path = Path(self.config.cache_dir) / 'logs' / f'image-{platform}-{arch}.log.gz'
+        build_log = BuildLog(log_path, consumers=[lambda line: logger.debug(f"[image {platform}/{arch}] {line}")])
+
+        try:
+            with self._shared_progress() as progress, build_log, open(context.path, 'rb') as fileobj:
+                task = progress.add_task(f"{platform}/{arch}: sending context", total=None)
 
-                image, build_logs = self.client.images.build(
-                    path=str(self.config.dockerfile.parent),
+                def on_step(parser: ImageBuildParser):
+                    step = parser.steps[-1]
+                    progress.update(
+                        task, total=parser.total_steps, completed=step.number - 1,
+                        description=f"{platform}/{arch}: step {step.number}/{parser.total_steps} "
+                                    f"{step.instruction[:40]}"
+                    )
+
+                parser = ImageBuildParser(on_step=on_step)
+                events = self.client.api.build(
+                    fileobj=fileobj,
+                    custom_context=True,
                     dockerfile=str(self.config.dockerfile.name),
                     tag=tag,
+                    target=target,
+                    cache_from=cache_from or None,
                     buildargs=build_args,
+                    labels={self.BUILD_KEY_LABEL: build_key, DockerCacheManager.MANAGED_LABEL: 'true'},
                     nocache=not self.config.docker_cache,
-                    rm=True
+                    rm=True,
+                    decode=True
                 )
+                for event in events:
+                    if 'stream' in event:
+                        build_log.feed(event['stream'].encode('utf-8'))
+                    parser.feed(event)
+
+                steps = parser.finish()
+                progress.update(task, total=parser.total_steps or 1, completed=parser.total_steps or 1,
+                                description=f"{platform}/{arch}: built")
 
-                progress.update(task, completed=100)
+            if not parser.image_id:
+                raise docker.errors.BuildError("Build finished without an image ID", parser._log)
 
+            self._record_steps(tag, platform, arch, steps)
             logger.info(f"✅ Docker image built: {tag}")
-            return tag
+            return parser.image_id
 
         except docker.errors.BuildError as e:
-            logger.error(f"Failed to build Docker image: {e}")
+            logger.error(f"Failed to build Docker image: {e} (full log: {log_path})")
+            for line in build_log.get_tail().splitlines()[-10:]:
+                logger.error(f"  {line}")
             raise
 
+    @contextmanager
+    def _shared_progress(self):
+        """One live progress display shared by all concurrent image builds"""
+        with self._progress_lock:
+            if self._progress is None:
+                from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+
+                self._progress = Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    BarColumn(),
+                    TextColumn("{task.completed}/{task.total}"),
+                    console=console
+                )
+                self._progress.start()
+            self._progress_users += 1
+            progress = self._progress
+        try:
+            yield progress
+        finally:
+            with self._progress_lock:
+                self._progress_users -= 1
+                if not self._progress_users:
+                    self._progress.stop()
+                    self._progress = None
+
+    def _record_steps(self, tag: str, platform: str, arch: str, steps: List[BuildStep]):
+        """Keep step timings and report the slowest uncached steps"""
+        self.image_steps[tag] = steps
+        for step in steps:
+            metrics.inc('tauridock_cache_requests_total', cache='layer',
+                        result='hit' if step.cached else 'miss')
+
+        path = Path(self.config.cache_dir) / 'logs' / f'image-{platform}-{arch}.steps.json'
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps([step.__dict__ for step in steps], indent=2))
+
+        built = sorted((step for step in steps if not step.cached), key=lambda step: -step.duration)
+        cached = len(steps) - len(built)
+        logger.info(f"🧱 {tag}: {len(built)} steps built, {cached} cached")
+        for step in built[:3]:
+            logger.info(f"   {step.duration:7.1f}s  step {step.number}: {step.instruction[:70]}")
+
+    def _tag_image(self, image_id: str, tag: str):
+        repository, _, version = tag.rpartition(':')
+        self.client.api.tag(image_id, repository, version)
+
+    def _get_build_key(self, build_args: Dict[str, str], context: ContextArchive,
+                       target: Optional[str] = None) -> str:
+        """Hash the Dockerfile, the build context, the target stage and the build args it consumes"""
+        dockerfile_text = self.config.dockerfile.read_text()
+        inputs = {
+            'dockerfile': hashlib.sha256(dockerfile_text.encode('utf-8')).hexdigest(),
+            'context': context.digest,
+            'target': target,
+            'build_args': self._get_effective_build_args(dockerfile_text, build_args),
+        }
+        return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _get_target_stage(dockerfile_text: str, platform: str, arch: str) -> Optional[str]:
+        """Pick the most specific stage for platform/arch, None to build the whole file
+
+        Looks for ``{platform}-{arch}-builder``, then ``{arch}-builder`` for
+        Linux cross builds, then ``{platform}-builder``.
+        """
+        stages = {
+            match.group(1).lower()
+            for match in re.finditer(r'^\s*FROM\s+(?:--\S+\s+)*\S+\s+AS\s+(\S+)',
+                                     dockerfile_text, re.IGNORECASE | re.MULTILINE)
+        }
+        candidates = [f"{platform}-{arch}-builder"]
+        if platform == 'linux':
+            candidates.append(f"{arch}-builder")
+        candidates.append(f"{platform}-builder")
+        return next((stage for stage in candidates if stage in stages), None)
+
+    def _layer_cache_path(self, tag: str) -> Path:
+        """Tarball for tag in the layer cache, keyed by the Dockerfile hash"""
+        dockerfile_hash = file_digest(self.config.dockerfile)[:16]
+        return Path(self.config.layer_cache) / dockerfile_hash / f"{tag.replace(':', '_')}.tar"
+
+    def _import_layer_cache(self, tag: str) -> List[str]:
+        """Load a previously exported image so its layers can seed the build cache"""
+        path = self._layer_cache_path(tag)
+        if not path.exists():
+            logger.debug(f"No layer cache for {tag} at {path}")
+            return []
+
+        with tracer.span('layer cache import', image=tag, bytes=path.stat().st_size):
+            try:
+                with open(path, 'rb') as f:
+                    self.client.images.load(f)
+            except docker.errors.APIError as e:
+                logger.warning(f"Ignoring unusable layer cache {path}: {e}")
+                return []
+
+        logger.info(f"📥 Imported layer cache for {tag}")
+        return [tag]
+
+    def _export_layer_cache(self, tag: str, image_id: str):
+        """Save the image for import on another machine, dropping this Dockerfile's older exports
+
+        The layer cache directory may be shared by other Dockerfiles and
+        projects, so only tarballs of this tag written for this Dockerfile
+        are replaced. Nothing is written when the cached tarball already
+        holds image_id.
+        """
+        path = self._layer_cache_path(tag)
+        meta_path = path.with_suffix('.json')
+        owner = hashlib.sha256(str(self.config.dockerfile.resolve()).encode('utf-8')).hexdigest()[:16]
+        if path.exists() and self._read_layer_cache_meta(meta_path).get('image_id') == image_id:
+            logger.debug(f"Layer cache for {tag} is up to date")
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.tmp-{os.getpid()}-{threading.get_ident()}")
+        with tracer.span('layer cache export', image=tag):
+            with open(tmp, 'wb') as f:
+                for chunk in self.client.images.get(tag).save(named=True):
+                    f.write(chunk)
+            os.replace(tmp, path)
+        meta_path.write_text(json.dumps({'tag': tag, 'image_id': image_id, 'owner': owner}))
+
+        for stale in path.parent.parent.glob(f"*/{meta_path.name}"):
+            if stale.parent != path.parent and self._read_layer_cache_meta(stale).get('owner') == owner:
+                stale.with_suffix('.tar').unlink(missing_ok=True)
+                stale.unlink(missing_ok=True)
+                if not any(stale.parent.iterdir()):
+                    stale.parent.rmdir()
+        logger.debug(f"Exported layer cache for {tag} to {path}")
+
+    @staticmethod
+    def _read_layer_cache_meta(path: Path) -> Dict:
+        try:
+            return json.loads(path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _get_effective_build_args(dockerfile_text: str, build_args: Dict[str, str]) -> Dict[str, str]:
+        """Filter build args down to those that can influence the image
+
+        Global ARGs (declared before the first FROM) are only visible to FROM
+        lines; ARGs declared inside a stage are visible to its instructions.
+        """
+        global_args, stage_args, from_lines = set(), set(), []
+        in_stage = False
+
+        for line in dockerfile_text.splitlines():
+            parts = line.strip().split(None, 1)
+            if not parts:
+                continue
+            instruction = parts[0].upper()
+            if instruction == 'FROM':
+                in_stage = True
+                from_lines.append(line)
+            elif instruction == 'ARG' and len(parts) > 1:
+                name = parts[1].split('=', 1)[0].strip()
+                (stage_args if in_stage else global_args).add(name)
+
+        effective = {}
+        for name, value in build_args.items():
+            used_in_from = any(f'${{{name}}}' in line or f'${name}' in line for line in from_lines)
+            if name in stage_args or (name in global_args and used_in_from):
+                effective[name] = value
+        return effective
+
     def run_container(self, image: str, command: str, volumes: Dict = None,
-                      ports: Dict = None, environment: Dict = None) -> Tuple[int, str]:
-        """Run command in Docker container"""
+                      ports: Dict = None, environment: Dict = None,
+                      log: Optional[BuildLog] = None) -> Tuple[int, str]:
+        """Run command in Docker container
+
+        Output is read once and streamed through ``log``; only the bounded
+        tail of the log is returned.
+        """
+        if log is None:
+            log = BuildLog(consumers=[logger.debug])
+        self._record_usage(image, volumes)
+
+        with tracer.span('container run', image=image) as span:
+            status = None
+            if self.pool and not ports:
+                status = self.pool.run(image, command, volumes or {}, environment or {}, log)
+                if status is not None:
+                    span.set_attribute('pooled', True)
+                else:
+                    logger.debug("Container pool exhausted, using a one-off container")
+
+            if status is None:
+                try:
+                    status = self._run_one_off(image, command, volumes, ports, environment, log)
+                except Exception:
+                    metrics.inc('tauridock_container_failures_total', reason='error')
+                    raise
+
+            span.set_attribute('exit_code', status)
+            if status != 0:
+                metrics.inc('tauridock_container_failures_total', reason='exit')
+            return status, log.get_tail()
+
+    def _run_one_off(self, image: str, command: str, volumes: Optional[Dict], ports: Optional[Dict],
+                     environment: Optional[Dict], log: BuildLog) -> int:
+        """Run command in a fresh container and return its exit code"""
         container = None
         try:
-            container = self.client.containers.run(
-                image=image,
-                command=command,
-                volumes=volumes or {},
-                ports=ports or {},
-                environment=environment or {},
-                detach=True,
-                remove=False
-            )
+            with tracer.span('container start', image=image):
+                container = self.client.containers.run(
+                    image=image,
+                    entrypoint=['/bin/sh', '-c'],
+                    command=[command],
+                    volumes=volumes or {},
+                    ports=ports or {},
+                    environment=environment or {},
+                    labels={DockerCacheManager.MANAGED_LABEL: 'true'},
+                    detach=True,
+                    remove=False
+                )
 
             # Stream logs
-            for log in container.logs(stream=True):
-                logger.debug(log.decode('utf-8').strip())
+            with log:
+                for chunk in container.logs(stream=True, follow=True):
+                    log.feed(chunk)
 
             result = container.wait()
-            logs = container.logs().decode('utf-8')
 
-            return result['StatusCode'], logs
+            return result['StatusCode']
 
         except docker.errors.ContainerError as e:
             logger.error(f"Container error: {e}")
@@ -144,8 +2030,117 @@ class DockerManager:
             if container:
                 container.remove(force=True)
 
-    def run_dev_container(self, image: str, project_path: Path):
-        """Run container in development mode with hot reload"""
+    def run_with_archives(self, image: str, command: str, uploads: List[Tuple[str, Path]],
+                          downloads: List[Tuple[str, Path]], volumes: Dict = None,
+                          environment: Dict = None, log: Optional[BuildLog] = None) -> Tuple[int, str]:
+        """Run command with files copied into and out of the container
+
+        For daemons that cannot bind-mount local paths. ``uploads`` are
+        (container directory, local tar archive) pairs extracted before the
+        command starts; ``downloads`` are (container path, local directory)
+        pairs streamed back once it succeeds.
+        """
+        if log is None:
+            log = BuildLog(consumers=[logger.debug])
+        self._record_usage(image, volumes)
+
+        container = None
+        with tracer.span('container run', image=image, remote=True) as span:
+            try:
+                with tracer.span('container start', image=image):
+                    container = self.client.containers.create(
+                        image=image,
+                        entrypoint=['/bin/sh', '-c'],
+                        command=[command],
+                        volumes=volumes or {},
+                        environment=environment or {},
+                        labels={DockerCacheManager.MANAGED_LABEL: 'true'}
+                    )
+                    container.put_archive('/', self._directories_archive([path for path, _ in uploads]))
+                    for path, archive in uploads:
+                        with tracer.span('archive upload', path=path, bytes=archive.stat().st_size), \
+                                open(archive, 'rb') as f:
+                            container.put_archive(path, f)
+                        metrics.inc('tauridock_transferred_bytes_total', archive.stat().st_size,
+                                    direction='upload')
+                    container.start()
+
+                with log:
+                    for chunk in container.logs(stream=True, follow=True):
+                        log.feed(chunk)
+                status = container.wait()['StatusCode']
+
+                if status == 0:
+                    for path, dest in downloads:
+                        with tracer.span('archive download', path=path) as download:
+                            chunks, _ = container.get_archive(path)
+                            received = self._extract_archive(chunks, dest)
+                            download.set_attribute('bytes', received)
+                        metrics.inc('tauridock_transferred_bytes_total', received, direction='download')
+            except Exception:
+                metrics.inc('tauridock_container_failures_total', reason='error')
+                raise
+            finally:
+                if container:
+                    container.remove(force=True)
+
+            span.set_attribute('exit_code', status)
+            if status != 0:
+                metrics.inc('tauridock_container_failures_total', reason='exit')
+            return status, log.get_tail()
+
+    def _record_usage(self, image: str, volumes: Optional[Dict]):
+        """Note the image and named volumes a container is about to use"""
+        self.objects.record('image', self.image_digests.get(image, image))
+        for name in volumes or {}:
+            if not name.startswith('/'):
+                self.objects.record('volume', name)
+
+    @staticmethod
+    def _directories_archive(paths: List[str]) -> bytes:
+        """Tar of empty directories (with parents), as put_archive needs existing targets"""
+        buffer = io.BytesIO()
+        names = set()
+        with tarfile.open(fileobj=buffer, mode='w') as tar:
+            for path in paths:
+                parts = PurePosixPath(path).parts[1:]
+                for depth in range(1, len(parts) + 1):
+                    name = '/'.join(parts[:depth])
+                    if name in names:
+                        continue
+                    names.add(name)
+                    info = tarfile.TarInfo(name)
+                    info.type = tarfile.DIRTYPE
+                    info.mode = 0o755
+                    tar.addfile(info)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _extract_archive(chunks: Iterable[bytes], dest: Path) -> int:
+        """Extract a streamed tar into dest, refusing paths that escape it; returns bytes read"""
+        dest.mkdir(parents=True, exist_ok=True)
+        reader = _ChunkReader(chunks)
+        with tarfile.open(fileobj=reader, mode='r|') as tar:
+            if hasattr(tarfile, 'data_filter'):
+                tar.extractall(dest, filter='data')
+            else:
+                def safe_members():
+                    for member in tar:
+                        for name in (member.name, member.linkname if member.issym() or member.islnk() else ''):
+                            path = PurePosixPath(name)
+                            if path.is_absolute() or '..' in path.parts:
+                                raise tarfile.TarError(f"Refusing to extract {member.name}")
+                        yield member
+                tar.extractall(dest, members=safe_members())
+        return reader.size
+
+    def close(self):
+        """Release pooled containers"""
+        if self.pool:
+            self.pool.close()
+
+    def start_dev_container(self, image: str, project_path: Path, command: Optional[str] = None):
+        """Start a detached development container, running command through a shell if given"""
         volumes = {
             str(project_path): {'bind': '/app', 'mode': 'rw'}
         }
@@ -160,18 +2155,38 @@ class DockerManager:
             'RUST_BACKTRACE': '1'
         }
 
+        run_args = {'command': 'tauri dev'}
+        if command:
+            run_args = {'entrypoint': ['/bin/sh', '-c'], 'command': [command]}
+
+        return self.client.containers.run(
+            image=image,
+            volumes=volumes,
+            ports=ports,
+            environment=environment,
+            labels={DockerCacheManager.MANAGED_LABEL: 'true'},
+            detach=True,
+            remove=False,
+            stdin_open=True,
+            tty=True,
+            **run_args
+        )
+
+    def exec_command(self, container, command: str,
+                     on_output: Optional[Callable[[bytes], None]] = None) -> int:
+        """Run a shell command in a running container and return its exit code"""
+        exec_id = self.client.api.exec_create(container.id, ['/bin/sh', '-c', command])['Id']
+        for chunk in self.client.api.exec_start(exec_id, stream=True):
+            if on_output:
+                on_output(chunk)
+        return self.client.api.exec_inspect(exec_id)['ExitCode']
+
+    def run_dev_container(self, image: str, project_path: Path):
+        """Run container in development mode with hot reload"""
+        from rich.panel import Panel
+
         try:
-            container = self.client.containers.run(
-                image=image,
-                command='tauri dev',
-                volumes=volumes,
-                ports=ports,
-                environment=environment,
-                detach=True,
-                remove=False,
-                stdin_open=True,
-                tty=True
-            )
+            container = self.start_dev_container(image, project_path)
 
             console.print(Panel.fit(
                 f"🚀 Development server started!\n"
@@ -195,6 +2210,276 @@ class DockerManager:
             raise
 
 
+@dataclass
+class DockerHost:
+    """A Docker daemon targets can be dispatched to"""
+    name: str
+    manager: DockerManager
+    capacity: int = 1
+    architectures: List[str] = field(default_factory=list)
+    platforms: List[str] = field(default_factory=list)
+    active: int = 0
+
+    @property
+    def load(self) -> float:
+        return self.active / self.capacity
+
+    def supports(self, platform: str, arch: str) -> bool:
+        # Merged jobs name their architectures as "x64+arm64"
+        return ((not self.architectures or all(a in self.architectures for a in arch.split('+')))
+                and (not self.platforms or platform in self.platforms))
+
+
+class HostPool:
+    """Docker daemons that share a build, each running up to its capacity of targets
+
+    Hosts come from ``docker_hosts`` in .tauridock.yml; an entry without a
+    url is the daemon from the environment::
+
+        docker_hosts:
+          - name: local
+            capacity: 1
+          - name: build-box
+            url: tcp://10.0.0.5:2375
+            capacity: 4
+            architectures: [x64, arm64]
+
+    Each target goes to the compatible host with the lowest active/capacity
+    ratio, waiting while all of them are full. Remote hosts build from copies
+    of the sources instead of bind mounts.
+    """
+
+    def __init__(self, hosts: List[DockerHost]):
+        self.hosts = hosts
+        self._changed = threading.Condition()
+
+    @classmethod
+    def from_config(cls, config: BuildConfig, local_manager: DockerManager,
+                    client_factory: Optional[Callable[[str], object]] = None) -> 'HostPool':
+        """Connect to the configured hosts, skipping unreachable ones"""
+        if client_factory is None:
+            def client_factory(url):
+                return docker.DockerClient(base_url=url)
+
+        hosts = []
+        for entry in config.docker_hosts:
+            if isinstance(entry, str):
+                entry = {'url': entry}
+            url = entry.get('url')
+            name = entry.get('name') or url or 'local'
+
+            if url in (None, 'local'):
+                manager = local_manager
+            else:
+                try:
+                    client = client_factory(url)
+                    client.ping()
+                except Exception as e:
+                    logger.warning(f"Skipping unreachable Docker host {name} ({url}): {e}")
+                    continue
+                manager = DockerManager(config, client=client, remote=True, context=local_manager.context)
+
+            hosts.append(DockerHost(
+                name=name,
+                manager=manager,
+                capacity=max(1, int(entry.get('capacity', 1))),
+                architectures=list(entry.get('architectures') or []),
+                platforms=list(entry.get('platforms') or []),
+            ))
+
+        if not hosts:
+            logger.error("None of the configured Docker hosts are reachable")
+            sys.exit(1)
+
+        logger.info("🖥️  Docker hosts: " + ', '.join(f"{h.name} (x{h.capacity})" for h in hosts))
+        return cls(hosts)
+
+    @property
+    def capacity(self) -> int:
+        return sum(host.capacity for host in self.hosts)
+
+    @contextmanager
+    def acquire(self, platform: str, arch: str):
+        """Reserve a slot on the least-loaded host that can build platform/arch"""
+        compatible = [host for host in self.hosts if host.supports(platform, arch)]
+        if not compatible:
+            raise RuntimeError(f"No Docker host is configured for {platform}/{arch}")
+
+        with self._changed:
+            self._changed.wait_for(lambda: any(host.active < host.capacity for host in compatible))
+            host = min((h for h in compatible if h.active < h.capacity),
+                       key=lambda h: (h.load, -h.capacity))
+            host.active += 1
+            metrics.set('tauridock_host_builds_active', host.active, host=host.name)
+
+        try:
+            yield host
+        finally:
+            with self._changed:
+                host.active -= 1
+                metrics.set('tauridock_host_builds_active', host.active, host=host.name)
+                self._changed.notify_all()
+
+    def close(self):
+        for host in self.hosts:
+            if host.manager.remote:
+                host.manager.close()
+
+
+@dataclass
+class FrontendOutput:
+    """Prebuilt frontend shared read-only by all platform builds"""
+    path: Path
+    dist_dir: str
+
+    def archive(self) -> Path:
+        """Tar of the output for copying into remote containers, written once"""
+        path = self.path.with_name(f"{self.path.name}.tar")
+        if not path.exists():
+            tmp = path.with_name(f"{path.name}.tmp-{os.getpid()}-{threading.get_ident()}")
+            with tarfile.open(tmp, 'w', format=tarfile.PAX_FORMAT) as tar:
+                for child in sorted(self.path.iterdir()):
+                    tar.add(child, arcname=child.name)
+            os.replace(tmp, path)
+        return path
+
+
+class FrontendBuilder:
+    """Builds the frontend once per invocation, cached by lockfile and sources"""
+
+    LOCKFILES = ['package-lock.json', 'pnpm-lock.yaml', 'yarn.lock']
+    # Cached outputs kept by prune(), most recently used first
+    KEEP_OUTPUTS = 3
+    # Outputs used this recently may be mounted into a running build
+    GRACE_PERIOD = 3600
+
+    def __init__(self, config: BuildConfig, docker_manager: DockerManager,
+                 root: Optional[Path] = None, log_consumers: Optional[List[Callable[[str], None]]] = None,
+                 digests: Optional[FileDigests] = None):
+        self.config = config
+        self.docker_manager = docker_manager
+        self.root = (root or Path.cwd()).resolve()
+        self.log_consumers = list(log_consumers or [])
+        self.cache_dir = Path(config.cache_dir) / 'frontend'
+        self.digests = digests
+
+    def build(self, platform: str = 'linux', arch: str = 'x64') -> Optional[FrontendOutput]:
+        """Return the cached frontend output, building it on a cache miss
+
+        npm runs in the image of the given target, which the target build
+        needs anyway, so no extra image is built. Returns None when the
+        project has no npm-built frontend.
+        """
+        dist_dir = self.get_dist_dir()
+        if dist_dir is None or not (self.root / 'package.json').exists():
+            return None
+
+        cached = self.cache_dir / self.fingerprint(dist_dir)
+        if cached.exists():
+            # The mtime is the output's last use for prune()
+            os.utime(cached)
+            logger.info("♻️  Frontend is up to date")
+            metrics.inc('tauridock_cache_requests_total', cache='frontend', result='hit')
+            return FrontendOutput(cached, dist_dir)
+        metrics.inc('tauridock_cache_requests_total', cache='frontend', result='miss')
+
+        logger.info("🎨 Building frontend")
+        image_tag = self.docker_manager.build_image(platform, arch)
+
+        volumes = {str(self.root): {'bind': '/app', 'mode': 'rw'}}
+        environment = {}
+        if self.config.cache_volumes:
+            npm_cache = self.docker_manager.cache_volumes.ensure('tauridock-npm-cache', 'npm')
+            volumes[npm_cache] = {'bind': '/cache/npm', 'mode': 'rw'}
+            environment['npm_config_cache'] = '/cache/npm'
+
+        log_path = Path(self.config.cache_dir) / 'logs' / 'frontend.log.gz'
+        errors = ErrorPatternMatcher()
+        status, logs = self.docker_manager.run_container(
+            image=image_tag,
+            command='cd /app && npm install && npm run build',
+            volumes=volumes,
+            environment=environment,
+            log=BuildLog(log_path, consumers=[
+                errors,
+                lambda line: logger.debug(f"[frontend] {line}"),
+                *[lambda line, c=consumer: c(f"[frontend] {line}") for consumer in self.log_consumers],
+            ])
+        )
+
+        output = self.root / dist_dir
+        if status != 0 or not output.is_dir():
+            logger.error(f"Frontend build failed (full log: {log_path})")
+            for line in errors.matches:
+                logger.error(f"  {line}")
+            logger.debug(logs)
+            raise RuntimeError(f"Frontend build failed with status {status}")
+
+        tmp = cached.with_name(f"{cached.name}.tmp-{os.getpid()}-{threading.get_ident()}")
+        shutil.rmtree(tmp, ignore_errors=True)
+        shutil.copytree(output, tmp)
+        os.replace(tmp, cached)
+
+        return FrontendOutput(cached, dist_dir)
+
+    @classmethod
+    def prune(cls, cache_dir: Path, keep: int = KEEP_OUTPUTS) -> int:
+        """Remove cached outputs beyond the newest ``keep`` and stale partial copies
+
+        Returns the bytes freed.
+        """
+        if not cache_dir.is_dir():
+            return 0
+        now = time.time()
+        outputs = sorted((path for path in cache_dir.iterdir() if path.is_dir()),
+                         key=lambda path: path.stat().st_mtime, reverse=True)
+        complete = [path for path in outputs if '.tmp-' not in path.name]
+        stale = [path for path in outputs if path not in complete[:keep]]
+
+        freed = 0
+        for path in stale:
+            if now - path.stat().st_mtime < cls.GRACE_PERIOD:
+                continue
+            freed += sum(f.stat().st_size for f in path.rglob('*') if f.is_file())
+            logger.debug(f"Removing cached frontend {path.name[:12]}")
+            shutil.rmtree(path, ignore_errors=True)
+        return freed
+
+    def get_dist_dir(self) -> Optional[str]:
+        """Resolve the frontend output dir from tauri.conf.json, relative to the project"""
+        tauri_config = ConfigManager.get_tauri_config(self.root / 'src-tauri' / 'tauri.conf.json')
+        build = tauri_config.get('build', {})
+        dist = build.get('frontendDist') or build.get('distDir')
+
+        # Dev server URLs and inline asset lists are not built by npm
+        if not isinstance(dist, str) or '://' in dist:
+            return None
+
+        path = (self.root / 'src-tauri' / dist).resolve()
+        try:
+            return path.relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+
+    def fingerprint(self, dist_dir: str) -> str:
+        """Hash lockfiles and frontend sources (everything outside src-tauri)"""
+        sha256 = hashlib.sha256()
+        for name in ['package.json'] + self.LOCKFILES:
+            lockfile = self.root / name
+            if lockfile.exists():
+                digest = self.digests.get(lockfile) if self.digests else file_digest(lockfile)
+                sha256.update(f"{name}:{digest}\n".encode('utf-8'))
+
+        sources = tree_digest(self.root, excluded_paths=(
+            self.root / 'src-tauri',
+            self.root / dist_dir,
+            Path(self.config.cache_dir),
+            self.config.output_dir,
+        ), digests=self.digests)
+        sha256.update(sources.encode('ascii'))
+        return sha256.hexdigest()
+
+
 class PlatformBuilder:
     """Handles platform-specific build logic"""
 
@@ -225,82 +2510,882 @@ class PlatformBuilder:
         }
     }
 
-    def __init__(self, config: BuildConfig, docker_manager: DockerManager):
+    def __init__(self, config: BuildConfig, docker_manager: DockerManager,
+                 manifest: Optional[ArtifactManifest] = None,
+                 log_consumers: Optional[List[Callable[[str], None]]] = None,
+                 store: Optional['ArtifactStore'] = None, digests: Optional[FileDigests] = None):
         self.config = config
         self.docker_manager = docker_manager
+        self.manifest = manifest if manifest is not None else ArtifactManifest()
+        # Artifacts are placed in the output directory as links into the store
+        self.store = store
+        self.log_consumers = list(log_consumers or [])
+        self.frontend_output: Optional[FrontendOutput] = None
+        self.timings: Dict[str, float] = {}
+        # Project sources copied into containers on remote hosts
+        self.sources = BuildContext(Path.cwd(), None, config.cache_dir,
+                                    excluded_paths=(config.cache_dir, config.output_dir), digests=digests)
+
+    def build_for_platform(self, platform: str, arch: str, host: Optional[DockerHost] = None) -> List[Path]:
+        """Build Tauri app for specific platform and architecture
+
+        Runs on the given host when dispatched through a HostPool, otherwise
+        on the local daemon.
+        """
+        return self._build_targets(platform, [arch], host)[arch]
+
+    def build_merged(self, platform: str, archs: List[str],
+                     host: Optional[DockerHost] = None) -> Dict[str, List[Path]]:
+        """Build several architectures of a platform in one container run
 
-    def build_for_platform(self, platform: str, arch: str) -> List[Path]:
-        """Build Tauri app for specific platform and architecture"""
-        logger.info(f"🔨 Building for {platform}/{arch}")
+        The targets are compiled one after another into a shared
+        CARGO_TARGET_DIR, so build scripts, proc-macros and the frontend are
+        built once. The image of the first architecture is used for all of
+        them. Returns the artifacts per architecture; a failure fails them all.
+        """
+        return self._build_targets(platform, archs, host)
+
+    def _build_targets(self, platform: str, archs: List[str],
+                       host: Optional[DockerHost]) -> Dict[str, List[Path]]:
+        docker_manager = host.manager if host else self.docker_manager
+        remote = docker_manager.remote
+        merged = len(archs) > 1
+        label = '+'.join(archs)
+        logger.info(f"🔨 Building for {platform}/{label}" + (f" on {host.name}" if host else ""))
 
         # Get platform-specific configuration
-        platform_config = self.PLATFORM_CONFIG[platform]
-        rust_target = platform_config['rust_target'][arch]
+        rust_targets = self.PLATFORM_CONFIG[platform]['rust_target']
 
-        # Build Docker image
-        image_tag = self.docker_manager.build_image(platform, arch)
+        key = f"{platform}-{label}"
 
-        # Prepare build command
-        build_cmd = self._prepare_build_command(platform, arch, rust_target)
+        with tracer.span('target', target=key, host=host.name if host else 'local') as span:
+            # Build Docker image
+            with timed(self.timings, f"{key}:image"):
+                image_tag = docker_manager.build_image(platform, archs[0])
 
-        # Run build in container
-        status, logs = self.docker_manager.run_container(
-            image=image_tag,
-            command=build_cmd,
-            volumes={
-                str(Path.cwd()): {'bind': '/app', 'mode': 'rw'}
-            }
-        )
+            # Prepare build command; remote and merged builds always export bundles per arch
+            toolchain = docker_manager.toolchains.get(image_tag)
+            build_cmd = ' && '.join(
+                self._prepare_build_command(platform, arch, rust_targets[arch],
+                                            export_bundle=self.config.cache_volumes or remote or merged,
+                                            toolchain=toolchain, frontend_built=i > 0)
+                for i, arch in enumerate(archs)
+            )
 
-        if status != 0:
-            logger.error(f"Build failed for {platform}/{arch}")
-            logger.debug(logs)
-            raise RuntimeError(f"Build failed with status {status}")
+            volumes = {} if remote else {str(Path.cwd()): {'bind': '/app', 'mode': 'rw'}}
+            environment = {}
+            if self.config.cache_volumes:
+                cache_mounts, environment = docker_manager.cache_volumes.get_mounts(
+                    platform, '-'.join(archs), self.config.docker_image, sccache=self.config.sccache,
+                    project=Path.cwd()
+                )
+                volumes.update(cache_mounts)
+            elif remote or merged:
+                environment['CARGO_TARGET_DIR'] = '/app/src-tauri/target'
 
-        # Collect artifacts
-        artifacts = self._collect_artifacts(platform, arch)
-        logger.info(f"✅ Built {len(artifacts)} artifacts for {platform}/{arch}")
+            uploads = []
+            if remote:
+                with timed(self.timings, f"{key}:sources"):
+                    uploads.append(('/app', self.sources.build().path))
+                    if self.frontend_output:
+                        uploads.append((f'/app/{self.frontend_output.dist_dir}', self.frontend_output.archive()))
+            elif self.frontend_output:
+                volumes[str(self.frontend_output.path.resolve())] = {
+                    'bind': f'/app/{self.frontend_output.dist_dir}', 'mode': 'ro'
+                }
 
-        return artifacts
+            # Run build in container
+            log_path = self.config.cache_dir / 'logs' / f'{key}.log.gz'
+            errors = ErrorPatternMatcher()
+            progress = BuildProgressParser(lambda phase: logger.info(f"⏳ {platform}/{label}: {phase}"))
+            build_log = BuildLog(log_path, consumers=[
+                progress,
+                errors,
+                lambda line: logger.debug(f"[{platform}/{label}] {line}"),
+                *[lambda line, c=consumer: c(f"[{platform}/{label}] {line}") for consumer in self.log_consumers],
+            ])
+
+            if remote:
+                downloads = []
+                for arch in archs:
+                    release_dir = Path('target') / f'{platform}-{arch}' / 'release'
+                    shutil.rmtree(release_dir / 'bundle', ignore_errors=True)
+                    downloads.append((f'/app/target/{platform}-{arch}/release/bundle', release_dir))
+                status, logs = docker_manager.run_with_archives(
+                    image=image_tag,
+                    command=build_cmd,
+                    uploads=uploads,
+                    downloads=downloads,
+                    volumes=volumes,
+                    environment=environment,
+                    log=build_log
+                )
+            else:
+                status, logs = docker_manager.run_container(
+                    image=image_tag,
+                    command=build_cmd,
+                    volumes=volumes,
+                    environment=environment,
+                    log=build_log
+                )
+            for phase, seconds in progress.finish().items():
+                self.timings[f"{key}:{phase}"] = seconds
+            for phase, phase_start, phase_end in progress.intervals:
+                tracer.record(phase, phase_start, phase_end, target=key)
+            if progress.crates_compiled:
+                # Crates fetched during the build missed the persistent registry cache
+                metrics.inc('tauridock_cache_requests_total', cache='dependencies',
+                            result='miss' if progress.crates_downloaded else 'hit')
+
+            if status != 0:
+                logger.error(f"Build failed for {platform}/{label} (full log: {log_path})")
+                for line in errors.matches:
+                    logger.error(f"  {line}")
+                logger.debug(logs)
+                raise RuntimeError(f"Build failed with status {status}")
+
+            # Collect artifacts, split back out per architecture
+            artifacts = {}
+            for arch in archs:
+                with timed(self.timings, f"{platform}-{arch}:collect"):
+                    artifacts[arch] = self._collect_artifacts(platform, arch)
+                logger.info(f"✅ Built {len(artifacts[arch])} artifacts for {platform}/{arch}")
+            span.set_attribute('artifacts', sum(len(paths) for paths in artifacts.values()))
+
+            return artifacts
+
+    def _prepare_build_command(self, platform: str, arch: str, rust_target: str,
+                               export_bundle: Optional[bool] = None,
+                               toolchain: Optional[Dict] = None,
+                               frontend_built: bool = False) -> str:
+        """Prepare build command with all necessary flags
+
+        Setup steps already satisfied by the image's toolchain manifest are
+        skipped; without a manifest every step runs. ``frontend_built`` marks
+        later targets of a merged build, which reuse the frontend in the tree.
+        """
+        if export_bundle is None:
+            export_bundle = self.config.cache_volumes
+        prebuilt = self.frontend_output is not None or frontend_built
+        cmd_parts = ['cd /app &&']
+
+        if not prebuilt:
+            if toolchain and not toolchain.get('node'):
+                logger.warning(f"No Node.js in the {platform}/{arch} image, the frontend build will fail")
+            cmd_parts.extend(['npm install &&', 'npm run build &&'])
 
-    def _prepare_build_command(self, platform: str, arch: str, rust_target: str) -> str:
-        """Prepare build command with all necessary flags"""
-        cmd_parts = [
-            'cd /app &&',
-            'npm install &&',
-            'npm run build &&',
-            f'rustup target add {rust_target} &&',
+        if not toolchain or rust_target not in toolchain.get('targets', []):
+            cmd_parts.append(f'rustup target add {rust_target} &&')
+        if toolchain and not toolchain.get('tauri'):
+            cmd_parts.append('cargo install tauri-cli --locked &&')
+
+        if export_bundle:
+            # The target dir outlives this build; drop bundles of earlier versions
+            cmd_parts.append(f'rm -rf $CARGO_TARGET_DIR/{rust_target}/release/bundle &&')
+
+        cmd_parts.extend([
             'cargo tauri build',
             f'--target {rust_target}'
-        ]
+        ])
+
+        if prebuilt:
+            # The frontend is already built; skip beforeBuildCommand
+            cmd_parts.append(f"--config '{json.dumps({'build': {'beforeBuildCommand': ''}})}'")
+
+        if self.config.optimize:
+            cmd_parts.append('--release')
+
+        if platform in self.config.bundle_types:
+            for bundle in self.config.bundle_types[platform]:
+                cmd_parts.append(f'--bundles {bundle}')
+
+        if export_bundle:
+            # The target dir is on a cache volume or in a remote copy; export bundles to the project
+            bundle_dest = f'/app/target/{platform}-{arch}/release'
+            cmd_parts.extend([
+                f'&& mkdir -p {bundle_dest}',
+                f'&& rm -rf {bundle_dest}/bundle',
+                f'&& cp -r $CARGO_TARGET_DIR/{rust_target}/release/bundle {bundle_dest}/',
+            ])
+
+        return ' '.join(cmd_parts)
+
+    def _collect_artifacts(self, platform: str, arch: str) -> List[Path]:
+        """Collect built artifacts from output directory"""
+        target_dir = Path('target') / f'{platform}-{arch}' / 'release' / 'bundle'
+        sources = []
+
+        if target_dir.exists():
+            for bundle_type in self.config.bundle_types.get(platform, []):
+                bundle_dir = target_dir / bundle_type
+                if bundle_dir.exists():
+                    sources.extend(file for file in bundle_dir.glob('*') if file.is_file())
+
+        if not sources:
+            return []
+
+        dest_dir = self.config.output_dir / platform
+        dest_dir.mkdir(parents=True, exist_ok=True)
+
+        # Link or copy into the output directory, hashing in the same pass
+        collect = self.store.collect if self.store else collect_file
+        with ThreadPoolExecutor(max_workers=min(8, len(sources))) as executor:
+            records = list(executor.map(tracer.bind(
+                lambda file: collect(file, dest_dir / file.name, self.config.blake3)),
+                sources
+            ))
+
+        for record in records:
+            self.manifest.add(record)
+
+        return [record.path for record in records]
+
+
+class FileWatcher:
+    """Reports debounced batches of paths changed below a directory
+
+    Uses watchdog (inotify, FSEvents or ReadDirectoryChangesW) when it is
+    installed, so an idle tree costs no CPU, and falls back to polling file
+    stats otherwise. Ignored directories are never watched. A batch is handed
+    out once no event has arrived for ``debounce`` seconds, or ``max_delay``
+    after its first event during a steady stream of changes.
+    """
+
+    IGNORED = (
+        '.git', '**/node_modules', '**/target', '.tauri-cache', '**/__pycache__',
+        '**/*.swp', '**/*.swx', '**/*~', '**/.#*', '**/4913', '**/.DS_Store',
+    )
+    EVENT_TYPES = ('created', 'modified', 'deleted', 'moved')
+
+    def __init__(self, root: Path, debounce: float = 0.3, max_delay: float = 2.0,
+                 excluded_paths: Tuple[Path, ...] = (), poll_interval: float = 1.0,
+                 backend: Optional[str] = None):
+        self.root = root.resolve()
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+
+        patterns = list(self.IGNORED)
+        for path in excluded_paths:
+            try:
+                patterns.append(Path(path).resolve().relative_to(self.root).as_posix())
+            except ValueError:
+                pass
+        self.ignore = DockerIgnore(patterns)
+
+        if backend is None:
+            try:
+                import watchdog  # noqa: F401
+                backend = 'watchdog'
+            except ImportError:
+                backend = 'poll'
+        self.backend = backend
+
+        self._pending = set()
+        self._first_event = self._last_event = 0.0
+        self._changed = threading.Condition()
+        self._stopped = threading.Event()
+        self._observer = None
+        self._handler = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self) -> 'FileWatcher':
+        if self.backend == 'watchdog':
+            self._start_watchdog()
+        else:
+            logger.warning("watchdog is not installed, polling for changes (pip install watchdog)")
+            snapshot = self._scan()
+            threading.Thread(target=self._poll_loop, args=(snapshot,), daemon=True).start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        if self._observer:
+            self._observer.stop()
+            self._observer.join()
+        with self._changed:
+            self._changed.notify_all()
+
+    def record(self, path: str):
+        """Queue a changed path, absolute or relative to the root, unless it is ignored"""
+        rel = os.path.relpath(os.path.join(self.root, path), self.root).replace(os.sep, '/')
+        if rel in ('.', '..') or rel.startswith('../') or self.ignore.excluded(rel):
+            return
+
+        now = time.monotonic()
+        with self._changed:
+            if not self._pending:
+                self._first_event = now
+            self._pending.add(rel)
+            self._last_event = now
+            self._changed.notify_all()
+
+    def wait(self, timeout: Optional[float] = None) -> List[str]:
+        """Block until a batch is ready and return it; empty on timeout or stop"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._changed:
+            while not self._stopped.is_set():
+                now = time.monotonic()
+                delay = None
+                if self._pending:
+                    ready_at = min(self._last_event + self.debounce, self._first_event + self.max_delay)
+                    if now >= ready_at:
+                        batch = sorted(self._pending)
+                        self._pending.clear()
+                        return batch
+                    delay = ready_at - now
+                if deadline is not None:
+                    if now >= deadline:
+                        return []
+                    delay = deadline - now if delay is None else min(delay, deadline - now)
+                self._changed.wait(delay)
+        return []
+
+    def _walk(self):
+        """Yield (directory, relative prefix, file names), pruning ignored directories"""
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            rel_dir = os.path.relpath(dirpath, self.root).replace(os.sep, '/')
+            prefix = '' if rel_dir == '.' else f"{rel_dir}/"
+            dirnames[:] = [name for name in dirnames if not self.ignore.excluded(prefix + name)]
+            yield dirpath, prefix, filenames
+
+    def _start_watchdog(self):
+        from watchdog.observers import Observer
+        from watchdog.events import FileSystemEventHandler
+
+        watcher = self
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.event_type not in watcher.EVENT_TYPES:
+                    return
+                for path in (event.src_path, getattr(event, 'dest_path', '')):
+                    if not path:
+                        continue
+                    if event.is_directory:
+                        if event.event_type in ('created', 'moved') and os.path.isdir(path):
+                            watcher._schedule(path)
+                        continue
+                    watcher.record(path)
+
+        self._handler = Handler()
+        self._observer = Observer()
+        # One non-recursive watch per directory keeps node_modules and target unwatched
+        for dirpath, _, _ in self._walk():
+            self._observer.schedule(self._handler, dirpath, recursive=False)
+        self._observer.start()
+
+    def _schedule(self, directory: str):
+        rel = os.path.relpath(directory, self.root).replace(os.sep, '/')
+        if rel.startswith('..') or self.ignore.excluded(rel):
+            return
+        for dirpath, dirnames, filenames in os.walk(directory):
+            dirnames[:] = [
+                name for name in dirnames
+                if not self.ignore.excluded(os.path.relpath(os.path.join(dirpath, name), self.root)
+                                            .replace(os.sep, '/'))
+            ]
+            self._observer.schedule(self._handler, dirpath, recursive=False)
+            # Files created before the watch was in place
+            for name in filenames:
+                self.record(os.path.join(dirpath, name))
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        for dirpath, prefix, filenames in self._walk():
+            for name in filenames:
+                try:
+                    stat = os.stat(os.path.join(dirpath, name))
+                except OSError:
+                    continue
+                snapshot[prefix + name] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def _poll_loop(self, snapshot: Dict[str, Tuple[int, int]]):
+        while not self._stopped.wait(self.poll_interval):
+            current = self._scan()
+            for rel in snapshot.keys() | current.keys():
+                if snapshot.get(rel) != current.get(rel):
+                    self.record(rel)
+            snapshot = current
+
+
+class DevSession:
+    """Development container kept in sync with the project by a FileWatcher
+
+    Each batch of changes is classified and only the cheapest action that
+    covers all of it runs:
+
+        frontend  touch the files inside the container, so the dev server
+                  sees them even through bind mounts that drop events
+        rust      incremental cargo build in the running container, then a
+                  restart of the dev process if it compiled
+        config    reinstall npm dependencies and restart the dev process
+        docker    rebuild the image and recreate the container
+
+    The container runs ``tauri dev`` in a loop, in its own process group,
+    so a restart kills just that group instead of the whole container.
+    """
+
+    KINDS = ('frontend', 'rust', 'config', 'docker')  # cheapest first
+    CONFIG_FILES = {'package.json', 'package-lock.json', 'pnpm-lock.yaml', 'yarn.lock', '.env'}
+    # The project config can change the image or container settings
+    DOCKER_FILES = {'.dockerignore', '.tauridock.yml'}
+    PID_FILE = '/tmp/tauridock-dev.pid'
+    # tauri dev's own watcher is off; rebuilds and restarts are driven from here
+    DEV_COMMAND = (f'cd /app && npm install && while true; do '
+                   f'setsid cargo tauri dev --no-watch & echo $! > {PID_FILE}; wait $!; sleep 1; done')
+    RESTART_COMMAND = f'kill -TERM -"$(cat {PID_FILE})"'
+    INSTALL_COMMAND = 'cd /app && npm install'
+    REBUILD_COMMAND = 'cd /app/src-tauri && cargo build'
+
+    def __init__(self, config: BuildConfig, docker_manager: DockerManager,
+                 root: Optional[Path] = None, watcher: Optional[FileWatcher] = None):
+        self.config = config
+        self.docker_manager = docker_manager
+        self.root = (root or Path.cwd()).resolve()
+        self.watcher = watcher or FileWatcher(self.root, excluded_paths=(config.cache_dir, config.output_dir))
+        try:
+            self.dockerfile = config.dockerfile.resolve().relative_to(self.root).as_posix()
+        except ValueError:
+            logger.warning(f"{config.dockerfile} is outside {self.root}, changes to it are not watched")
+            self.dockerfile = None
+        self.rebuild_command = self._rebuild_command()
+        self.image: Optional[str] = None
+        self.container = None
+        self._logs_since = 0
+        self._stopped = threading.Event()
+
+    def classify(self, path: str) -> str:
+        if path == self.dockerfile or path in self.DOCKER_FILES:
+            return 'docker'
+        if path in self.CONFIG_FILES or re.match(r'src-tauri/tauri(\.[\w-]+)?\.conf\.json5?$', path):
+            return 'config'
+        if path.startswith('src-tauri/'):
+            return 'rust'
+        return 'frontend'
+
+    def plan(self, paths: List[str]) -> str:
+        """Kind of action for a batch: the most expensive kind among its paths"""
+        return max((self.classify(path) for path in paths), key=self.KINDS.index)
+
+    def run(self):
+        """Start the container and apply changes until interrupted"""
+        from rich.panel import Panel
+
+        self.start()
+        console.print(Panel.fit(
+            f"🚀 Development server started!\n"
+            f"Frontend: http://localhost:{self.config.frontend_port}\n"
+            f"Tauri Dev: http://localhost:1420\n\n"
+            f"Watching {self.root} ({self.watcher.backend}), press Ctrl+C to stop",
+            title="Tauri Development Mode"
+        ))
+
+        try:
+            with self.watcher:
+                while True:
+                    paths = self.watcher.wait()
+                    if paths:
+                        self.apply(paths)
+        except KeyboardInterrupt:
+            console.print("\n⏹️  Stopping development server...")
+        finally:
+            self.stop()
+
+    def start(self):
+        self.image = self.docker_manager.build_image('linux', 'x64')
+        self._start_container()
+        threading.Thread(target=self._stream_logs, daemon=True).start()
+
+    def stop(self):
+        self._stopped.set()
+        if self.container is not None:
+            self.container.remove(force=True)
+            self.container = None
+
+    def apply(self, paths: List[str]) -> str:
+        """Run the action for a batch of changed paths and return its kind"""
+        kind = self.plan(paths)
+        shown = ', '.join(paths[:3]) + (f" and {len(paths) - 3} more" if len(paths) > 3 else '')
+        logger.info(f"🔄 {kind} change: {shown}")
+
+        with tracer.span('dev reload', kind=kind, files=len(paths)):
+            if kind == 'frontend':
+                self._touch(paths)
+            elif kind == 'rust':
+                self._rebuild()
+            elif kind == 'config':
+                self._restart(reinstall=True)
+            else:
+                self._recreate()
+        return kind
+
+    def _touch(self, paths: List[str]):
+        existing = [path for path in paths if (self.root / path).exists()]
+        if existing:
+            self.docker_manager.exec_command(
+                self.container, 'touch -c -- ' + ' '.join(shlex.quote(f'/app/{path}') for path in existing)
+            )
+
+    def _rebuild_command(self) -> str:
+        """cargo build with the features tauri dev compiles with, so its build is reused
+
+        tauri dev drops the default features (custom-protocol) when the dev
+        server is a URL; a plain cargo build would compile a second time.
+        """
+        try:
+            build = json.loads((self.root / 'src-tauri' / 'tauri.conf.json').read_text()).get('build', {})
+        except (OSError, ValueError):
+            return self.REBUILD_COMMAND
+        dev_url = build.get('devUrl') or build.get('devPath') or ''
+        if re.match(r'https?://', dev_url):
+            return f'{self.REBUILD_COMMAND} --no-default-features'
+        return self.REBUILD_COMMAND
+
+    def _rebuild(self):
+        status = self.docker_manager.exec_command(self.container, self.rebuild_command, on_output=self._print)
+        if status != 0:
+            logger.error("❌ cargo build failed, keeping the running app")
+            return
+        self._restart()
+
+    def _restart(self, reinstall: bool = False):
+        """Restart the dev process, falling back to the container if it is not running"""
+        if reinstall and self.docker_manager.exec_command(
+                self.container, self.INSTALL_COMMAND, on_output=self._print) != 0:
+            logger.error("❌ npm install failed, keeping the running app")
+            return
+        if self.docker_manager.exec_command(self.container, self.RESTART_COMMAND) != 0:
+            self._logs_since = int(time.time())
+            self.container.restart(timeout=5)
+
+    def _recreate(self):
+        previous = self.docker_manager.image_digests.get(self.image)
+        self.image = self.docker_manager.build_image('linux', 'x64')
+        if self.docker_manager.image_digests.get(self.image) == previous:
+            logger.info("♻️  Image unchanged, restarting")
+            self._restart()
+            return
+        self.container.remove(force=True)
+        self._start_container()
+
+    def _start_container(self):
+        self._logs_since = int(time.time())
+        self.container = self.docker_manager.start_dev_container(self.image, self.root, self.DEV_COMMAND)
+
+    def _stream_logs(self):
+        """Follow the container's output across restarts and recreation"""
+        while not self._stopped.is_set():
+            container = self.container
+            if container is None:
+                return
+            try:
+                for chunk in container.logs(stream=True, follow=True, since=self._logs_since):
+                    self._print(chunk)
+            except Exception as e:
+                logger.debug(f"Log stream ended: {e}")
+            self._stopped.wait(1.0)
+
+    @staticmethod
+    def _print(chunk: bytes):
+        console.print(chunk.decode('utf-8', errors='replace').rstrip(), markup=False, highlight=False)
+
+
+class RetryableUploadError(Exception):
+    """Transient upload failure that should be retried"""
+
+
+class ReleaseUploader:
+    """Parallel, resumable uploader for GitHub release assets
+
+    Talks to the REST API directly over a pooled session so uploads can run
+    concurrently and be retried per asset. Assets already present on the
+    release with a matching size and checksum are skipped.
+    """
+
+    CHECKSUMS_NAME = 'SHA256SUMS'
+
+    def __init__(self, token: str, repo: str, api_url: str = 'https://api.github.com',
+                 concurrency: int = 4, max_retries: int = 3, backoff: float = 1.0):
+        self.repo = repo
+        self.api_url = api_url.rstrip('/')
+        self.concurrency = max(1, concurrency)
+        self.max_retries = max_retries
+        self.backoff = backoff
+
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.concurrency,
+            pool_maxsize=self.concurrency
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'Authorization': f'Bearer {token}',
+            'Accept': 'application/vnd.github+json',
+        })
+
+    def upload(self, release_id: int, upload_url: str, files: Dict[Path, str],
+               on_complete: Optional[Callable[[Path, str], None]] = None,
+               digests: Optional[Dict[Path, str]] = None) -> Dict[str, str]:
+        """Upload files (mapped to their labels) plus a combined SHA256SUMS manifest
+
+        Known SHA256 digests can be passed to avoid re-reading the files.
+        Returns the outcome per asset name: ``uploaded``, ``skipped`` or ``failed``.
+        """
+        batch = self.start(release_id, upload_url)
+        batch.add(files, on_complete=on_complete, digests=digests)
+        return batch.finish()
+
+    def start(self, release_id: int, upload_url: str) -> 'UploadBatch':
+        """Begin uploading to a release; files can be added while earlier ones upload"""
+        return UploadBatch(self, release_id, upload_url)
+
+    def _upload_file(self, release_id: int, upload_url: str, file_path: Path, label: str,
+                     existing: Optional[Dict], known_checksums: Dict[str, str],
+                     digest: Optional[str] = None) -> Tuple[str, str]:
+        with tracer.span('upload', file=file_path.name) as span:
+            digest = digest or file_digest(file_path)
+            size = file_path.stat().st_size
+            span.set_attribute('bytes', size)
+
+            if existing:
+                remote_digest = existing.get('digest') or f"sha256:{known_checksums.get(file_path.name)}"
+                if existing.get('size') == size and remote_digest == f"sha256:{digest}":
+                    logger.debug(f"Skipping {file_path.name}, already uploaded")
+                    span.set_attribute('skipped', True)
+                    return digest, 'skipped'
+                self._delete_asset(existing['id'])
+
+            def post():
+                with open(file_path, 'rb') as f:
+                    self._post_asset(upload_url, file_path.name, f, label=label, size=size)
+
+            self._with_retries(release_id, file_path.name, post)
+            metrics.inc('tauridock_uploaded_bytes_total', size)
+            return digest, 'uploaded'
+
+    def _with_retries(self, release_id: int, name: str, post: Callable[[], None]):
+        """Run an upload, retrying transient failures with exponential backoff"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                return post()
+            except (requests.ConnectionError, requests.Timeout, RetryableUploadError) as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self.backoff * (2 ** attempt)
+                logger.warning(f"Upload of {name} failed ({e}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+                # A failed upload may leave a broken asset behind
+                for asset in self._list_assets(release_id):
+                    if asset['name'] == name:
+                        self._delete_asset(asset['id'])
+
+    def _post_asset(self, upload_url: str, name: str, data, label: str,
+                    content_type: str = 'application/octet-stream', size: Optional[int] = None):
+        headers = {'Content-Type': content_type}
+        if size is not None:
+            headers['Content-Length'] = str(size)
+
+        response = self.session.post(upload_url, params={'name': name, 'label': label},
+                                     data=data, headers=headers)
+        if response.status_code == 429 or response.status_code >= 500:
+            raise RetryableUploadError(f"HTTP {response.status_code}")
+        response.raise_for_status()
+
+    def _list_assets(self, release_id: int) -> List[Dict]:
+        assets = []
+        url = f"{self.api_url}/repos/{self.repo}/releases/{release_id}/assets"
+        params = {'per_page': 100}
+        while url:
+            response = self.session.get(url, params=params)
+            response.raise_for_status()
+            assets.extend(response.json())
+            url = response.links.get('next', {}).get('url')
+            params = None
+        return assets
+
+    def _delete_asset(self, asset_id: int):
+        response = self.session.delete(f"{self.api_url}/repos/{self.repo}/releases/assets/{asset_id}")
+        if response.status_code != 404:
+            response.raise_for_status()
+
+    def _read_checksums(self, asset: Optional[Dict]) -> Dict[str, str]:
+        """Download and parse an existing SHA256SUMS asset"""
+        if not asset:
+            return {}
+
+        response = self.session.get(
+            f"{self.api_url}/repos/{self.repo}/releases/assets/{asset['id']}",
+            headers={'Accept': 'application/octet-stream'}
+        )
+        response.raise_for_status()
+
+        checksums = {}
+        for line in response.text.splitlines():
+            digest, _, name = line.partition('  ')
+            if digest and name:
+                checksums[name] = digest
+        return checksums
+
+    @staticmethod
+    def _format_checksums(checksums: Dict[str, str]) -> str:
+        return ''.join(f"{digest}  {name}\n" for name, digest in sorted(checksums.items()))
+
+
+class UploadBatch:
+    """Uploads to one release that accept more files until finished
+
+    Files start uploading as soon as they are added; SHA256SUMS is written
+    once, by finish().
+    """
+
+    def __init__(self, uploader: ReleaseUploader, release_id: int, upload_url: str):
+        self.uploader = uploader
+        self.release_id = release_id
+        self.upload_url = upload_url.split('{', 1)[0]
+        self.existing = {asset['name']: asset for asset in uploader._list_assets(release_id)}
+        self.known_checksums = uploader._read_checksums(self.existing.get(uploader.CHECKSUMS_NAME))
+        self.checksums: Dict[str, str] = {}
+        self.results: Dict[str, str] = {}
+
+        self._lock = threading.Lock()
+        self._futures: List[Future] = []
+        self._executor = ThreadPoolExecutor(max_workers=uploader.concurrency,
+                                            thread_name_prefix='tauridock-upload')
+
+    def add(self, files: Dict[Path, str], on_complete: Optional[Callable[[Path, str], None]] = None,
+            digests: Optional[Dict[Path, str]] = None):
+        """Queue files (mapped to their labels) for upload without waiting"""
+        digests = digests or {}
+        upload_file = tracer.bind(self.uploader._upload_file)
+        for file_path, label in files.items():
+            future = self._executor.submit(upload_file, self.release_id, self.upload_url, file_path, label,
+                                           self.existing.get(file_path.name), self.known_checksums,
+                                           digests.get(file_path))
+            future.add_done_callback(partial(self._done, file_path, on_complete))
+            self._futures.append(future)
+
+    def finish(self) -> Dict[str, str]:
+        """Wait for all uploads, then write SHA256SUMS and return the outcome per asset"""
+        self._executor.shutdown(wait=True)
+
+        # Keep checksums of assets uploaded by earlier, partial runs
+        manifest = {**self.known_checksums, **self.checksums}
+        for name, outcome in self.results.items():
+            if outcome == 'failed':
+                manifest.pop(name, None)
+        content = self.uploader._format_checksums(manifest)
+        if content != self.uploader._format_checksums(self.known_checksums):
+            name = self.uploader.CHECKSUMS_NAME
+            if name in self.existing:
+                self.uploader._delete_asset(self.existing[name]['id'])
+            self.uploader._with_retries(self.release_id, name, lambda: self.uploader._post_asset(
+                self.upload_url, name, content.encode('utf-8'), label=name, content_type='text/plain'
+            ))
+
+        return dict(self.results)
+
+    def cancel(self):
+        """Drop queued uploads and wait for the running ones, leaving SHA256SUMS alone"""
+        for future in self._futures:
+            future.cancel()
+        self._executor.shutdown(wait=True)
+
+    def _done(self, file_path: Path, on_complete: Optional[Callable[[Path, str], None]], future: Future):
+        if future.cancelled():
+            return
+        try:
+            digest, outcome = future.result()
+        except Exception as e:
+            logger.error(f"Failed to upload {file_path.name}: {e}")
+            digest, outcome = None, 'failed'
+
+        with self._lock:
+            self.results[file_path.name] = outcome
+            if digest:
+                self.checksums[file_path.name] = digest
+
+        if on_complete:
+            on_complete(file_path, outcome)
+
+
+class ReleasePublication:
+    """A GitHub release receiving artifacts, possibly while other targets still build"""
+
+    def __init__(self, config: BuildConfig, release, batch: UploadBatch,
+                 manifest: Optional[ArtifactManifest] = None, publish: bool = False):
+        self.config = config
+        self.release = release
+        self.batch = batch
+        self.manifest = manifest
+        self.publish = publish
+
+    def add(self, key: str, paths: List[Path],
+            on_complete: Optional[Callable[[Path, str], None]] = None):
+        """Start uploading a target's artifacts, reusing digests from collection"""
+        files = {file_path: f"{file_path.name} ({key.split('-')[0]})" for file_path in paths}
+        digests = {}
+        if self.manifest:
+            for file_path in files:
+                record = self.manifest.get(file_path)
+                if record:
+                    digests[file_path] = record.sha256
+
+        if on_complete is None:
+            def on_complete(file_path, outcome):
+                logger.info(f"⬆️  {file_path.name}: {outcome}")
+        self.batch.add(files, on_complete=on_complete, digests=digests)
+
+    def finish(self, failed_targets: Iterable[str] = ()) -> str:
+        """Wait for the uploads and publish the release, returning its URL
+
+        Raises when an upload failed or a target did not build; the release
+        then keeps everything uploaded so far and stays a draft if it is one.
+        """
+        from github import GithubException
 
-        if self.config.optimize:
-            cmd_parts.append('--release')
+        results = self.batch.finish()
+        failed = [name for name, outcome in results.items() if outcome == 'failed']
+        if failed:
+            raise RuntimeError(f"Failed to upload {len(failed)} artifacts: {', '.join(failed)}. "
+                               f"Re-run to resume the release.")
 
-        if platform in self.config.bundle_types:
-            for bundle in self.config.bundle_types[platform]:
-                cmd_parts.append(f'--bundles {bundle}')
+        skipped = sum(1 for outcome in results.values() if outcome == 'skipped')
+        if skipped:
+            logger.info(f"⏭️  Skipped {skipped} artifacts already on the release")
 
-        return ' '.join(cmd_parts)
+        failed_targets = list(failed_targets)
+        if failed_targets:
+            raise RuntimeError(f"{len(failed_targets)} targets failed to build: {', '.join(failed_targets)}. "
+                               f"Uploaded {len(results)} artifacts to {self.release.html_url}; "
+                               f"re-run to complete the release.")
 
-    def _collect_artifacts(self, platform: str, arch: str) -> List[Path]:
-        """Collect built artifacts from output directory"""
-        artifacts = []
-        target_dir = Path('target') / f'{platform}-{arch}' / 'release' / 'bundle'
+        if self.publish:
+            try:
+                with tracer.span('release publish', tag=self.config.release_tag):
+                    self.release = self.release.update_release(
+                        name=self.release.title,
+                        message=self.release.body,
+                        draft=False,
+                        prerelease=self.config.prerelease
+                    )
+            except GithubException as e:
+                logger.error(f"Failed to publish GitHub release: {e}")
+                raise
 
-        if target_dir.exists():
-            for bundle_type in self.config.bundle_types.get(platform, []):
-                bundle_dir = target_dir / bundle_type
-                if bundle_dir.exists():
-                    for file in bundle_dir.glob('*'):
-                        if file.is_file():
-                            # Move to output directory
-                            dest = self.config.output_dir / platform / file.name
-                            dest.parent.mkdir(parents=True, exist_ok=True)
-                            shutil.copy2(file, dest)
-                            artifacts.append(dest)
+        logger.info(f"✅ Release created: {self.release.html_url}")
+        return self.release.html_url
 
-        return artifacts
+    def cancel(self):
+        """Stop uploading after a failure elsewhere"""
+        self.batch.cancel()
 
 
 class GitHubPublisher:
@@ -311,69 +3396,78 @@ class GitHubPublisher:
         if not config.github_token:
             raise ValueError("GitHub token is required for publishing")
 
+        from github import Github
+
         self.github = Github(config.github_token)
         self.repo = self.github.get_repo(config.github_repo)
 
-    def create_release(self, artifacts: Dict[str, List[Path]]) -> str:
+    def create_release(self, artifacts: Dict[str, List[Path]],
+                       manifest: Optional[ArtifactManifest] = None) -> str:
         """Create GitHub release and upload artifacts"""
-        logger.info(f"📦 Creating GitHub release {self.config.release_tag}")
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 
-        try:
-            # Create release
-            release = self.repo.create_git_release(
-                tag=self.config.release_tag,
-                name=self.config.release_tag,
-                message=self._get_release_notes(),
-                draft=self.config.draft,
-                prerelease=self.config.prerelease
-            )
+        publication = self.start_release(manifest)
+        total = sum(len(paths) for paths in artifacts.values())
 
-            # Upload artifacts with progress
-            with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    BarColumn(),
-                    console=console
-            ) as progress:
+        # Upload artifacts with progress
+        with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                console=console
+        ) as progress:
+            task = progress.add_task(f"Uploading {total} artifacts...", total=total)
+            for key, paths in artifacts.items():
+                publication.add(key, paths, on_complete=lambda file_path, outcome: progress.update(task, advance=1))
+            return publication.finish()
 
-                total_files = sum(len(files) for files in artifacts.values())
-                task = progress.add_task(
-                    f"Uploading {total_files} artifacts...",
-                    total=total_files
-                )
+    def start_release(self, manifest: Optional[ArtifactManifest] = None,
+                      pipelined: bool = False) -> 'ReleasePublication':
+        """Get or create the release and return a publication accepting artifacts
 
-                for platform, files in artifacts.items():
-                    for file_path in files:
-                        # Generate checksum
-                        checksum = self._calculate_checksum(file_path)
+        Pipelined publications create the release as a draft, so a partial
+        release is never public; finish() publishes it unless a draft was
+        requested.
+        """
+        from github import GithubException
 
-                        # Upload file
-                        with open(file_path, 'rb') as f:
-                            release.upload_asset(
-                                path=str(file_path),
-                                label=f"{file_path.name} ({platform})",
-                                content_type='application/octet-stream'
-                            )
+        logger.info(f"📦 Creating GitHub release {self.config.release_tag}")
 
-                        # Upload checksum
-                        checksum_file = file_path.with_suffix('.sha256')
-                        checksum_file.write_text(f"{checksum}  {file_path.name}")
+        try:
+            with tracer.span('release create', tag=self.config.release_tag):
+                release = self._get_or_create_release(draft=self.config.draft or pipelined)
+        except GithubException as e:
+            logger.error(f"Failed to create GitHub release: {e}")
+            raise
 
-                        with open(checksum_file, 'rb') as f:
-                            release.upload_asset(
-                                path=str(checksum_file),
-                                label=f"{checksum_file.name}",
-                                content_type='text/plain'
-                            )
+        uploader = ReleaseUploader(
+            self.config.github_token,
+            self.config.github_repo,
+            api_url=self.config.github_api_url,
+            concurrency=self.config.upload_concurrency,
+            max_retries=self.config.upload_retries
+        )
+        return ReleasePublication(self.config, release, uploader.start(release.id, release.upload_url),
+                                  manifest=manifest, publish=not self.config.draft and release.draft)
 
-                        progress.update(task, advance=1)
+    def _get_or_create_release(self, draft: bool = False):
+        """Reuse an existing release for the tag so interrupted uploads can resume"""
+        from github import GithubException
 
-            logger.info(f"✅ Release created: {release.html_url}")
-            return release.html_url
+        try:
+            release = self.repo.get_release(self.config.release_tag)
+            logger.info(f"Resuming existing release {self.config.release_tag}")
+            return release
+        except GithubException:
+            pass
 
-        except GithubException as e:
-            logger.error(f"Failed to create GitHub release: {e}")
-            raise
+        return self.repo.create_git_release(
+            tag=self.config.release_tag,
+            name=self.config.release_tag,
+            message=self._get_release_notes(),
+            draft=draft,
+            prerelease=self.config.prerelease
+        )
 
     def _get_release_notes(self) -> str:
         """Get release notes from file or generate default"""
@@ -390,16 +3484,12 @@ class GitHubPublisher:
 Choose the appropriate installer for your system below.
 
 ## Checksums
-SHA256 checksums are provided for each file.
+SHA256 checksums for all files are listed in `SHA256SUMS`.
 """
 
     def _calculate_checksum(self, file_path: Path) -> str:
         """Calculate SHA256 checksum for file"""
-        sha256 = hashlib.sha256()
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b''):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+        return file_digest(file_path)
 
 
 class ConfigManager:
@@ -409,7 +3499,9 @@ class ConfigManager:
     def load_config_file(config_path: Path = Path('.tauridock.yml')) -> Dict:
         """Load configuration from YAML file"""
         if config_path.exists():
-            with open(config_path) as f:
+            import yaml
+
+            with tracer.span('load config', file=str(config_path)), open(config_path) as f:
                 return yaml.safe_load(f)
         return {}
 
@@ -417,7 +3509,7 @@ class ConfigManager:
     def get_tauri_config(config_path: Path = Path('src-tauri/tauri.conf.json')) -> Dict:
         """Load Tauri configuration"""
         if config_path.exists():
-            with open(config_path) as f:
+            with tracer.span('load config', file=str(config_path)), open(config_path) as f:
                 return json.load(f)
         return {}
 
@@ -425,92 +3517,1047 @@ class ConfigManager:
     def get_package_info(package_path: Path = Path('package.json')) -> Dict:
         """Get package.json information"""
         if package_path.exists():
-            with open(package_path) as f:
+            with tracer.span('load config', file=str(package_path)), open(package_path) as f:
                 return json.load(f)
         return {}
 
 
+class BuildCache:
+    """Content-addressed cache of build artifacts keyed by build-input fingerprints"""
+
+    def __init__(self, config: BuildConfig, root: Optional[Path] = None,
+                 manifest: Optional[ArtifactManifest] = None, digests: Optional[FileDigests] = None):
+        self.config = config
+        self.manifest = manifest
+        self.digests = digests
+        self.root = (root or Path.cwd()).resolve()
+        self.cache_dir = Path(config.cache_dir)
+        self.objects_dir = self.cache_dir / 'objects'
+        self.entries_dir = self.cache_dir / 'entries'
+        self._sources_digest = None
+        self._targets: Dict[str, str] = {}
+
+    def fingerprint(self, platform: str, arch: str) -> str:
+        """Calculate build-input fingerprint for a platform/arch target"""
+        inputs = {
+            'platform': platform,
+            'arch': arch,
+            'bundle_types': self.config.bundle_types.get(platform, []),
+            'optimize': self.config.optimize,
+            'sign': self.config.sign,
+            'app_name': self.config.app_name,
+            'version': self.config.version,
+            'frontend_port': self.config.frontend_port,
+            'docker_image': self.config.docker_image,
+            'dockerfile': file_digest(self.config.dockerfile),
+            'sources': self._get_sources_digest(),
+        }
+        payload = json.dumps(inputs, sort_keys=True).encode('utf-8')
+        fingerprint = hashlib.sha256(payload).hexdigest()
+        self._targets[fingerprint] = f"{platform}-{arch}"
+        return fingerprint
+
+    def restore(self, fingerprint: str, platform: str) -> Optional[List[Path]]:
+        """Restore cached artifacts into the output directory, None on cache miss"""
+        entry_path = self.entries_dir / f"{fingerprint}.json"
+        if not entry_path.exists():
+            return None
+
+        # The entry's mtime is its last use for the artifact store's garbage collection
+        os.utime(entry_path)
+        with tracer.span('cache restore', platform=platform):
+            return self._restore_entry(json.loads(entry_path.read_text()), fingerprint, platform)
+
+    def _restore_entry(self, entry: Dict, fingerprint: str, platform: str) -> Optional[List[Path]]:
+        if not all(self._object_path(a['digest']).exists() for a in entry['artifacts']):
+            logger.debug(f"Cache entry {fingerprint[:12]} is incomplete, ignoring")
+            return None
+
+        restored = []
+        for artifact in entry['artifacts']:
+            dest = self.config.output_dir / platform / artifact['name']
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            self._materialize(self._object_path(artifact['digest']), dest)
+            restored.append(dest)
+            if self.manifest is not None:
+                self.manifest.add(ArtifactRecord(
+                    path=dest,
+                    size=artifact['size'],
+                    sha256=artifact['digest'],
+                    mtime=dest.stat().st_mtime
+                ))
+
+        return restored
+
+    def store(self, fingerprint: str, platform: str, artifacts: List[Path]):
+        """Store built artifacts under the given fingerprint"""
+        with tracer.span('cache store', platform=platform, artifacts=len(artifacts)):
+            self._store_entry(fingerprint, platform, artifacts)
+
+    def _store_entry(self, fingerprint: str, platform: str, artifacts: List[Path]):
+        records = []
+        for file in artifacts:
+            record = self.manifest.get(file) if self.manifest is not None else None
+            digest = record.sha256 if record else file_digest(file)
+            obj = self._object_path(digest)
+            if not obj.exists():
+                obj.parent.mkdir(parents=True, exist_ok=True)
+                tmp = obj.with_name(f"{obj.name}.tmp-{os.getpid()}")
+                shutil.copy2(file, tmp)
+                os.chmod(tmp, 0o444)
+                os.replace(tmp, obj)
+            records.append({'name': file.name, 'digest': digest, 'size': obj.stat().st_size})
+
+        entry = {
+            'platform': platform,
+            'target': self._targets.get(fingerprint, platform),
+            'version': self.config.version,
+            'created': time.time(),
+            'artifacts': records
+        }
+        self.entries_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.entries_dir / f"{fingerprint}.json.tmp-{os.getpid()}"
+        tmp.write_text(json.dumps(entry, indent=2))
+        os.replace(tmp, self.entries_dir / f"{fingerprint}.json")
+
+    def _get_sources_digest(self) -> str:
+        """Hash the project source tree once per build invocation"""
+        if self._sources_digest is None:
+            with tracer.span('hash sources'):
+                self._sources_digest = tree_digest(
+                    self.root, excluded_paths=(self.cache_dir, self.config.output_dir), digests=self.digests
+                )
+        return self._sources_digest
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest
+
+    @staticmethod
+    def _materialize(source: Path, dest: Path):
+        """Hardlink a cached object into place, copying across filesystems"""
+        dest.unlink(missing_ok=True)
+        try:
+            os.link(source, dest)
+        except OSError:
+            shutil.copy2(source, dest)
+
+
+class ArtifactStore:
+    """Content-addressed store of artifacts, indexed by version and target
+
+    Objects are read-only files named by their SHA256 under ``objects/``,
+    shared with the BuildCache, and ``versions/`` holds one index per
+    version. The output directory is materialized as hardlinks to the
+    objects, so garbage collection removes output files linked to the
+    objects it deletes. The mtime of each index (and of each build cache
+    entry) records its last use for garbage collection.
+    """
+
+    # Unreferenced objects younger than this may belong to a build in progress
+    GRACE_PERIOD = 3600
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.objects_dir = self.root / 'objects'
+        self.versions_dir = self.root / 'versions'
+        self.entries_dir = self.root / 'entries'
+        self.patches_dir = self.root / 'deltas'
+
+    def put(self, source: Path, with_blake3: bool = False) -> ArtifactRecord:
+        """Copy (or reflink) a file into the store, hashing it in the same pass
+
+        Objects never share an inode with the source, which a later build
+        could overwrite in place.
+        """
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.objects_dir / f".incoming-{os.getpid()}-{threading.get_ident()}-{source.name}"
+        record = collect_file(source, tmp, with_blake3, hardlink=False)
+        obj = self.object_path(record.sha256)
+        if obj.exists():
+            tmp.unlink()
+        else:
+            obj.parent.mkdir(parents=True, exist_ok=True)
+            os.chmod(tmp, 0o444)
+            os.replace(tmp, obj)
+        return ArtifactRecord(path=obj, size=record.size, sha256=record.sha256,
+                              mtime=obj.stat().st_mtime, blake3=record.blake3)
+
+    def collect(self, source: Path, dest: Path, with_blake3: bool = False) -> ArtifactRecord:
+        """Store source and hardlink dest to its object, like collect_file"""
+        record = self.put(source, with_blake3)
+        self.materialize(record.sha256, dest)
+        return ArtifactRecord(path=dest, size=record.size, sha256=record.sha256,
+                              mtime=dest.stat().st_mtime, blake3=record.blake3)
+
+    def materialize(self, digest: str, dest: Path):
+        """Hardlink an object into place, copying across filesystems"""
+        dest.unlink(missing_ok=True)
+        try:
+            os.link(self.object_path(digest), dest)
+        except OSError:
+            shutil.copy2(self.object_path(digest), dest)
+
+    def add(self, version: str, target: str, paths: List[Path],
+            manifest: Optional[ArtifactManifest] = None) -> List[Dict]:
+        """Record a target's artifacts under version, replacing earlier ones"""
+        records = []
+        for file in paths:
+            record = manifest.get(file) if manifest is not None else None
+            if record is None or not self.object_path(record.sha256).exists():
+                record = self.put(file)
+            records.append({'name': file.name, 'digest': record.sha256, 'size': record.size})
+
+        index = self._load(version) or {'version': version, 'created': time.time(), 'targets': {}}
+        index['targets'][target] = records
+        self._save(version, index)
+        return records
+
+    def get(self, version: str, target: str) -> List[Dict]:
+        """Return the records of a target in version, with the path of each object"""
+        index = self._load(version)
+        if index is None:
+            return []
+        os.utime(self._index_path(version))
+
+        records = []
+        for record in index['targets'].get(target, []):
+            obj = self.object_path(record['digest'])
+            if obj.exists():
+                records.append({**record, 'path': obj})
+        return records
+
+    def versions(self) -> List[str]:
+        """Stored versions, oldest first"""
+        return sorted((unit['name'] for unit in self._units() if unit['kind'] == 'version'),
+                      key=self._version_key)
+
+    def previous_version(self, version: str) -> Optional[str]:
+        """The newest stored version older than version"""
+        older = [v for v in self.versions() if self._version_key(v) < self._version_key(version)]
+        return older[-1] if older else None
+
+    def usage(self) -> List[Dict]:
+        """Versions and build cache entries with their size and last use, largest first"""
+        sizes = self._object_sizes()
+        units = self._units()
+        for unit in units:
+            unit['size'] = sum(sizes.get(digest, 0) for digest in unit['digests'])
+        return sorted(units, key=lambda u: u['size'], reverse=True)
+
+    def gc(self, keep_versions: Optional[int] = None, budget: Optional[int] = None,
+           protect: Iterable[str] = (), linked_dirs: Iterable[Path] = ()) -> Dict[str, int]:
+        """Evict versions and build cache entries, then delete unreferenced objects
+
+        Versions beyond the newest ``keep_versions`` go first, together with
+        the build cache entries built for them. ``keep_versions`` also
+        bounds the cache entries of each target to the most recently used
+        ones, since every source change adds an entry. While the objects
+        still exceed ``budget`` bytes, the least recently used versions and
+        cache entries follow; protected versions are never evicted. Files
+        under ``linked_dirs`` hardlinked to a deleted object are removed
+        with it, so the space is actually freed.
+        """
+        protect = set(protect)
+        units = self._units()
+        versions = sorted((u for u in units if u['kind'] == 'version'),
+                          key=lambda u: self._version_key(u['name']), reverse=True)
+        evicted = []
+        if keep_versions is not None:
+            evicted = [u for u in versions[keep_versions:] if u['name'] not in protect]
+            gone = {u['name'] for u in evicted}
+            entries = {}
+            for unit in sorted((u for u in units if u['kind'] == 'build-cache'),
+                               key=lambda u: u['accessed'], reverse=True):
+                entries.setdefault(unit['targets'][0], []).append(unit)
+            for unit in (u for group in entries.values() for u in group):
+                if unit['version'] in gone or entries[unit['targets'][0]].index(unit) >= keep_versions:
+                    evicted.append(unit)
+
+        sizes = self._object_sizes()
+        remaining = [u for u in units if u not in evicted]
+
+        def used() -> int:
+            live = set().union(*(u['digests'] for u in remaining))
+            return sum(sizes[digest] for digest in live if digest in sizes)
+
+        if budget is not None:
+            candidates = sorted((u for u in remaining if not (u['kind'] == 'version' and u['name'] in protect)),
+                                key=lambda u: u['accessed'])
+            while candidates and used() > budget:
+                unit = candidates.pop(0)
+                remaining.remove(unit)
+                evicted.append(unit)
+
+        for unit in evicted:
+            logger.debug(f"Evicting {unit['kind']} {unit['name']}")
+            unit['path'].unlink(missing_ok=True)
+
+        live = set().union(*(u['digests'] for u in remaining))
+        links = self._hardlinks(linked_dirs)
+        now = time.time()
+        removed = freed = 0
+        for obj in list(self.objects_dir.glob('*/*')) + list(self.objects_dir.glob('.incoming-*')):
+            stat = obj.stat()
+            if obj.name in live or now - stat.st_ctime < self.GRACE_PERIOD:
+                continue
+            for link in links.get((stat.st_dev, stat.st_ino), []):
+                link.unlink(missing_ok=True)
+            obj.unlink()
+            removed += 1
+            freed += stat.st_size
+
+        # Cached patches are only useful between live objects
+        for patch in self.patches_dir.glob('*-*.*'):
+            old, _, new = patch.name.split('.', 1)[0].partition('-')
+            if not any(digest.startswith(old) for digest in live) or \
+                    not any(digest.startswith(new) for digest in live):
+                freed += patch.stat().st_size
+                patch.unlink()
+
+        return {
+            'versions': sum(1 for u in evicted if u['kind'] == 'version'),
+            'entries': sum(1 for u in evicted if u['kind'] == 'build-cache'),
+            'objects': removed,
+            'bytes': freed,
+        }
+
+    def object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest
+
+    def _units(self) -> List[Dict]:
+        """Everything that keeps objects alive: version indexes and build cache entries"""
+        units = []
+        for path in self.versions_dir.glob('*.json'):
+            index = json.loads(path.read_text())
+            units.append({
+                'kind': 'version',
+                'name': index['version'],
+                'path': path,
+                'accessed': path.stat().st_mtime,
+                'targets': sorted(index['targets']),
+                'digests': {r['digest'] for records in index['targets'].values() for r in records},
+            })
+        for path in self.entries_dir.glob('*.json'):
+            entry = json.loads(path.read_text())
+            units.append({
+                'kind': 'build-cache',
+                'name': path.stem[:12],
+                'path': path,
+                'accessed': path.stat().st_mtime,
+                'version': entry.get('version'),
+                'targets': [entry.get('target', entry['platform'])],
+                'digests': {a['digest'] for a in entry['artifacts']},
+            })
+        return units
+
+    def _object_sizes(self) -> Dict[str, int]:
+        return {obj.name: obj.stat().st_size for obj in self.objects_dir.glob('*/*')}
+
+    @staticmethod
+    def _hardlinks(dirs: Iterable[Path]) -> Dict[Tuple[int, int], List[Path]]:
+        links = {}
+        for directory in dirs:
+            for path in Path(directory).rglob('*'):
+                stat = path.lstat()
+                if path.is_file() and stat.st_nlink > 1:
+                    links.setdefault((stat.st_dev, stat.st_ino), []).append(path)
+        return links
+
+    @staticmethod
+    def _version_key(version: str) -> Tuple:
+        return tuple(int(part) for part in re.findall(r'\d+', version)), version
+
+    def _index_path(self, version: str) -> Path:
+        return self.versions_dir / f"{re.sub(r'[^a-zA-Z0-9_.+-]+', '-', version)}.json"
+
+    def _load(self, version: str) -> Optional[Dict]:
+        path = self._index_path(version)
+        return json.loads(path.read_text()) if path.exists() else None
+
+    def _save(self, version: str, index: Dict):
+        path = self._index_path(version)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.tmp-{os.getpid()}-{threading.get_ident()}")
+        tmp.write_text(json.dumps(index, indent=2))
+        os.replace(tmp, path)
+
+
+@dataclass
+class Delta:
+    """Binary patch from an artifact of an earlier release to its new version"""
+    path: Path
+    source: str
+    target: str
+    from_version: str
+    algorithm: str
+    sha256: str
+    size: int
+
+
+class DeltaGenerator:
+    """Binary patches between the artifacts of consecutive releases
+
+    Uses the zstd CLI's patch-from mode when it is on the PATH, otherwise
+    bsdiff4. Patches are verified by applying them, kept per pair of
+    digests so rebuilds reuse them, and dropped when they are not much
+    smaller than the full file.
+
+    zstd patches are applied with ``zstd -d --long=31 --patch-from=OLD``.
+    """
+
+    MAX_RATIO = 0.5
+    EXTENSIONS = {'zstd': 'zstpatch', 'bsdiff': 'bsdiff'}
+    ZSTD_LEVEL = 9
+    # bsdiff holds both files and a suffix array in memory
+    BSDIFF_MAX_SIZE = 256 * 1024 * 1024
+
+    def __init__(self, store: ArtifactStore, manifest: Optional[ArtifactManifest] = None):
+        self.store = store
+        self.patches_dir = store.patches_dir
+        self.manifest = manifest
+        self.algorithm = self.detect()
+        if self.algorithm is None:
+            logger.warning("Neither the zstd CLI nor bsdiff4 is installed, skipping delta updates")
+
+    @staticmethod
+    def detect() -> Optional[str]:
+        if shutil.which('zstd'):
+            return 'zstd'
+        try:
+            importlib.import_module('bsdiff4')
+            return 'bsdiff'
+        except ImportError:
+            return None
+
+    def generate(self, version: str, target: str, paths: List[Path]) -> List[Delta]:
+        """Patch each artifact from its counterpart in the previous stored version"""
+        previous = self.store.previous_version(version)
+        if self.algorithm is None or previous is None:
+            return []
+
+        old_records = {self._normalize(record['name'], previous): record
+                       for record in self.store.get(previous, target)}
+        deltas = []
+        for path in paths:
+            old = old_records.get(self._normalize(path.name, version))
+            if old is None:
+                continue
+            record = self.manifest.get(path) if self.manifest is not None else None
+            digest = record.sha256 if record else file_digest(path)
+            if digest == old['digest']:
+                continue
+
+            with tracer.span('delta', file=path.name, algorithm=self.algorithm):
+                delta = self._generate(path, digest, old, previous)
+            if delta:
+                logger.info(f"🩹 {delta.path.name}: {self._percent(delta.size, path.stat().st_size)} "
+                            f"of {path.name}")
+                deltas.append(delta)
+        return deltas
+
+    def _generate(self, path: Path, digest: str, old: Dict, previous: str) -> Optional[Delta]:
+        extension = self.EXTENSIONS[self.algorithm]
+        cached = self.patches_dir / f"{old['digest'][:16]}-{digest[:16]}.{extension}"
+        if not cached.exists():
+            size = max(path.stat().st_size, old['path'].stat().st_size)
+            if self.algorithm == 'bsdiff' and size > self.BSDIFF_MAX_SIZE:
+                logger.debug(f"{path.name} is too large for bsdiff, install zstd for deltas of large bundles")
+                return None
+
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cached.with_name(f"{cached.name}.tmp-{os.getpid()}-{threading.get_ident()}")
+            check = cached.with_name(f"{cached.name}.check-{os.getpid()}-{threading.get_ident()}")
+            try:
+                self.diff(self.algorithm, old['path'], path, tmp)
+                self.apply(self.algorithm, old['path'], tmp, check)
+                if file_digest(check) != digest:
+                    logger.warning(f"Delta for {path.name} does not reproduce it, skipping")
+                    return None
+                os.replace(tmp, cached)
+            except (OSError, subprocess.CalledProcessError) as e:
+                logger.warning(f"Could not create a delta for {path.name}: {e}")
+                return None
+            finally:
+                tmp.unlink(missing_ok=True)
+                check.unlink(missing_ok=True)
+
+        if cached.stat().st_size > path.stat().st_size * self.MAX_RATIO:
+            logger.debug(f"Delta for {path.name} is too large to be worth shipping")
+            return None
+
+        record = self.store.collect(cached, path.with_name(f"{path.name}.{previous}.{extension}"))
+        if self.manifest is not None:
+            self.manifest.add(record)
+        return Delta(path=record.path, source=old['name'], target=path.name, from_version=previous,
+                     algorithm=self.algorithm, sha256=record.sha256, size=record.size)
+
+    @classmethod
+    def diff(cls, algorithm: str, old: Path, new: Path, patch: Path):
+        """Write a patch turning the old file into the new one"""
+        if algorithm == 'bsdiff':
+            import bsdiff4
+            bsdiff4.file_diff(str(old), str(new), str(patch))
+            return
+
+        # Long-distance matching must reach back over the whole old file,
+        # which zstd only searches when it is a referenced prefix
+        window_log = min(max(old.stat().st_size, new.stat().st_size, 1 << 10).bit_length(), 31)
+        subprocess.run(['zstd', '-q', '-f', f'-{cls.ZSTD_LEVEL}', f'--long={window_log}',
+                        f'--patch-from={old}', str(new), '-o', str(patch)],
+                       check=True, capture_output=True)
+
+    @staticmethod
+    def apply(algorithm: str, old: Path, patch: Path, output: Path):
+        """Reconstruct the new file from the old one and a patch"""
+        if algorithm == 'bsdiff':
+            import bsdiff4
+            bsdiff4.file_patch(str(old), str(output), str(patch))
+            return
+
+        subprocess.run(['zstd', '-q', '-d', '-f', '--long=31', f'--patch-from={old}', str(patch),
+                        '-o', str(output)], check=True, capture_output=True)
+
+    @staticmethod
+    def _normalize(name: str, version: str) -> str:
+        return name.replace(version, '{version}') if version else name
+
+    @staticmethod
+    def _percent(part: int, whole: int) -> str:
+        return f"{part / whole:.1%}" if whole else "100%"
+
+
+class UpdaterManifest:
+    """Tauri updater manifest (latest.json), extended with the delta patches
+
+    Each platform entry points at the full updater bundle as Tauri expects;
+    the extra ``deltas`` lists are ignored by the stock updater.
+    """
+
+    PLATFORM_KEYS = {'windows': 'windows', 'macos': 'darwin', 'linux': 'linux'}
+    ARCH_KEYS = {'x64': 'x86_64', 'arm64': 'aarch64'}
+    UPDATER_SUFFIXES = {
+        'windows': ('.msi.zip', '.nsis.zip', '-setup.exe', '.msi'),
+        'macos': ('.app.tar.gz',),
+        'linux': ('.AppImage.tar.gz', '.AppImage'),
+    }
+
+    def __init__(self, config: BuildConfig):
+        self.config = config
+        if config.update_url:
+            self.base_url = config.update_url.rstrip('/')
+        elif config.github_repo:
+            self.base_url = f"https://github.com/{config.github_repo}/releases/download/{config.release_tag}"
+        else:
+            self.base_url = ''
+        self.platforms: Dict[str, Dict] = {}
+        self.deltas: List[Dict] = []
+
+    def add(self, platform: str, arch: str, paths: List[Path], deltas: List[Delta]):
+        """Add a target's updater bundle and its patches"""
+        entries = []
+        for delta in deltas:
+            entries.append({
+                'target': f"{platform}-{arch}",
+                'from': delta.from_version,
+                'source': delta.source,
+                'name': delta.target,
+                'url': self._url(delta.path.name),
+                'algorithm': delta.algorithm,
+                'sha256': delta.sha256,
+                'size': delta.size,
+            })
+        self.deltas.extend(entries)
+
+        bundle = self._updater_bundle(platform, paths)
+        if bundle is None:
+            return
+        signature = bundle.with_name(f"{bundle.name}.sig")
+        if not signature.exists():
+            logger.warning(f"{bundle.name} is not signed, Tauri's updater will reject it")
+        self.platforms[f"{self.PLATFORM_KEYS[platform]}-{self.ARCH_KEYS[arch]}"] = {
+            'signature': signature.read_text().strip() if signature.exists() else '',
+            'url': self._url(bundle.name),
+            'deltas': [entry for entry in entries if entry['name'] == bundle.name],
+        }
+
+    def write(self, path: Path) -> Path:
+        manifest = {
+            'version': self.config.version,
+            'pub_date': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'platforms': dict(sorted(self.platforms.items())),
+            'deltas': self.deltas,
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(manifest, indent=2))
+        return path
+
+    def _updater_bundle(self, platform: str, paths: List[Path]) -> Optional[Path]:
+        for suffix in self.UPDATER_SUFFIXES[platform]:
+            for path in paths:
+                if path.name.endswith(suffix):
+                    return path
+        return None
+
+    def _url(self, name: str) -> str:
+        return f"{self.base_url}/{name}" if self.base_url else name
+
+
+@dataclass
+class BuildJob:
+    """Build target submitted to the scheduler"""
+    platform: str
+    arch: str
+    fn: Callable[..., List[Path]]
+    priority: int = 0
+    memory: int = 0
+    expected_duration: float = 0.0
+
+    @property
+    def key(self) -> str:
+        return f"{self.platform}-{self.arch}"
+
+
+class BuildScheduler:
+    """Resource-aware scheduler for concurrent build jobs
+
+    Concurrency is sized from CPUs and available memory unless a budget is
+    configured. Jobs run by priority, then longest recorded duration first,
+    and each job is admitted only once its estimated memory is free.
+
+    With a HostPool, concurrency is the pool's total capacity instead and
+    each job is called with the host it was dispatched to.
+    """
+
+    GIB = 1024 ** 3
+    CPUS_PER_JOB = 4
+    RELEASE_JOB_MEMORY = 4 * GIB
+    DEBUG_JOB_MEMORY = 2 * GIB
+
+    def __init__(self, config: BuildConfig, hosts: Optional[HostPool] = None):
+        self.config = config
+        self.hosts = hosts
+        self.history_path = Path(config.cache_dir) / 'durations.json'
+        self.durations = self._load_history()
+        self.job_memory = self.RELEASE_JOB_MEMORY if config.optimize else self.DEBUG_JOB_MEMORY
+        self.memory_budget = config.memory_budget or self._detect_available_memory()
+        self.max_workers = config.max_parallel_jobs or (hosts.capacity if hosts else self._detect_max_workers())
+
+        self._free_memory = self.memory_budget
+        self._memory_available = threading.Condition()
+        self._executor = None
+
+    def __enter__(self):
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._executor.shutdown(wait=True)
+        self._save_history()
+
+    def schedule(self, jobs: List[BuildJob]) -> List[Tuple[BuildJob, Future]]:
+        """Order jobs and submit them, returning their futures"""
+        for job in jobs:
+            job.memory = job.memory or self.job_memory
+            job.expected_duration = self.durations.get(job.key, 0.0)
+
+        ordered = sorted(jobs, key=lambda j: (-j.priority, -j.expected_duration))
+
+        if self.hosts:
+            resources = f"{len(self.hosts.hosts)} hosts"
+        else:
+            resources = f"cpus={os.cpu_count()}, memory budget={self._format_gib(self.memory_budget)}"
+        logger.info(f"📋 Scheduling {len(ordered)} jobs on {self.max_workers} workers ({resources})")
+        for job in ordered:
+            logger.debug(f"  {job.key}: priority={job.priority}, "
+                         f"expected={job.expected_duration:.0f}s, memory={self._format_gib(job.memory)}")
+
+        run_job = tracer.bind(self._run_job)
+        return [(job, self._executor.submit(run_job, job)) for job in ordered]
+
+    def _run_job(self, job: BuildJob) -> List[Path]:
+        if self.hosts:
+            # Host capacities bound concurrency; local memory is not what remote builds use
+            with self.hosts.acquire(job.platform, job.arch) as host:
+                start = time.time()
+                result = job.fn(host)
+                self.durations[job.key] = time.time() - start
+            return result
+
+        # Jobs larger than the whole budget still run, just alone
+        reserved = min(job.memory, self.memory_budget)
+
+        with self._memory_available:
+            if self._free_memory < reserved:
+                logger.debug(f"⏸️  {job.key} waiting for {self._format_gib(reserved)} of memory "
+                             f"({self._format_gib(self._free_memory)} free)")
+            self._memory_available.wait_for(lambda: self._free_memory >= reserved)
+            self._free_memory -= reserved
+            logger.debug(f"▶️  Admitted {job.key} ({self._format_gib(self._free_memory)} left)")
+
+        start = time.time()
+        try:
+            result = job.fn()
+            self.durations[job.key] = time.time() - start
+            return result
+        finally:
+            with self._memory_available:
+                self._free_memory += reserved
+                self._memory_available.notify_all()
+
+    def _detect_max_workers(self) -> int:
+        by_cpu = max(1, (os.cpu_count() or 1) // self.CPUS_PER_JOB)
+        by_memory = max(1, self.memory_budget // self.job_memory)
+        return min(by_cpu, by_memory)
+
+    @classmethod
+    def _detect_available_memory(cls) -> int:
+        """Read available memory from /proc/meminfo, falling back to physical memory"""
+        try:
+            with open('/proc/meminfo') as f:
+                for line in f:
+                    if line.startswith('MemAvailable:'):
+                        return int(line.split()[1]) * 1024
+        except OSError:
+            pass
+
+        try:
+            return os.sysconf('SC_PHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+        except (AttributeError, ValueError, OSError):
+            return 16 * cls.GIB
+
+    def _load_history(self) -> Dict[str, float]:
+        if self.history_path.exists():
+            try:
+                return json.loads(self.history_path.read_text())
+            except ValueError:
+                logger.warning(f"Ignoring corrupt duration history {self.history_path}")
+        return {}
+
+    def _save_history(self):
+        self.history_path.parent.mkdir(parents=True, exist_ok=True)
+        self.history_path.write_text(json.dumps(self.durations, indent=2, sort_keys=True))
+
+    @classmethod
+    def _format_gib(cls, size: int) -> str:
+        return f"{size / cls.GIB:.1f} GiB"
+
+
 class TauriBuilder:
     """Main Tauri Builder orchestrator"""
 
-    def __init__(self, config: BuildConfig):
+    def __init__(self, config: BuildConfig,
+                 log_consumers: Optional[List[Callable[[str], None]]] = None):
         self.config = config
         self.docker_manager = DockerManager(config)
-        self.platform_builder = PlatformBuilder(config, self.docker_manager)
+        self.hosts = HostPool.from_config(config, self.docker_manager) if config.docker_hosts else None
+        self.manifest = ArtifactManifest()
+        self.artifact_store = ArtifactStore(config.cache_dir) if config.artifact_store or config.deltas else None
+        # The project tree is hashed by the build cache, the frontend cache and the source context
+        self.file_digests = FileDigests()
+        self.platform_builder = PlatformBuilder(config, self.docker_manager, manifest=self.manifest,
+                                                log_consumers=log_consumers, store=self.artifact_store,
+                                                digests=self.file_digests)
+        self.build_cache = BuildCache(config, manifest=self.manifest,
+                                      digests=self.file_digests) if config.build_cache else None
+        self.delta_generator = None
+        self.updater_manifest = None
+        if config.deltas:
+            self.delta_generator = DeltaGenerator(self.artifact_store, manifest=self.manifest)
+            self.updater_manifest = UpdaterManifest(config)
+        self.frontend_builder = FrontendBuilder(config, self.docker_manager, log_consumers=log_consumers,
+                                                digests=self.file_digests)
+        self.timings: Dict[str, float] = {}
+        self.release_url: Optional[str] = None
+        self.failed_targets: List[str] = []
+        # Release-wide files published next to the targets' artifacts
+        self.release_files: Dict[str, List[Path]] = {}
 
         if config.mode == 'publish':
             self.github_publisher = GitHubPublisher(config)
 
     def run(self):
-        """Execute build process based on mode"""
-        start_time = time.time()
-
+        """Execute build process based on mode, exiting on failure"""
         try:
-            if self.config.mode == 'dev':
-                self._run_dev_mode()
-            elif self.config.mode == 'build':
-                artifacts = self._run_build_mode()
-                self._display_results(artifacts)
-            elif self.config.mode == 'publish':
-                artifacts = self._run_build_mode()
-                release_url = self._run_publish_mode(artifacts)
-                self._display_results(artifacts, release_url)
-
-            elapsed = time.time() - start_time
-            logger.info(f"✨ Completed in {elapsed:.2f} seconds")
-
+            self.execute()
         except Exception as e:
             logger.error(f"❌ Build failed: {e}")
             sys.exit(1)
 
+    def execute(self) -> Dict[str, List[Path]]:
+        """Execute build process based on mode
+
+        Returns the artifacts per target and raises on failure, so callers
+        embedding the builder (such as the REST API) keep control.
+        """
+        artifacts = {}
+        status = 'failed'
+        trace_id = None
+        metrics.inc('tauridock_builds_active')
+        if self.config.trace_file:
+            tracer.start()
+
+        try:
+            with timed(self.timings, 'total'), tracer.span('tauridock', mode=self.config.mode,
+                                                          app=self.config.app_name) as root:
+                trace_id = getattr(root, 'trace_id', None)
+                if self.config.mode == 'dev':
+                    self._run_dev_mode()
+                elif self.config.mode == 'build':
+                    artifacts = self._run_build_mode()
+                    self._display_results(artifacts)
+                elif self.config.mode == 'publish' and self.config.pipeline_publish:
+                    artifacts = self._run_pipelined_publish()
+                    self._display_results(artifacts, self.release_url)
+                elif self.config.mode == 'publish':
+                    artifacts = self._run_build_mode()
+                    with timed(self.timings, 'publish'), tracer.span('publish'):
+                        self.release_url = self._run_publish_mode(artifacts)
+                    self._display_results(artifacts, self.release_url)
+
+            logger.info(f"✨ Completed in {self.timings['total']:.2f} seconds")
+            status = 'succeeded'
+            return artifacts
+        finally:
+            metrics.inc('tauridock_builds_active', -1)
+            metrics.inc('tauridock_builds_total', mode=self.config.mode, status=status)
+            self._observe_timings()
+            self.docker_manager.close()
+            if self.hosts:
+                self.hosts.close()
+            if self.config.trace_file:
+                try:
+                    tracer.export(Path(self.config.trace_file), self.config.trace_format, trace_id=trace_id)
+                finally:
+                    tracer.stop()
+
+    def _observe_timings(self):
+        """Feed recorded timings into the phase duration histogram"""
+        for name, seconds in self.timings.items():
+            target, _, phase = name.rpartition(':')
+            if target:
+                # Per-target timings; the target's own total is already covered by 'build'
+                if phase != 'total':
+                    metrics.observe('tauridock_phase_duration_seconds', seconds,
+                                    phase=phase, platform=target.split('-')[0])
+            else:
+                metrics.observe('tauridock_phase_duration_seconds', seconds, phase=phase)
+
     def _run_dev_mode(self):
         """Run development mode with hot reload"""
         logger.info("🚀 Starting development mode")
 
+        if self.config.watch:
+            DevSession(self.config, self.docker_manager).run()
+            return
+
         # Build dev image
         image = self.docker_manager.build_image('linux', 'x64')
 
         # Run dev container
         self.docker_manager.run_dev_container(image, Path.cwd())
 
-    def _run_build_mode(self) -> Dict[str, List[Path]]:
-        """Run build for all specified platforms"""
+    def _run_build_mode(self, on_target: Optional[Callable[[str, List[Path]], None]] = None
+                        ) -> Dict[str, List[Path]]:
+        """Run build for all specified platforms
+
+        ``on_target`` is called with each target's key and artifacts as soon
+        as that target is built or restored from the cache.
+        """
         logger.info(f"🏗️  Building for platforms: {', '.join(self.config.platforms)}")
 
         artifacts = {}
+        fingerprints = {}
+        pending: Dict[str, List[str]] = {}
+        jobs = []
 
-        # Build in parallel using thread pool
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = []
-
-            for platform in self.config.platforms:
-                for arch in self.config.architectures:
-                    # Check if platform/arch combination is valid
-                    if arch in PlatformBuilder.PLATFORM_CONFIG[platform]['rust_target']:
-                        future = executor.submit(
-                            self.platform_builder.build_for_platform,
-                            platform, arch
-                        )
-                        futures.append((future, platform, arch))
-
-            # Collect results
-            for future, platform, arch in futures:
-                try:
-                    result = future.result(timeout=3600)  # 1 hour timeout
-                    key = f"{platform}-{arch}"
-                    artifacts[key] = result
-                except Exception as e:
-                    logger.error(f"Failed to build {platform}/{arch}: {e}")
+        for platform in self.config.platforms:
+            for arch in self.config.architectures:
+                # Check if platform/arch combination is valid
+                if arch not in PlatformBuilder.PLATFORM_CONFIG[platform]['rust_target']:
+                    continue
+
+                if self.build_cache:
+                    # Fingerprint before any build touches the tree
+                    with timed(self.timings, f"{platform}-{arch}:cache-restore"):
+                        fingerprint = self.build_cache.fingerprint(platform, arch)
+                        cached = self.build_cache.restore(fingerprint, platform)
+                    metrics.inc('tauridock_cache_requests_total', cache='artifacts',
+                                result='miss' if cached is None else 'hit')
+                    if cached is not None:
+                        logger.info(f"♻️  Cache hit for {platform}/{arch}, "
+                                    f"restored {len(cached)} artifacts")
+                        artifacts[f"{platform}-{arch}"] = cached = self._finish_target(platform, arch, cached)
+                        if on_target:
+                            on_target(f"{platform}-{arch}", cached)
+                        continue
+                    fingerprints[(platform, arch)] = fingerprint
+
+                pending.setdefault(platform, []).append(arch)
+
+        for platform, archs in pending.items():
+            groups = self._merge_groups(platform, archs) if self.config.merge_architectures else [[a] for a in archs]
+            for group in groups:
+                if len(group) > 1:
+                    jobs.append(BuildJob(
+                        platform=platform,
+                        arch='+'.join(group),
+                        fn=partial(self.platform_builder.build_merged, platform, group),
+                        priority=max(self.config.priorities.get(f"{platform}-{arch}", 0) for arch in group)
+                    ))
+                    continue
+
+                arch = group[0]
+                jobs.append(BuildJob(
+                    platform=platform,
+                    arch=arch,
+                    fn=partial(self.platform_builder.build_for_platform, platform, arch),
+                    priority=self.config.priorities.get(f"{platform}-{arch}", 0)
+                ))
+
+        # Build the frontend once and share it with every target, in an image one of them needs
+        if jobs and self.config.shared_frontend:
+            with timed(self.timings, 'frontend'), tracer.span('frontend build'):
+                self.platform_builder.frontend_output = self.frontend_builder.build(
+                    jobs[0].platform, jobs[0].arch.split('+')[0])
+
+        # Build in parallel, sized to the available resources
+        if jobs:
+            with timed(self.timings, 'build'), tracer.span('build', targets=len(jobs)), \
+                    BuildScheduler(self.config, hosts=self.hosts) as scheduler:
+                futures = {future: job for job, future in scheduler.schedule(jobs)}
+                # Handle targets in completion order so they can be published right away
+                for future in as_completed(futures):
+                    job = futures[future]
+                    platform = job.platform
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to build {platform}/{job.arch}: {e}")
+                        self.failed_targets.extend(f"{platform}-{arch}" for arch in job.arch.split('+'))
+                        continue
+                    self.timings[f"{job.key}:total"] = scheduler.durations[job.key]
+
+                    # Merged jobs return their artifacts per architecture
+                    results = result if '+' in job.arch else {job.arch: result}
+                    for arch, paths in results.items():
+                        if paths and (platform, arch) in fingerprints:
+                            with timed(self.timings, f"{platform}-{arch}:cache-store"):
+                                self.build_cache.store(fingerprints[(platform, arch)], platform, paths)
+                        artifacts[f"{platform}-{arch}"] = paths = self._finish_target(platform, arch, paths)
+                        if paths and on_target:
+                            on_target(f"{platform}-{arch}", paths)
+
+            self.timings.update(self.platform_builder.timings)
+
+        if artifacts and self.updater_manifest:
+            path = self.updater_manifest.write(self.config.output_dir / 'latest.json')
+            self.release_files['updater'] = [path]
+            if on_target:
+                on_target('updater', [path])
+
+        if artifacts:
+            self.manifest.save(self.config.output_dir / 'artifacts.json')
+
+        if self.artifact_store:
+            self._collect_garbage()
+        if self.config.shared_frontend:
+            FrontendBuilder.prune(self.frontend_builder.cache_dir)
+        if self.config.docker_gc:
+            self._collect_docker_garbage()
 
         return artifacts
 
+    def _merge_groups(self, platform: str, archs: List[str]) -> List[List[str]]:
+        """Split a platform's architectures into groups built from the same Dockerfile stage
+
+        A merged build runs in the image of its first architecture, so only
+        architectures whose cross toolchain lives in that stage can join it.
+        """
+        try:
+            dockerfile_text = self.config.dockerfile.read_text()
+        except OSError:
+            dockerfile_text = ''
+        groups: Dict[Optional[str], List[str]] = {}
+        for arch in archs:
+            stage = DockerManager._get_target_stage(dockerfile_text, platform, arch)
+            groups.setdefault(stage, []).append(arch)
+        return list(groups.values())
+
+    def _finish_target(self, platform: str, arch: str, paths: List[Path]) -> List[Path]:
+        """Index a target's artifacts under the version, adding delta patches from the previous one"""
+        if not self.artifact_store or not paths:
+            return paths
+
+        key = f"{platform}-{arch}"
+        if self.delta_generator:
+            with timed(self.timings, f"{key}:delta"), tracer.span('deltas', target=key):
+                deltas = self.delta_generator.generate(self.config.version, key, paths)
+            self.updater_manifest.add(platform, arch, paths, deltas)
+            paths = paths + [delta.path for delta in deltas]
+
+        self.artifact_store.add(self.config.version, key, paths, manifest=self.manifest)
+        return paths
+
+    def _collect_garbage(self):
+        """Apply the artifact store's retention, keeping the version just built"""
+        with timed(self.timings, 'store-gc'), tracer.span('store gc'):
+            stats = self.artifact_store.gc(
+                keep_versions=self.config.keep_versions,
+                budget=self.config.store_budget,
+                protect=[self.config.version],
+                linked_dirs=[self.config.output_dir]
+            )
+        if stats['objects']:
+            logger.info(f"🧹 Artifact store: evicted {stats['versions']} versions and "
+                        f"{stats['entries']} cache entries, freed {self._format_size(stats['bytes'])}")
+
+    def _collect_docker_garbage(self):
+        """Remove leftover Docker objects and enforce the Docker disk budget on every daemon used"""
+        managers = [host.manager for host in self.hosts.hosts] if self.hosts else [self.docker_manager]
+        removed, freed = 0, 0
+        with timed(self.timings, 'docker-gc'), tracer.span('docker gc'):
+            for manager in managers:
+                try:
+                    stats = manager.objects.gc(budget=self.config.docker_budget)
+                except Exception as e:
+                    # Housekeeping must not fail a build that succeeded
+                    logger.warning(f"⚠️  Docker cleanup failed: {e}")
+                    continue
+                removed += len(stats['removed'])
+                freed += stats['bytes']
+        if removed or freed:
+            logger.info(f"🧹 Docker: removed {removed} objects, freed {self._format_size(freed)}")
+
     def _run_publish_mode(self, artifacts: Dict[str, List[Path]]) -> str:
         """Publish artifacts to GitHub"""
         logger.info("📤 Publishing to GitHub")
-        return self.github_publisher.create_release(artifacts)
+        return self.github_publisher.create_release({**artifacts, **self.release_files}, manifest=self.manifest)
+
+    def _run_pipelined_publish(self) -> Dict[str, List[Path]]:
+        """Build and publish at once, uploading each target's artifacts when it finishes
+
+        The release is created as a draft before building and published once
+        every upload has landed. Failed targets are reported after the
+        uploads of the successful ones complete.
+        """
+        logger.info("📤 Publishing to GitHub as targets finish")
+        publication = self.github_publisher.start_release(self.manifest, pipelined=True)
+
+        try:
+            artifacts = self._run_build_mode(on_target=publication.add)
+        except BaseException:
+            publication.cancel()
+            raise
+
+        with timed(self.timings, 'publish'), tracer.span('publish'):
+            self.release_url = publication.finish(self.failed_targets)
+        return artifacts
 
     def _display_results(self, artifacts: Dict[str, List[Path]], release_url: str = None):
         """Display build results in a nice table"""
+        from rich.panel import Panel
+        from rich.table import Table
+
         table = Table(title="Build Results", show_header=True)
         table.add_column("Platform", style="cyan")
         table.add_column("Architecture", style="magenta")
@@ -523,16 +4570,20 @@ class TauriBuilder:
             platform, arch = key.split('-')
             file_list = []
 
+            target_size = 0
+
             for file in files:
-                size = file.stat().st_size
-                total_size += size
+                record = self.manifest.get(file, verify=False)
+                size = record.size if record else file.stat().st_size
+                target_size += size
                 file_list.append(f"• {file.name} ({self._format_size(size)})")
 
+            total_size += target_size
             table.add_row(
                 platform.capitalize(),
                 arch.upper(),
                 '\n'.join(file_list),
-                self._format_size(sum(f.stat().st_size for f in files))
+                self._format_size(target_size)
             )
 
         console.print(table)
@@ -555,8 +4606,8 @@ class TauriBuilder:
         return f"{size:.2f} TB"
 
 
-@click.command()
-@click.option('--dockerfile', type=click.Path(exists=True), required=True,
+@click.group(invoke_without_command=True)
+@click.option('--dockerfile', type=click.Path(exists=True),
               help='Path to Dockerfile for building')
 @click.option('--frontend-port', type=int, default=3003,
               help='Port for frontend server')
@@ -564,7 +4615,7 @@ class TauriBuilder:
               help='Operation mode')
 @click.option('--platforms', default='windows,macos,linux',
               help='Comma-separated list of target platforms')
-@click.option('--arch', '--architectures', default='x64',
+@click.option('--arch', '--architectures', 'architectures', default='x64',
               help='Comma-separated list of architectures')
 @click.option('--app-name', help='Application name')
 @click.option('--version', help='Application version')
@@ -575,30 +4626,83 @@ class TauriBuilder:
 @click.option('--bundle-types', help='Bundle types per platform (JSON format)')
 @click.option('--config', type=click.Path(exists=True),
               help='Path to configuration file')
-@click.option('--hot-reload', is_flag=True, help='Enable hot reload in dev mode')
+@click.option('--hot-reload', is_flag=True, help='Enable hot reload in dev mode (same as --watch)')
 @click.option('--debug', is_flag=True, help='Enable debug logging')
 @click.option('--devtools', is_flag=True, help='Open devtools in dev mode')
-@click.option('--watch', is_flag=True, help='Watch for file changes')
+@click.option('--watch', is_flag=True,
+              help='Watch for file changes in dev mode and reload, rebuild or restart as needed')
 @click.option('--env-file', type=click.Path(exists=True),
               help='Path to environment file')
 @click.option('--docker-image', default='rust:latest',
               help='Base Docker image')
-@click.option('--docker-cache', is_flag=True, help='Use Docker cache')
+@click.option('--docker-cache/--no-docker-cache', default=True,
+              help='Reuse Docker layers and up-to-date images')
+@click.option('--max-jobs', type=int,
+              help='Maximum number of concurrent builds (default: sized from CPUs and memory)')
+@click.option('--memory-budget', type=float,
+              help='Memory available to concurrent builds in GiB (default: available memory)')
+@click.option('--priorities', help='Build priorities per target (JSON format, e.g. {"linux-x64": 10})')
+@click.option('--cache-volumes/--no-cache-volumes', default=True,
+              help='Persist cargo, npm and target caches in Docker volumes')
+@click.option('--shared-frontend/--no-shared-frontend', default=True,
+              help='Build the frontend once and mount it into every platform build')
+@click.option('--merge-arch', 'merge_architectures', is_flag=True,
+              help='Build all architectures of a platform in one container, sharing host artifacts')
+@click.option('--warm-pool', is_flag=True,
+              help='Reuse long-lived builder containers and run builds through exec')
+@click.option('--sccache', is_flag=True, help='Compile through sccache (must be installed in the image)')
+@click.option('--artifact-store/--no-artifact-store', default=True,
+              help='Keep artifacts in a content-addressed store under the cache directory')
+@click.option('--keep-versions', type=int, default=5,
+              help='Versions the artifact store keeps, and cache entries per target (0 for no limit)')
+@click.option('--store-budget', type=float,
+              help='Disk budget of the artifact store in GiB, least recently used versions go first')
+@click.option('--docker-gc/--no-docker-gc', default=True,
+              help='Remove leftover tauridock containers and images after building')
+@click.option('--docker-budget', type=float,
+              help='Disk budget of tauridock\'s images, volumes and build cache in GiB')
+@click.option('--deltas', is_flag=True,
+              help='Add binary patches from the previous release and a Tauri updater manifest')
+@click.option('--update-url', help='Base URL of the release assets in the updater manifest '
+                                   '(default: the GitHub release download URL)')
+@click.option('--blake3', is_flag=True, help='Also record BLAKE3 digests of artifacts')
+@click.option('--layer-cache', type=click.Path(file_okay=False),
+              help='Directory to import image layers from before builds and export them to after')
+@click.option('--trace', 'trace_file', type=click.Path(dir_okay=False),
+              help='Record build phase spans and write them to this file')
+@click.option('--trace-format', type=click.Choice(['chrome', 'otlp']), default='chrome',
+              help='Trace file format: Chrome trace.json or OTLP JSON')
+@click.option('--build-cache/--no-build-cache', default=True,
+              help='Reuse artifacts of targets whose build inputs are unchanged')
+@click.option('--cache-dir', type=click.Path(), default='.tauri-cache',
+              help='Directory for the local build cache')
 @click.option('--github-token', envvar='GITHUB_TOKEN',
               help='GitHub token for publishing')
 @click.option('--github-repo', help='GitHub repository (owner/repo)')
 @click.option('--release-tag', help='Release tag')
 @click.option('--release-notes', type=click.Path(exists=True),
               help='Path to release notes file')
+@click.option('--github-api-url', envvar='GITHUB_API_URL', default='https://api.github.com',
+              help='GitHub API base URL')
+@click.option('--upload-concurrency', type=int, default=4,
+              help='Number of release assets uploaded in parallel')
+@click.option('--pipeline', 'pipeline_publish', is_flag=True,
+              help='Upload each target\'s artifacts as soon as it is built (publish mode)')
 @click.option('--draft', is_flag=True, help='Create draft release')
 @click.option('--prerelease', is_flag=True, help='Mark as prerelease')
-def main(**kwargs):
+@click.pass_context
+def main(ctx, **kwargs):
     """Tauri Builder CLI - Build Tauri apps for all platforms using Docker"""
 
     # Setup logging level
     if kwargs.get('debug'):
         logger.setLevel(logging.DEBUG)
 
+    if ctx.invoked_subcommand is not None:
+        return
+
+    from rich.panel import Panel
+
     # Display banner
     console.print(Panel.fit(
         "🦀 Tauri Builder CLI v1.0.0 \n"
@@ -619,6 +4723,9 @@ def main(**kwargs):
     tauri_config = ConfigManager.get_tauri_config()
     package_info = ConfigManager.get_package_info()
 
+    if not final_config.get('dockerfile'):
+        raise click.UsageError("Missing option '--dockerfile'.")
+
     # Build configuration object
     config = BuildConfig(
         dockerfile=Path(final_config['dockerfile']),
@@ -635,13 +4742,43 @@ def main(**kwargs):
                                                                                       str) else final_config.get(
             'bundle_types', {}),
         docker_image=final_config.get('docker_image', 'rust:latest'),
-        docker_cache=final_config.get('docker_cache', False),
+        docker_cache=final_config.get('docker_cache', True),
         github_token=final_config.get('github_token'),
         github_repo=final_config.get('github_repo'),
         release_tag=final_config.get('release_tag') or f"v{final_config.get('version', '1.0.0')}",
         release_notes=final_config.get('release_notes'),
         draft=final_config.get('draft', False),
-        prerelease=final_config.get('prerelease', False)
+        pipeline_publish=final_config.get('pipeline_publish', False),
+        prerelease=final_config.get('prerelease', False),
+        github_api_url=final_config.get('github_api_url', 'https://api.github.com'),
+        upload_concurrency=final_config.get('upload_concurrency', 4),
+        blake3=final_config.get('blake3', False),
+        artifact_store=final_config.get('artifact_store', True),
+        keep_versions=final_config.get('keep_versions', 5) or None,
+        store_budget=(int(final_config['store_budget'] * BuildScheduler.GIB)
+                      if final_config.get('store_budget') else None),
+        docker_gc=final_config.get('docker_gc', True),
+        docker_budget=(int(final_config['docker_budget'] * BuildScheduler.GIB)
+                       if final_config.get('docker_budget') else None),
+        deltas=final_config.get('deltas', False),
+        update_url=final_config.get('update_url'),
+        max_parallel_jobs=final_config.get('max_jobs') or final_config.get('max_parallel_jobs'),
+        memory_budget=(int(final_config['memory_budget'] * BuildScheduler.GIB)
+                       if final_config.get('memory_budget') else None),
+        priorities=(json.loads(final_config['priorities']) if isinstance(final_config.get('priorities'), str)
+                    else final_config.get('priorities', {})),
+        build_cache=final_config.get('build_cache', True),
+        cache_dir=Path(final_config.get('cache_dir', '.tauri-cache')),
+        cache_volumes=final_config.get('cache_volumes', True),
+        sccache=final_config.get('sccache', False),
+        shared_frontend=final_config.get('shared_frontend', True),
+        merge_architectures=final_config.get('merge_architectures', False),
+        warm_pool=final_config.get('warm_pool', False),
+        layer_cache=Path(final_config['layer_cache']) if final_config.get('layer_cache') else None,
+        docker_hosts=final_config.get('docker_hosts', []),
+        watch=bool(final_config.get('watch') or final_config.get('hot_reload')),
+        trace_file=Path(final_config['trace_file']) if final_config.get('trace_file') else None,
+        trace_format=final_config.get('trace_format', 'chrome')
     )
 
     # Create and run builder
@@ -649,5 +4786,148 @@ def main(**kwargs):
     builder.run()
 
 
+@main.group()
+def cache():
+    """Inspect and prune persistent build cache volumes"""
+
+
+@cache.command('ls')
+def cache_ls():
+    """Show the size of each cache volume"""
+    from rich.table import Table
+
+    volumes = CacheVolumeManager(connect_docker()).list()
+
+    table = Table(title="Build Caches", show_header=True)
+    table.add_column("Volume", style="cyan")
+    table.add_column("Kind", style="magenta")
+    table.add_column("Size", style="yellow")
+
+    for volume in sorted(volumes, key=lambda v: v['name']):
+        size = TauriBuilder._format_size(volume['size']) if volume['size'] >= 0 else 'unknown'
+        table.add_row(volume['name'], volume['kind'] or '-', size)
+
+    console.print(table)
+
+
+@cache.command('prune')
+@click.option('--kind', 'kinds', multiple=True,
+              type=click.Choice(['cargo-registry', 'cargo-git', 'target', 'npm', 'sccache']),
+              help='Only prune caches of this kind (repeatable)')
+def cache_prune(kinds):
+    """Remove cache volumes"""
+    removed = CacheVolumeManager(connect_docker()).prune(list(kinds) or None)
+    for name in removed:
+        logger.info(f"🗑️  Removed {name}")
+    logger.info(f"Pruned {len(removed)} cache volumes")
+
+
+@main.command('gc')
+@click.option('--budget', type=float, help='Disk budget in GiB, least recently used objects go first')
+@click.option('--dry-run', is_flag=True, help='Only show what would be removed')
+@click.option('--cache-dir', type=click.Path(file_okay=False), default='.tauri-cache',
+              help='Cache directory holding the Docker usage records')
+def gc(budget, dry_run, cache_dir):
+    """Show tauridock's Docker disk usage and remove stale objects"""
+    from rich.table import Table
+
+    objects = DockerCacheManager(connect_docker(), Path(cache_dir))
+    usage = objects.usage()
+
+    table = Table(title="Docker Objects", show_header=True)
+    table.add_column("Kind", style="magenta")
+    table.add_column("Name", style="cyan")
+    table.add_column("Size", style="yellow")
+    table.add_column("Last used")
+    table.add_column("In use", style="green")
+
+    for obj in sorted(usage, key=lambda o: o['last_used'], reverse=True):
+        table.add_row(obj['kind'], obj['name'], TauriBuilder._format_size(obj['size']),
+                      time.strftime('%Y-%m-%d %H:%M', time.localtime(obj['last_used'])),
+                      'yes' if obj['in_use'] else '')
+
+    console.print(table)
+    logger.info(f"Total: {TauriBuilder._format_size(sum(o['size'] for o in usage))}")
+
+    stats = objects.gc(budget=int(budget * BuildScheduler.GIB) if budget else None, dry_run=dry_run)
+    verb = 'Would remove' if dry_run else 'Removed'
+    for obj in stats['removed']:
+        logger.info(f"🗑️  {verb} {obj['kind']} {obj['name']}")
+    logger.info(f"{verb} {len(stats['removed'])} objects ({TauriBuilder._format_size(stats['bytes'])})")
+
+
+@main.group()
+@click.option('--cache-dir', type=click.Path(file_okay=False), default='.tauri-cache',
+              help='Cache directory holding the artifact store')
+@click.pass_context
+def store(ctx, cache_dir):
+    """Inspect, fetch from and garbage-collect the local artifact store"""
+    ctx.obj = ArtifactStore(Path(cache_dir))
+
+
+@store.command('ls')
+@click.pass_obj
+def store_ls(artifact_store):
+    """Show stored versions and build cache entries with their size"""
+    from rich.table import Table
+
+    table = Table(title="Artifact Store", show_header=True)
+    table.add_column("Name", style="cyan")
+    table.add_column("Kind", style="magenta")
+    table.add_column("Targets", style="green")
+    table.add_column("Size", style="yellow")
+    table.add_column("Last used")
+
+    for unit in artifact_store.usage():
+        table.add_row(unit['name'], unit['kind'], ', '.join(unit['targets']),
+                      TauriBuilder._format_size(unit['size']),
+                      time.strftime('%Y-%m-%d %H:%M', time.localtime(unit['accessed'])))
+
+    console.print(table)
+
+
+@store.command('get')
+@click.argument('version')
+@click.argument('target')
+@click.option('-o', '--output', type=click.Path(file_okay=False), default='.',
+              help='Directory to place the artifacts in')
+@click.pass_obj
+def store_get(artifact_store, version, target, output):
+    """Fetch the artifacts of a target (e.g. linux-x64) in a stored version"""
+    records = artifact_store.get(version, target)
+    if not records:
+        raise click.ClickException(f"No artifacts for {target} in version {version}")
+
+    output = Path(output)
+    output.mkdir(parents=True, exist_ok=True)
+    for record in records:
+        artifact_store.materialize(record['digest'], output / record['name'])
+        logger.info(f"📦 {output / record['name']}")
+
+
+@store.command('gc')
+@click.option('--keep-versions', type=int, default=5, help='Versions to keep (0 for no limit)')
+@click.option('--budget', type=float, help='Disk budget in GiB, least recently used versions go first')
+@click.option('--output-dir', type=click.Path(file_okay=False), default='dist',
+              help='Output directory whose files hardlinked to evicted artifacts are deleted')
+@click.pass_obj
+def store_gc(artifact_store, keep_versions, budget, output_dir):
+    """Apply retention to the artifact store and the frontend build cache
+
+    Files in the output directory that are hardlinks to evicted objects
+    are deleted with them.
+    """
+    stats = artifact_store.gc(
+        keep_versions=keep_versions or None,
+        budget=int(budget * BuildScheduler.GIB) if budget else None,
+        linked_dirs=[Path(output_dir)] if Path(output_dir).is_dir() else []
+    )
+    frontend = FrontendBuilder.prune(artifact_store.root / 'frontend')
+    logger.info(f"Evicted {stats['versions']} versions and {stats['entries']} cache entries, "
+                f"removed {stats['objects']} objects ({TauriBuilder._format_size(stats['bytes'])})")
+    if frontend:
+        logger.info(f"Removed cached frontend builds ({TauriBuilder._format_size(frontend)})")
+
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
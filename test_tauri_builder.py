@@ -4,9 +4,14 @@ Unit tests for Tauri Builder CLI
 """
 
 import unittest
-from unittest.mock import Mock, MagicMock, patch, call
+from unittest.mock import Mock, MagicMock, patch, call, ANY
 from pathlib import Path
 import tempfile
+import shutil
+import tarfile
+import time
+import io
+import hashlib
 import json
 import yaml
 import os
@@ -28,8 +33,14 @@ sys.modules['rich.panel'] = MagicMock()
 sys.modules['rich.logging'] = MagicMock()
 
 from tauri_builder import (
-    BuildConfig, DockerManager, PlatformBuilder,
-    GitHubPublisher, ConfigManager, TauriBuilder
+    BuildConfig, BuildLog, ErrorPatternMatcher, BuildProgressParser,
+    DockerManager, PlatformBuilder, ReleaseUploader, GitHubPublisher,
+    ConfigManager, BuildCache, TauriBuilder, ArtifactManifest, collect_file,
+    BuildJob, BuildScheduler, CacheVolumeManager, FrontendBuilder, FrontendOutput,
+    ContainerPool, Tracer, Metrics, BuildContext, DockerIgnore, ImageBuildParser,
+    DockerHost, HostPool, FileWatcher, DevSession, ReleasePublication,
+    ArtifactStore, DeltaGenerator, UpdaterManifest, Delta, DockerCacheManager, FileDigests,
+    tree_digest
 )
 
 
@@ -65,6 +76,275 @@ class TestBuildConfig(unittest.TestCase):
         self.assertFalse(config.sign)
 
 
+class TestArtifactCollection(unittest.TestCase):
+    """Test single-pass artifact collection and the artifact manifest"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.source = Path(self.temp_dir.name) / "app.AppImage"
+        self.source.write_bytes(b"x" * 10000)
+        self.expected = "e4ee97ec252749d2096447e849628d0d7734f51700416eefbb33574bf0b3ee75"
+
+    def test_collect_file_links(self):
+        """Test files on the same filesystem are linked and hashed"""
+        dest = Path(self.temp_dir.name) / "out.AppImage"
+        record = collect_file(self.source, dest)
+
+        self.assertEqual(record.sha256, self.expected)
+        self.assertEqual(record.size, 10000)
+        self.assertEqual(dest.read_bytes(), self.source.read_bytes())
+
+    @patch('tauri_builder._link_file', return_value=False)
+    def test_collect_file_copy_fallback(self, mock_link):
+        """Test the copy fallback hashes while copying"""
+        dest = Path(self.temp_dir.name) / "out.AppImage"
+        dest.write_bytes(b"stale")
+
+        record = collect_file(self.source, dest)
+
+        self.assertEqual(record.sha256, self.expected)
+        self.assertEqual(dest.read_bytes(), self.source.read_bytes())
+        self.assertFalse(os.path.samefile(dest, self.source))
+
+    def test_manifest_detects_changes(self):
+        """Test manifest records are invalidated when files change"""
+        manifest = ArtifactManifest()
+        record = collect_file(self.source, Path(self.temp_dir.name) / "out.AppImage")
+        manifest.add(record)
+
+        self.assertEqual(manifest.get(record.path), record)
+
+        record.path.unlink()
+        record.path.write_bytes(b"changed")
+        self.assertIsNone(manifest.get(record.path))
+
+    def test_manifest_save(self):
+        """Test manifest is written with relative paths"""
+        manifest = ArtifactManifest()
+        output_dir = Path(self.temp_dir.name) / "dist"
+        output_dir.mkdir()
+        manifest.add(collect_file(self.source, output_dir / "app.AppImage"))
+
+        manifest.save(output_dir / "artifacts.json")
+
+        data = json.loads((output_dir / "artifacts.json").read_text())
+        self.assertEqual(data["artifacts"][0]["path"], "app.AppImage")
+        self.assertEqual(data["artifacts"][0]["sha256"], self.expected)
+
+
+class TestBuildLog(unittest.TestCase):
+    """Test BuildLog pipeline and line consumers"""
+
+    def test_splits_chunks_into_lines(self):
+        """Test lines split across chunks are reassembled"""
+        lines = []
+        log = BuildLog(consumers=[lines.append])
+
+        log.feed(b"Compil")
+        log.feed(b"ing foo\r\nCompiling bar\nFinis")
+        log.feed(b"hed")
+        log.close()
+
+        self.assertEqual(lines, ["Compiling foo", "Compiling bar", "Finished"])
+        self.assertEqual(log.line_count, 3)
+
+    def test_tail_is_bounded(self):
+        """Test only the last lines are kept in memory"""
+        log = BuildLog(tail_lines=2)
+
+        for i in range(1000):
+            log.feed(f"line {i}\n".encode())
+        log.close()
+
+        self.assertEqual(log.get_tail(), "line 998\nline 999")
+        self.assertEqual(log.line_count, 1000)
+
+    def test_writes_compressed_log(self):
+        """Test the full log is written to a gzip file"""
+        import gzip
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "logs" / "linux-x64.log.gz"
+            with BuildLog(path, tail_lines=1) as log:
+                log.feed(b"first\nsecond\n")
+
+            with gzip.open(path, 'rt') as f:
+                self.assertEqual(f.read(), "first\nsecond\n")
+
+    def test_error_pattern_matcher(self):
+        """Test error-looking lines are collected"""
+        matcher = ErrorPatternMatcher()
+
+        for line in ["Compiling foo", "error[E0425]: cannot find value", "npm ERR! code ENOENT", "ok"]:
+            matcher(line)
+
+        self.assertEqual(list(matcher.matches), ["error[E0425]: cannot find value", "npm ERR! code ENOENT"])
+
+    def test_progress_parser(self):
+        """Test build phases are detected from log lines"""
+        phases = []
+        parser = BuildProgressParser(phases.append)
+
+        for line in ["added 120 packages in 3s", "   Compiling serde v1.0.0",
+                     "   Compiling tauri v1.5.0", "    Bundling app.deb"]:
+            parser(line)
+
+        self.assertEqual(phases, ["npm install", "cargo compile", "bundle"])
+        self.assertEqual(parser.crates_compiled, 2)
+
+    def test_progress_parser_phase_durations(self):
+        with patch('time.perf_counter', side_effect=[0.0, 2.0, 7.0, 8.5]):
+            parser = BuildProgressParser()
+            parser("info: component rust-std is up to date")
+            parser("   Compiling serde v1.0.0")
+            parser("    Bundling app.deb")
+            durations = parser.finish()
+
+        self.assertEqual(durations, {'setup': 2.0, 'cargo compile': 5.0, 'bundle': 1.5})
+
+
+class TestTracer(unittest.TestCase):
+    """Test span collection and export"""
+
+    def test_disabled_tracer_is_noop(self):
+        tracer = Tracer()
+
+        with tracer.span('image build', target='linux-x64') as span:
+            span.set_attribute('cache_hit', True)
+        tracer.record('bundle', 0.0, 1.0)
+
+        self.assertEqual(tracer.spans, [])
+        fn = lambda: None
+        self.assertIs(tracer.bind(fn), fn)
+
+    def test_spans_nest_across_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        tracer = Tracer(enabled=True)
+
+        with tracer.span('build') as root:
+            def target(key):
+                with tracer.span('target', target=key):
+                    with tracer.span('artifact copy', bytes=10):
+                        pass
+
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                list(executor.map(tracer.bind(target), ['linux-x64', 'windows-x64']))
+
+        by_name = {}
+        for span in tracer.spans:
+            by_name.setdefault(span.name, []).append(span)
+
+        self.assertEqual(len(by_name['target']), 2)
+        for span in by_name['target']:
+            self.assertEqual(span.parent_id, root.span_id)
+            self.assertEqual(span.trace_id, root.trace_id)
+        target_ids = {span.span_id for span in by_name['target']}
+        self.assertEqual({span.parent_id for span in by_name['artifact copy']}, target_ids)
+        self.assertIsNone(root.parent_id)
+
+    def test_failed_span_records_error(self):
+        tracer = Tracer(enabled=True)
+
+        with self.assertRaises(RuntimeError):
+            with tracer.span('container run'):
+                raise RuntimeError("exit 101")
+
+        self.assertEqual(tracer.spans[0].error, "exit 101")
+
+    def test_export_formats(self):
+        tracer = Tracer(enabled=True)
+        with tracer.span('target', target='linux-x64', cache_hit=False, bytes=2048):
+            tracer.record('cargo compile', 1.0, 3.5)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            chrome_path = Path(tmpdir) / 'trace.json'
+            otlp_path = Path(tmpdir) / 'trace.otlp.json'
+            tracer.export(chrome_path)
+            tracer.export(otlp_path, 'otlp')
+            chrome = json.loads(chrome_path.read_text())
+            otlp = json.loads(otlp_path.read_text())
+
+        events = {e['name']: e for e in chrome['traceEvents'] if e['ph'] == 'X'}
+        self.assertEqual(events['cargo compile']['dur'], 2.5e6)
+        self.assertEqual(events['target']['args'], {'target': 'linux-x64', 'cache_hit': False, 'bytes': 2048})
+        self.assertTrue(any(e['ph'] == 'M' for e in chrome['traceEvents']))
+
+        spans = {s['name']: s for s in otlp['resourceSpans'][0]['scopeSpans'][0]['spans']}
+        self.assertEqual(spans['cargo compile']['parentSpanId'], spans['target']['spanId'])
+        self.assertEqual(len(spans['target']['traceId']), 32)
+        self.assertIn({'key': 'bytes', 'value': {'intValue': '2048'}}, spans['target']['attributes'])
+        self.assertIn({'key': 'cache_hit', 'value': {'boolValue': False}}, spans['target']['attributes'])
+
+
+    def test_sessions_export_own_trace_and_clear(self):
+        tracer = Tracer()
+        tracer.start()
+        tracer.start()
+        with tracer.span('first build') as first:
+            pass
+        with tracer.span('second build'):
+            pass
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / 'trace.json'
+            tracer.export(path, trace_id=first.trace_id)
+            names = [e['name'] for e in json.loads(path.read_text())['traceEvents'] if e['ph'] == 'X']
+
+        self.assertEqual(names, ['first build'])
+        tracer.stop()
+        self.assertTrue(tracer.enabled)
+        self.assertEqual([s.name for s in tracer.spans], ['second build'])
+        tracer.stop()
+        self.assertFalse(tracer.enabled)
+        self.assertEqual(tracer.spans, [])
+
+class TestMetrics(unittest.TestCase):
+    """Test Prometheus text rendering"""
+
+    def test_counters_and_gauges(self):
+        metrics = Metrics()
+        metrics.describe('builds_total', 'counter', 'Finished builds')
+        metrics.describe('active', 'gauge', 'Active builds')
+
+        metrics.inc('builds_total', mode='build', status='succeeded')
+        metrics.inc('builds_total', mode='build', status='succeeded')
+        metrics.inc('builds_total', status='failed', mode='build')
+        metrics.set('active', 3)
+        metrics.add_collector(lambda: metrics.inc('active'))
+
+        text = metrics.render()
+
+        self.assertIn('# TYPE builds_total counter\n', text)
+        self.assertIn('builds_total{mode="build",status="succeeded"} 2\n', text)
+        self.assertIn('builds_total{mode="build",status="failed"} 1\n', text)
+        self.assertIn('active 4\n', text)
+
+    def test_histogram(self):
+        metrics = Metrics()
+        metrics.describe('phase_seconds', 'histogram', 'Phase durations')
+
+        metrics.observe('phase_seconds', 0.3, phase='bundle')
+        metrics.observe('phase_seconds', 45, phase='bundle')
+
+        text = metrics.render()
+
+        self.assertIn('phase_seconds_bucket{phase="bundle",le="0.1"} 0\n', text)
+        self.assertIn('phase_seconds_bucket{phase="bundle",le="0.5"} 1\n', text)
+        self.assertIn('phase_seconds_bucket{phase="bundle",le="60"} 2\n', text)
+        self.assertIn('phase_seconds_bucket{phase="bundle",le="+Inf"} 2\n', text)
+        self.assertIn('phase_seconds_sum{phase="bundle"} 45.3\n', text)
+        self.assertIn('phase_seconds_count{phase="bundle"} 2\n', text)
+
+    def test_label_escaping(self):
+        metrics = Metrics()
+        metrics.describe('errors_total', 'counter', 'Errors')
+        metrics.inc('errors_total', message='say "hi"\\n')
+
+        self.assertIn('errors_total{message="say \\"hi\\"\\\\n"} 1', metrics.render())
+
+
 class TestDockerManager(unittest.TestCase):
     """Test DockerManager class"""
 
@@ -111,20 +391,250 @@ class TestDockerManager(unittest.TestCase):
         mock_client = MagicMock()
         mock_docker.return_value = mock_client
 
-        mock_image = MagicMock()
-        mock_client.images.build.return_value = (mock_image, ["log1", "log2"])
+        mock_client.images.list.return_value = []
+        mock_client.api.build.return_value = iter(self._build_events("sha256:built"))
+        self._make_context("FROM rust\n")
 
         manager = DockerManager(self.config)
         tag = manager.build_image("linux", "x64")
 
         self.assertEqual(tag, "tauridock-linux-x64:latest")
-        mock_client.images.build.assert_called_once()
+        mock_client.api.build.assert_called_once()
 
         # Check build arguments
-        call_args = mock_client.images.build.call_args
+        call_args = mock_client.api.build.call_args
         self.assertEqual(call_args[1]['tag'], "tauridock-linux-x64:latest")
         self.assertEqual(call_args[1]['buildargs']['PLATFORM'], "linux")
         self.assertEqual(call_args[1]['buildargs']['ARCH'], "x64")
+        self.assertTrue(call_args[1]['custom_context'])
+        self.assertTrue(call_args[1]['decode'])
+
+        # Step timings are kept per image
+        self.assertEqual(manager.image_digests[tag], "sha256:built")
+        steps = manager.image_steps[tag]
+        self.assertEqual([(step.number, step.cached) for step in steps], [(1, False), (2, True)])
+        saved = json.loads((self.config.cache_dir / 'logs' / 'image-linux-x64.steps.json').read_text())
+        self.assertEqual(saved[1]['instruction'], "RUN apt-get update")
+
+    @staticmethod
+    def _build_events(image_id):
+        return [
+            {'stream': 'Step 1/2 : FROM rust\n'},
+            {'stream': ' ---> 1a2b3c4d\n'},
+            {'stream': 'Step 2/2 : RUN apt-get update\n'},
+            {'stream': ' ---> Using cache\n ---> 5e6f7a8b\n'},
+            {'aux': {'ID': image_id}},
+            {'stream': 'Successfully built 5e6f7a8b\n'},
+        ]
+
+    def _make_context(self, dockerfile_text):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        dockerfile = Path(temp_dir.name) / "Dockerfile"
+        dockerfile.write_text(dockerfile_text)
+        self.config.dockerfile = dockerfile
+        self.config.cache_dir = Path(temp_dir.name) / ".tauri-cache"
+        self.config.docker_cache = True
+
+    def test_effective_build_args(self):
+        """Test only build args consumed by the Dockerfile are significant"""
+        dockerfile = (
+            "ARG PLATFORM=linux\n"
+            "ARG ARCH=x64\n"
+            "FROM rust AS base\n"
+            "ARG FRONTEND_PORT\n"
+            "FROM ${PLATFORM}-builder AS final\n"
+        )
+        effective = DockerManager._get_effective_build_args(dockerfile, {
+            'PLATFORM': 'windows', 'ARCH': 'arm64', 'FRONTEND_PORT': '3003', 'UNUSED': '1'
+        })
+
+        self.assertEqual(effective, {'PLATFORM': 'windows', 'FRONTEND_PORT': '3003'})
+
+    @patch('docker.from_env')
+    def test_build_image_reuses_labelled_image(self, mock_docker):
+        """Test an image with a matching build key label is not rebuilt"""
+        mock_client = MagicMock()
+        mock_docker.return_value = mock_client
+        existing = MagicMock(id="sha256:existing")
+        mock_client.images.list.return_value = [existing]
+        self._make_context("FROM rust\n")
+
+        manager = DockerManager(self.config)
+        tag = manager.build_image("linux", "x64")
+
+        self.assertEqual(tag, "tauridock-linux-x64:latest")
+        mock_client.api.build.assert_not_called()
+        mock_client.api.tag.assert_called_once_with("sha256:existing", "tauridock-linux-x64", "latest")
+        self.assertEqual(manager.image_digests[tag], "sha256:existing")
+
+    @patch('docker.from_env')
+    def test_build_image_records_toolchain(self, mock_docker):
+        """Test a new image is probed and labelled with its toolchain"""
+        mock_client = MagicMock()
+        mock_docker.return_value = mock_client
+        mock_client.images.list.return_value = []
+        mock_client.api.build.return_value = iter(self._build_events("sha256:built"))
+        mock_client.containers.run.return_value = (
+            b"target=x86_64-unknown-linux-gnu\ntarget=aarch64-unknown-linux-gnu\n"
+            b"rustc=rustc 1.75.0\ntauri=tauri-cli 1.5.9\nnode=v20.10.0\nnpm=\n"
+        )
+        mock_client.images.build.return_value = (MagicMock(id="sha256:labelled"), iter([]))
+        self._make_context("FROM rust\nARG RUST_TARGETS\n")
+        self.config.architectures = ["x64", "arm64"]
+
+        manager = DockerManager(self.config)
+        tag = manager.build_image("linux", "x64")
+
+        self.assertEqual(mock_client.api.build.call_args[1]['buildargs']['RUST_TARGETS'],
+                         "aarch64-unknown-linux-gnu x86_64-unknown-linux-gnu")
+        toolchain = manager.toolchains[tag]
+        self.assertEqual(toolchain['targets'], ["aarch64-unknown-linux-gnu", "x86_64-unknown-linux-gnu"])
+        self.assertEqual(toolchain['tauri'], "tauri-cli 1.5.9")
+        self.assertNotIn('npm', toolchain)
+        labels = mock_client.images.build.call_args[1]['labels']
+        self.assertEqual(json.loads(labels[DockerManager.TOOLCHAIN_LABEL]), toolchain)
+        self.assertEqual(manager.image_digests[tag], "sha256:labelled")
+
+    @patch('docker.from_env')
+    def test_build_image_reuses_toolchain_label(self, mock_docker):
+        """Test a reused image with a toolchain label is not probed again"""
+        mock_client = MagicMock()
+        mock_docker.return_value = mock_client
+        plain = MagicMock(id="sha256:plain", labels={DockerManager.BUILD_KEY_LABEL: "key"})
+        toolchain = {"rustc": "rustc 1.75.0", "targets": ["x86_64-unknown-linux-gnu"]}
+        labelled = MagicMock(id="sha256:labelled", labels={
+            DockerManager.BUILD_KEY_LABEL: "key", DockerManager.TOOLCHAIN_LABEL: json.dumps(toolchain)
+        })
+        mock_client.images.list.return_value = [plain, labelled]
+        self._make_context("FROM rust\n")
+
+        manager = DockerManager(self.config)
+        tag = manager.build_image("linux", "x64")
+
+        mock_client.containers.run.assert_not_called()
+        self.assertEqual(manager.image_digests[tag], "sha256:labelled")
+        self.assertEqual(manager.toolchains[tag], toolchain)
+
+    def test_target_stage_selection(self):
+        """Test the most specific platform stage is targeted"""
+        dockerfile = Path(__file__).parent.joinpath("Dockerfile").read_text()
+
+        self.assertEqual(DockerManager._get_target_stage(dockerfile, "linux", "x64"), "linux-builder")
+        self.assertEqual(DockerManager._get_target_stage(dockerfile, "linux", "arm64"), "arm64-builder")
+        self.assertEqual(DockerManager._get_target_stage(dockerfile, "windows", "x64"), "windows-builder")
+        self.assertEqual(DockerManager._get_target_stage(dockerfile, "macos", "arm64"), "macos-builder")
+        self.assertIsNone(DockerManager._get_target_stage("FROM rust:1.75-slim\n", "linux", "x64"))
+
+    @patch('docker.from_env')
+    def test_layer_cache_import_and_export(self, mock_docker):
+        """Test layers are imported before a build and exported after it"""
+        mock_client = MagicMock()
+        mock_docker.return_value = mock_client
+        mock_client.images.list.return_value = []
+        mock_client.api.build.return_value = iter(self._build_events("sha256:new"))
+        mock_client.images.get.return_value.save.return_value = iter([b"layer", b"data"])
+        self._make_context("FROM rust AS base\nFROM base AS linux-builder\n")
+        self.config.layer_cache = self.config.cache_dir / "layers"
+
+        manager = DockerManager(self.config)
+        owner = hashlib.sha256(str(self.config.dockerfile.resolve()).encode('utf-8')).hexdigest()[:16]
+        ours = self.config.layer_cache / "0123456789abcdef"
+        ours.mkdir(parents=True)
+        (ours / "tauridock-linux-x64_latest.tar").write_bytes(b"old")
+        (ours / "tauridock-linux-x64_latest.json").write_text(json.dumps({'owner': owner}))
+        foreign = self.config.layer_cache / "fedcba9876543210"
+        foreign.mkdir(parents=True)
+        (foreign / "tauridock-linux-x64_latest.tar").write_bytes(b"other project")
+        (foreign / "tauridock-linux-x64_latest.json").write_text(json.dumps({'owner': "someone-else"}))
+        cached = manager._layer_cache_path("tauridock-linux-x64:latest")
+        cached.parent.mkdir(parents=True)
+        cached.write_bytes(b"previous")
+
+        manager.build_image("linux", "x64")
+
+        mock_client.images.load.assert_called_once()
+        build_kwargs = mock_client.api.build.call_args[1]
+        self.assertEqual(build_kwargs['target'], "linux-builder")
+        self.assertEqual(build_kwargs['cache_from'], ["tauridock-linux-x64:latest"])
+        self.assertEqual(cached.read_bytes(), b"layerdata")
+        self.assertFalse(ours.exists())
+        self.assertEqual((foreign / "tauridock-linux-x64_latest.tar").read_bytes(), b"other project")
+
+    @patch('docker.from_env')
+    def test_layer_cache_export_skipped_for_cached_image(self, mock_docker):
+        """Test an image already in the layer cache is not saved again"""
+        mock_client = MagicMock()
+        mock_docker.return_value = mock_client
+        self._make_context("FROM rust AS base\nFROM base AS linux-builder\n")
+        self.config.layer_cache = self.config.cache_dir / "layers"
+        manager = DockerManager(self.config)
+        tag = "tauridock-linux-x64:latest"
+        cached = manager._layer_cache_path(tag)
+        cached.parent.mkdir(parents=True)
+        cached.write_bytes(b"previous")
+        cached.with_suffix('.json').write_text(json.dumps({'image_id': "sha256:same"}))
+
+        manager._export_layer_cache(tag, "sha256:same")
+        mock_client.images.get.return_value.save.assert_not_called()
+        self.assertEqual(cached.read_bytes(), b"previous")
+
+        mock_client.images.get.return_value.save.return_value = iter([b"new"])
+        manager._export_layer_cache(tag, "sha256:changed")
+        self.assertEqual(cached.read_bytes(), b"new")
+
+    @patch('docker.from_env')
+    def test_build_image_single_flight(self, mock_docker):
+        """Test concurrent requests with identical inputs share one build"""
+        import threading
+        import time
+
+        mock_client = MagicMock()
+        mock_docker.return_value = mock_client
+        mock_client.images.list.return_value = []
+
+        def slow_build(**kwargs):
+            time.sleep(0.2)
+            return iter(self._build_events("sha256:built"))
+
+        mock_client.api.build.side_effect = slow_build
+        self._make_context("ARG PLATFORM\nARG ARCH\nFROM ${PLATFORM}-builder\n")
+
+        manager = DockerManager(self.config)
+        threads = [
+            threading.Thread(target=manager.build_image, args=("windows", arch))
+            for arch in ("x64", "arm64")
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        mock_client.api.build.assert_called_once()
+        self.assertEqual(manager.image_digests["tauridock-windows-x64:latest"], "sha256:built")
+        self.assertEqual(manager.image_digests["tauridock-windows-arm64:latest"], "sha256:built")
+
+    @patch('docker.from_env')
+    def test_build_image_rebuilds_removed_image(self, mock_docker):
+        """Test a finished build is looked up again, so an image removed since is rebuilt"""
+        mock_client = MagicMock()
+        mock_docker.return_value = mock_client
+        mock_client.images.list.return_value = []
+        mock_client.api.build.side_effect = lambda **kwargs: iter(self._build_events("sha256:built"))
+        self._make_context("FROM rust\n")
+        self.config.docker_cache = False
+
+        manager = DockerManager(self.config)
+        manager.build_image("linux", "x64")
+        # e.g. removed by `tauridock gc` or `docker image prune` in the meantime
+        manager.build_image("linux", "x64")
+
+        self.assertEqual(mock_client.api.build.call_count, 2)
+        self.assertEqual(manager._image_builds, {})
+
+        mock_client.images.list.return_value = [MagicMock(id="sha256:built", labels={})]
+        manager.build_image("linux", "x64")
+        self.assertEqual(mock_client.api.build.call_count, 2)
 
     @patch('docker.from_env')
     def test_run_container(self, mock_docker):
@@ -134,7 +644,7 @@ class TestDockerManager(unittest.TestCase):
 
         mock_container = MagicMock()
         mock_container.wait.return_value = {'StatusCode': 0}
-        mock_container.logs.return_value = b"Build successful"
+        mock_container.logs.return_value = iter([b"Build ", b"successful\n"])
         mock_client.containers.run.return_value = mock_container
 
         manager = DockerManager(self.config)
@@ -146,9 +656,809 @@ class TestDockerManager(unittest.TestCase):
 
         self.assertEqual(status, 0)
         self.assertEqual(logs, "Build successful")
+        mock_container.logs.assert_called_once_with(stream=True, follow=True)
         mock_container.remove.assert_called_once_with(force=True)
 
 
+class TestImageBuildParser(unittest.TestCase):
+    """Test parsing of Docker build API events"""
+
+    def test_steps_are_timed(self):
+        seen = []
+        parser = ImageBuildParser(on_step=lambda p: seen.append((p.steps[-1].number, p.total_steps)))
+
+        with patch('time.perf_counter', side_effect=[0.0, 4.0, 4.0, 4.5, 4.5, 10.0]):
+            parser.feed({'stream': 'Step 1/3 : FROM rust:1.75 AS base\n'})
+            parser.feed({'stream': ' ---> Using cache\n'})
+            parser.feed({'stream': 'Step 2/3 : RUN apt-get update\n ---> Running in 0123\n'})
+            parser.feed({'stream': 'Step 3/3 : RUN cargo install tauri-cli\n'})
+            parser.feed({'aux': {'ID': 'sha256:abc'}})
+            steps = parser.finish()
+
+        self.assertEqual(seen, [(1, 3), (2, 3), (3, 3)])
+        self.assertEqual([(s.duration, s.cached) for s in steps], [(4.0, True), (0.5, False), (5.5, False)])
+        self.assertEqual(steps[2].instruction, "RUN cargo install tauri-cli")
+        self.assertEqual(parser.image_id, "sha256:abc")
+
+    def test_short_id_fallback(self):
+        parser = ImageBuildParser()
+        parser.feed({'stream': 'Successfully built 5e6f7a8b\n'})
+        self.assertEqual(parser.image_id, "5e6f7a8b")
+
+    def test_error_raises_build_error(self):
+        class BuildError(Exception):
+            def __init__(self, reason, build_log):
+                super().__init__(reason)
+                self.build_log = build_log
+
+        parser = ImageBuildParser()
+        with patch('tauri_builder.docker.errors.BuildError', BuildError):
+            with self.assertRaises(BuildError) as ctx:
+                parser.feed({'error': 'returned a non-zero code: 100', 'errorDetail': {'code': 100}})
+
+        self.assertIn('non-zero code', str(ctx.exception))
+
+
+class TestBuildContext(unittest.TestCase):
+    """Test filtered, cached build context archives"""
+
+    def setUp(self):
+        import tarfile
+
+        self.tarfile = tarfile
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name) / "project"
+        for name, content in {
+            "Dockerfile": "FROM rust\n",
+            "src/main.rs": "fn main() {}\n",
+            "src/debug.log": "noise\n",
+            "logs/keep.log": "keep\n",
+            "logs/other.log": "other\n",
+            "node_modules/pkg/index.js": "x\n",
+            "src-tauri/target/release/app": "binary\n",
+            ".git/HEAD": "ref\n",
+            "secret.env": "TOKEN=1\n",
+        }.items():
+            path = self.root / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+        (self.root / ".dockerignore").write_text("# comment\n**/*.log\n!logs/keep.log\n*.env\nDockerfile\n")
+        self.context = BuildContext(self.root, self.root / "Dockerfile", Path(temp_dir.name) / "cache")
+
+    def members(self, archive):
+        with self.tarfile.open(archive.path) as tar:
+            return sorted(m.name for m in tar.getmembers() if m.isfile())
+
+    def test_dockerignore_patterns(self):
+        ignore = DockerIgnore(["**/*.log", "!logs/keep.log", "/build", "docs/*.md", "# comment"])
+
+        self.assertTrue(ignore.excluded("a/b/c.log"))
+        self.assertTrue(ignore.excluded("top.log"))
+        self.assertFalse(ignore.excluded("logs/keep.log"))
+        self.assertTrue(ignore.excluded("build/output/file"))
+        self.assertTrue(ignore.excluded("docs/README.md"))
+        self.assertFalse(ignore.excluded("docs/api/README.md"))
+        self.assertFalse(ignore.excluded("src/main.rs"))
+
+    def test_context_is_filtered(self):
+        archive = self.context.build()
+
+        self.assertEqual(self.members(archive), [".dockerignore", "Dockerfile", "logs/keep.log", "src/main.rs"])
+        self.assertEqual(archive.files, 4)
+        self.assertEqual(archive.size, archive.path.stat().st_size)
+
+    def test_unchanged_context_is_reused(self):
+        first = self.context.build()
+
+        with patch.object(self.context, '_write') as write:
+            second = self.context.build()
+            write.assert_not_called()
+        self.assertEqual(second, first)
+
+        # Touching a file re-tars it but keeps the content digest
+        os.utime(self.root / "src/main.rs", ns=(0, 0))
+        touched = self.context.build()
+        self.assertNotEqual(touched.path, first.path)
+        self.assertEqual(touched.digest, first.digest)
+
+        (self.root / "src/main.rs").write_text("fn main() { println!(); }\n")
+        self.assertNotEqual(self.context.build().digest, first.digest)
+
+    def test_dockerfile_outside_context(self):
+        """Test a Dockerfile outside the context root is not required to be inside it"""
+        context = BuildContext(self.root / "src", self.root / "Dockerfile", self.context.cache_dir.parent)
+
+        self.assertEqual(self.members(context.build()), ["debug.log", "main.rs"])
+
+    def test_shares_file_digests(self):
+        """Test hashes computed while tarring are reused by tree hashing"""
+        (self.root / "lib").mkdir()
+        (self.root / "lib" / "a.rs").write_text("pub fn a() {}\n")
+        (self.root / "lib" / "b.rs").write_text("pub fn b() {}\n")
+        digests = FileDigests()
+        context = BuildContext(self.root, None, self.context.cache_dir.parent, digests=digests)
+        context.build()
+
+        with patch('tauri_builder.file_digest') as file_digest:
+            file_digest.side_effect = AssertionError("file re-read")
+            shared = tree_digest(self.root / "lib", digests=digests)
+        self.assertEqual(shared, tree_digest(self.root / "lib"))
+
+        (self.root / "lib" / "a.rs").write_text("pub fn a() { todo!() }\n")
+        self.assertNotEqual(tree_digest(self.root / "lib", digests=digests), shared)
+
+
+class TestCacheVolumeManager(unittest.TestCase):
+    """Test CacheVolumeManager class"""
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.manager = CacheVolumeManager(self.client)
+
+    def test_get_mounts(self):
+        """Test cargo, npm and per-target volumes are created and mounted"""
+        volumes, environment = self.manager.get_mounts("linux", "arm64", "rust:1.75")
+
+        self.assertEqual(volumes["tauridock-cargo-registry-rust-1.75"]["bind"], "/usr/local/cargo/registry")
+        self.assertEqual(volumes["tauridock-cargo-git-rust-1.75"]["bind"], "/usr/local/cargo/git")
+        self.assertEqual(volumes["tauridock-target-linux-arm64"]["bind"], "/cache/target")
+        self.assertIn("tauridock-npm-cache", volumes)
+        self.assertEqual(environment["CARGO_TARGET_DIR"], "/cache/target")
+        self.assertNotIn("RUSTC_WRAPPER", environment)
+        self.client.volumes.create.assert_any_call(
+            name="tauridock-target-linux-arm64", labels={"tauridock.cache": "target"}
+        )
+
+    def test_get_mounts_per_project(self):
+        """Test each project gets its own target volume"""
+        first, _ = self.manager.get_mounts("linux", "x64", "rust:latest", project=Path("/src/app-one"))
+        second, _ = self.manager.get_mounts("linux", "x64", "rust:latest", project=Path("/src/app-two"))
+
+        first_target = next(name for name, mount in first.items() if mount["bind"] == "/cache/target")
+        second_target = next(name for name, mount in second.items() if mount["bind"] == "/cache/target")
+        self.assertTrue(first_target.startswith("tauridock-target-linux-x64-"))
+        self.assertNotEqual(first_target, second_target)
+        self.assertIn("tauridock-npm-cache", second)
+
+    def test_get_mounts_with_sccache(self):
+        """Test sccache keeps its cache on a volume"""
+        volumes, environment = self.manager.get_mounts("linux", "x64", "rust:latest", sccache=True)
+
+        self.assertEqual(volumes["tauridock-sccache-rust-latest"]["bind"], "/cache/sccache")
+        self.assertEqual(environment["RUSTC_WRAPPER"], "sccache")
+        self.assertEqual(environment["SCCACHE_DIR"], "/cache/sccache")
+
+    def test_list_and_prune(self):
+        """Test cache volumes are listed with sizes and pruned by kind"""
+        registry = MagicMock(attrs={"Labels": {"tauridock.cache": "cargo-registry"}})
+        registry.name = "tauridock-cargo-registry-rust-latest"
+        target = MagicMock(attrs={"Labels": {"tauridock.cache": "target"}})
+        target.name = "tauridock-target-linux-x64"
+        self.client.volumes.list.return_value = [registry, target]
+        self.client.df.return_value = {"Volumes": [
+            {"Name": registry.name, "UsageData": {"Size": 2048}}
+        ]}
+
+        listing = self.manager.list()
+        self.assertEqual(listing[0], {"name": registry.name, "kind": "cargo-registry", "size": 2048})
+        self.assertEqual(listing[1]["size"], -1)
+
+        removed = self.manager.prune(["target"])
+        self.assertEqual(removed, [target.name])
+        target.remove.assert_called_once_with(force=True)
+        registry.remove.assert_not_called()
+
+
+class TestDockerCacheManager(unittest.TestCase):
+    """Test DockerCacheManager class"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.client = MagicMock()
+        self.client.api.base_url = "http+docker://localhost"
+        self.objects = DockerCacheManager(self.client, Path(self.temp_dir))
+        old = time.time() - 7 * 86400
+        self.client.df.return_value = {
+            "Images": [
+                {"Id": "sha256:old", "RepoTags": ["tauridock-myapp:linux-x64"], "Labels": {},
+                 "Size": 3000, "SharedSize": 1000, "Created": old, "Containers": 0},
+                {"Id": "sha256:busy", "RepoTags": ["tauridock-myapp:windows-x64"], "Labels": {},
+                 "Size": 2000, "SharedSize": 0, "Created": old, "Containers": 1},
+                {"Id": "sha256:dangling", "RepoTags": None, "Labels": {"tauridock.managed": "true"},
+                 "Size": 500, "SharedSize": 0, "Created": old, "Containers": 0},
+                {"Id": "sha256:other", "RepoTags": ["postgres:16"], "Labels": {},
+                 "Size": 9000, "SharedSize": 0, "Created": old, "Containers": 0},
+            ],
+            "Volumes": [
+                {"Name": "tauridock-target-linux-x64", "Labels": {"tauridock.cache": "target"},
+                 "CreatedAt": "2024-01-01T00:00:00Z", "UsageData": {"Size": 4000, "RefCount": 0}},
+                {"Name": "tauridock-npm-cache", "Labels": {"tauridock.cache": "npm"},
+                 "CreatedAt": "2024-01-01T00:00:00Z", "UsageData": {"Size": 100, "RefCount": 0}},
+            ],
+            "Containers": [],
+            "BuildCache": [
+                {"Size": 1500, "Shared": False, "InUse": False, "LastUsedAt": "2024-01-01T00:00:00.123456789Z"},
+            ],
+        }
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_usage(self):
+        """Test only tauridock's objects are reported, with recorded last use"""
+        self.objects.record("volume", "tauridock-npm-cache")
+
+        usage = {o["id"]: o for o in self.objects.usage()}
+
+        self.assertNotIn("sha256:other", usage)
+        self.assertEqual(usage["sha256:old"]["size"], 2000)
+        self.assertTrue(usage["sha256:busy"]["in_use"])
+        self.assertTrue(usage["sha256:dangling"]["dangling"])
+        self.assertAlmostEqual(usage["tauridock-npm-cache"]["last_used"], time.time(), delta=5)
+        self.assertEqual(usage["tauridock-target-linux-x64"]["last_used"], 1704067200)
+        self.assertEqual(usage["build-cache"]["size"], 1500)
+
+    def test_record_is_safe_across_managers(self):
+        """Test managers sharing a cache directory neither fail nor lose updates"""
+        import threading
+        managers = [self.objects, DockerCacheManager(self.client, Path(self.temp_dir))]
+        errors = []
+
+        def record(worker):
+            try:
+                for i in range(50):
+                    managers[worker % 2].record("volume", f"v{worker}-{i}")
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=record, args=(worker,)) for worker in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        usage = json.loads((Path(self.temp_dir) / "docker-usage.json").read_text())
+        self.assertEqual(len(usage["http+docker://localhost"]), 200)
+
+    def test_record_is_best_effort(self):
+        """Test a broken cache directory does not fail the caller"""
+        blocked = Path(self.temp_dir) / "file"
+        blocked.write_text("")
+        DockerCacheManager(self.client, blocked).record("image", "sha256:old")
+
+    def test_gc_evicts_least_recently_used(self):
+        """Test eviction skips hot objects and trims the build cache to the rest of the budget"""
+        self.objects.record("image", "sha256:old")
+        self.client.api.prune_builds.return_value = {"SpaceReclaimed": 1000}
+
+        stats = self.objects.gc(budget=5000)
+
+        # 2000 + 2000 + 500 + 4000 + 100 + 1500: the dangling image and both
+        # volumes go, the recently used and busy images stay
+        self.assertEqual([o["id"] for o in stats["removed"]],
+                         ["sha256:dangling", "tauridock-target-linux-x64", "tauridock-npm-cache"])
+        self.client.images.remove.assert_called_once_with("sha256:dangling")
+        self.client.volumes.get.assert_any_call("tauridock-target-linux-x64")
+        self.client.api.prune_builds.assert_called_once_with(keep_storage=1000)
+        self.assertEqual(stats["bytes"], 500 + 4000 + 100 + 1000)
+
+    def test_gc_dry_run(self):
+        """Test a dry run removes nothing"""
+        stats = self.objects.gc(budget=0, dry_run=True)
+
+        self.assertEqual({o["id"] for o in stats["removed"]},
+                         {"sha256:dangling", "sha256:old", "tauridock-target-linux-x64", "tauridock-npm-cache"})
+        self.client.images.remove.assert_not_called()
+        self.client.volumes.get.assert_not_called()
+        self.client.api.prune_builds.assert_not_called()
+
+
+class TestFrontendBuilder(unittest.TestCase):
+    """Test FrontendBuilder class"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.root = Path(self.temp_dir.name)
+        (self.root / "src-tauri").mkdir()
+        (self.root / "src-tauri" / "tauri.conf.json").write_text(
+            json.dumps({"build": {"frontendDist": "../dist"}})
+        )
+        (self.root / "src").mkdir()
+        (self.root / "src" / "main.js").write_text("console.log('hi')")
+        (self.root / "package.json").write_text('{"name": "app"}')
+        (self.root / "package-lock.json").write_text("{}")
+
+        self.config = BuildConfig(
+            dockerfile=self.root / "Dockerfile",
+            frontend_port=3003,
+            mode="build",
+            platforms=["linux"],
+            architectures=["x64"],
+            app_name="TestApp",
+            version="1.0.0",
+            output_dir=self.root / "out",
+            optimize=True,
+            sign=False,
+            bundle_types={},
+            docker_image="rust:latest",
+            docker_cache=False,
+            cache_dir=self.root / ".tauri-cache"
+        )
+        self.docker_manager = MagicMock()
+        self.builder = FrontendBuilder(self.config, self.docker_manager, root=self.root)
+
+    def _fake_npm_build(self, **kwargs):
+        (self.root / "dist").mkdir(exist_ok=True)
+        (self.root / "dist" / "index.html").write_text("<html></html>")
+        return 0, ""
+
+    def test_get_dist_dir(self):
+        """Test frontendDist (v2) and distDir (v1) are resolved"""
+        self.assertEqual(self.builder.get_dist_dir(), "dist")
+
+        (self.root / "src-tauri" / "tauri.conf.json").write_text(
+            json.dumps({"build": {"distDir": "http://localhost:3000"}})
+        )
+        self.assertIsNone(self.builder.get_dist_dir())
+
+    def test_fingerprint(self):
+        """Test fingerprint covers lockfile and frontend but not Rust sources"""
+        original = self.builder.fingerprint("dist")
+
+        (self.root / "src-tauri" / "main.rs").write_text("fn main() {}")
+        self.assertEqual(original, self.builder.fingerprint("dist"))
+
+        (self.root / "package-lock.json").write_text('{"lockfileVersion": 3}')
+        changed_lock = self.builder.fingerprint("dist")
+        self.assertNotEqual(original, changed_lock)
+
+        (self.root / "src" / "main.js").write_text("console.log('changed')")
+        self.assertNotEqual(changed_lock, self.builder.fingerprint("dist"))
+
+    def test_build_once_and_cache(self):
+        """Test frontend is built once and then served from the cache"""
+        self.docker_manager.run_container.side_effect = self._fake_npm_build
+
+        first = self.builder.build()
+        second = self.builder.build()
+
+        self.assertEqual(first, second)
+        self.assertEqual(first.dist_dir, "dist")
+        self.assertEqual((first.path / "index.html").read_text(), "<html></html>")
+        self.docker_manager.run_container.assert_called_once()
+        self.assertIn("npm run build", self.docker_manager.run_container.call_args[1]["command"])
+
+    def test_build_uses_target_image(self):
+        """Test npm runs in the image of a requested target instead of an extra one"""
+        self.docker_manager.run_container.side_effect = self._fake_npm_build
+
+        self.builder.build("windows", "x64")
+
+        self.docker_manager.build_image.assert_called_once_with("windows", "x64")
+
+    def test_prune_keeps_recent_outputs(self):
+        """Test only the most recently used outputs survive pruning"""
+        cache_dir = self.root / ".tauri-cache" / "frontend"
+        for i in range(5):
+            output = cache_dir / f"fingerprint{i}"
+            output.mkdir(parents=True)
+            (output / "index.html").write_text("x" * 10)
+            os.utime(output, (i + 1, i + 1))
+
+        with patch.object(FrontendBuilder, "GRACE_PERIOD", 0):
+            freed = FrontendBuilder.prune(cache_dir, keep=2)
+
+        self.assertEqual(freed, 30)
+        self.assertEqual(sorted(p.name for p in cache_dir.iterdir()), ["fingerprint3", "fingerprint4"])
+
+    def test_build_without_package_json(self):
+        """Test projects without an npm frontend are skipped"""
+        (self.root / "package.json").unlink()
+
+        self.assertIsNone(self.builder.build())
+        self.docker_manager.run_container.assert_not_called()
+
+
+class TestContainerPool(unittest.TestCase):
+    """Test ContainerPool class"""
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.api.exec_create.side_effect = lambda *args, **kwargs: {"Id": "exec"}
+        self.client.api.exec_start.side_effect = lambda *args, **kwargs: iter([b"compiled\n"])
+        self.client.api.exec_inspect.return_value = {"ExitCode": 0}
+        self.client.containers.run.side_effect = lambda **kwargs: MagicMock(status="running")
+        self.pool = ContainerPool(self.client, max_size=1, idle_timeout=600)
+        self.addCleanup(self.pool.close)
+
+    def test_reuses_container_through_exec(self):
+        """Test repeated builds exec into the same warm container"""
+        volumes = {"/project": {"bind": "/app", "mode": "rw"}}
+
+        for _ in range(3):
+            log = BuildLog()
+            status = self.pool.run("image", "cargo build", volumes, {"A": "1"}, log)
+            self.assertEqual(status, 0)
+            self.assertEqual(log.get_tail(), "compiled")
+
+        self.client.containers.run.assert_called_once()
+        self.client.api.exec_create.assert_any_call(
+            unittest.mock.ANY, ["/bin/sh", "-c", "cargo build"], environment={"A": "1"}
+        )
+        # Each job is followed by a workspace reset
+        self.client.api.exec_create.assert_any_call(
+            unittest.mock.ANY, ["/bin/sh", "-c", ContainerPool.RESET_COMMAND], environment={}
+        )
+
+    def test_replaces_unhealthy_container(self):
+        """Test a container that stopped is replaced before reuse"""
+        self.pool.run("image", "true", {}, {}, BuildLog())
+        self.pool._entries[0].container.status = "exited"
+
+        self.pool.run("image", "true", {}, {}, BuildLog())
+
+        self.assertEqual(self.client.containers.run.call_count, 2)
+
+    def test_evicts_idle_container_when_full(self):
+        """Test the least recently used idle container makes room"""
+        self.pool.run("image-a", "true", {}, {}, BuildLog())
+        first = self.pool._entries[0].container
+
+        self.pool.run("image-b", "true", {}, {}, BuildLog())
+
+        first.remove.assert_called_once_with(force=True)
+        self.assertEqual(len(self.pool._entries), 1)
+
+    def test_exhausted_pool(self):
+        """Test None is returned when every container is busy"""
+        self.pool.run("image", "true", {}, {}, BuildLog())
+        self.pool._entries[0].busy = True
+
+        self.assertIsNone(self.pool.run("image", "true", {}, {}, BuildLog()))
+
+    def test_reap_idle(self):
+        """Test containers idle past the timeout are removed"""
+        self.pool.run("image", "true", {}, {}, BuildLog())
+        container = self.pool._entries[0].container
+        self.pool._entries[0].last_used -= 601
+
+        self.pool.reap_idle()
+
+        self.assertEqual(self.pool._entries, [])
+        container.remove.assert_called_once_with(force=True)
+
+
+class TestHostPool(unittest.TestCase):
+    """Test HostPool dispatch and remote builds"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.config = BuildConfig(
+            dockerfile=Path("Dockerfile"),
+            frontend_port=3003,
+            mode="build",
+            platforms=["linux"],
+            architectures=["x64", "arm64"],
+            app_name="TestApp",
+            version="1.0.0",
+            output_dir=Path(self.temp_dir.name) / "dist",
+            optimize=True,
+            sign=False,
+            bundle_types={"linux": ["deb"]},
+            docker_image="rust:latest",
+            docker_cache=False,
+            cache_dir=Path(self.temp_dir.name) / ".tauri-cache"
+        )
+
+    def test_dispatches_to_least_loaded_compatible_host(self):
+        """Test targets go to the compatible host with the lowest load"""
+        small = DockerHost("small", MagicMock(), capacity=1, architectures=["x64"])
+        large = DockerHost("large", MagicMock(), capacity=2)
+        arm = DockerHost("arm", MagicMock(), capacity=1, architectures=["arm64"])
+        pool = HostPool([small, large, arm])
+
+        with pool.acquire("linux", "x64") as first, pool.acquire("linux", "x64") as second, \
+                pool.acquire("linux", "x64") as third, pool.acquire("linux", "arm64") as fourth:
+            self.assertEqual([first.name, second.name, third.name, fourth.name],
+                             ["large", "small", "large", "arm"])
+            self.assertEqual(large.active, 2)
+
+        self.assertEqual([host.active for host in pool.hosts], [0, 0, 0])
+        with self.assertRaises(RuntimeError):
+            with HostPool([small]).acquire("linux", "arm64"):
+                pass
+
+    def test_from_config_skips_unreachable_hosts(self):
+        """Test local and remote entries are connected and dead hosts dropped"""
+        self.config.docker_hosts = [
+            {"name": "here", "capacity": 2},
+            {"name": "box", "url": "tcp://box:2375", "capacity": 4, "architectures": ["arm64"]},
+            {"url": "tcp://down:2375"},
+        ]
+        clients = {"tcp://box:2375": MagicMock(), "tcp://down:2375": MagicMock()}
+        clients["tcp://down:2375"].ping.side_effect = ConnectionError("refused")
+        local_manager = MagicMock()
+
+        pool = HostPool.from_config(self.config, local_manager, client_factory=clients.__getitem__)
+
+        self.assertEqual([host.name for host in pool.hosts], ["here", "box"])
+        self.assertIs(pool.hosts[0].manager, local_manager)
+        self.assertTrue(pool.hosts[1].manager.remote)
+        self.assertIs(pool.hosts[1].manager.client, clients["tcp://box:2375"])
+        self.assertEqual(pool.capacity, 6)
+        self.assertTrue(pool.hosts[1].supports("linux", "arm64"))
+        self.assertFalse(pool.hosts[1].supports("linux", "x64"))
+
+    def test_scheduler_passes_dispatched_host(self):
+        """Test scheduled jobs run on a host sized by pool capacity"""
+        pool = HostPool([DockerHost("x64-box", MagicMock(), capacity=2, architectures=["x64"]),
+                         DockerHost("arm-box", MagicMock(), capacity=1, architectures=["arm64"])])
+        jobs = [BuildJob(platform="linux", arch=arch, fn=lambda host: [host.name]) for arch in ["x64", "arm64"]]
+
+        with BuildScheduler(self.config, hosts=pool) as scheduler:
+            self.assertEqual(scheduler.max_workers, 3)
+            results = {job.key: future.result() for job, future in scheduler.schedule(jobs)}
+
+        self.assertEqual(results, {"linux-x64": ["x64-box"], "linux-arm64": ["arm-box"]})
+
+    def test_remote_run_copies_files_in_and_out(self):
+        """Test remote builds upload archives and stream artifacts back"""
+        archive = Path(self.temp_dir.name) / "sources.tar"
+        with tarfile.open(archive, "w") as tar:
+            info = tarfile.TarInfo("Cargo.toml")
+            tar.addfile(info)
+
+        bundle = io.BytesIO()
+        with tarfile.open(fileobj=bundle, mode="w") as tar:
+            data = b"debian package"
+            info = tarfile.TarInfo("bundle/deb/app.deb")
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+        payload = bundle.getvalue()
+
+        container = MagicMock()
+        container.logs.return_value = iter([b"Finished release\n"])
+        container.wait.return_value = {"StatusCode": 0}
+        container.get_archive.return_value = (iter([payload[:700], payload[700:]]), {})
+        client = MagicMock()
+        client.containers.create.return_value = container
+
+        manager = DockerManager(self.config, client=client, remote=True, context=MagicMock())
+        dest = Path(self.temp_dir.name) / "target" / "linux-x64" / "release"
+        status, logs = manager.run_with_archives(
+            "image", "cargo tauri build", uploads=[("/app", archive)],
+            downloads=[("/app/target/linux-x64/release/bundle", dest)]
+        )
+
+        self.assertEqual(status, 0)
+        self.assertEqual(logs, "Finished release")
+        self.assertIsNone(manager.pool)
+        self.assertFalse(client.containers.create.call_args[1]["volumes"])
+
+        # The target directory is created before the sources are copied into it
+        dirs, sources = container.put_archive.call_args_list
+        with tarfile.open(fileobj=io.BytesIO(dirs[0][1])) as tar:
+            self.assertEqual(tar.getnames(), ["app"])
+        self.assertEqual(sources[0][0], "/app")
+        container.start.assert_called_once()
+        self.assertEqual((dest / "bundle" / "deb" / "app.deb").read_bytes(), b"debian package")
+        container.remove.assert_called_once_with(force=True)
+
+    def test_extract_rejects_escaping_paths(self):
+        """Test downloaded archives cannot write outside the destination"""
+        bundle = io.BytesIO()
+        with tarfile.open(fileobj=bundle, mode="w") as tar:
+            info = tarfile.TarInfo("../escaped")
+            tar.addfile(info)
+
+        dest = Path(self.temp_dir.name) / "out"
+        with self.assertRaises(tarfile.TarError):
+            DockerManager._extract_archive([bundle.getvalue()], dest)
+        self.assertFalse((Path(self.temp_dir.name) / "escaped").exists())
+
+    def test_remote_target_build(self):
+        """Test a target dispatched to a remote host builds from copies"""
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir.name)
+        self.addCleanup(os.chdir, cwd)
+        Path("src-tauri").mkdir()
+        Path("src-tauri", "Cargo.toml").write_text("[package]\n")
+
+        manager = MagicMock(remote=True)
+        manager.build_image.return_value = "tauridock-linux-x64:latest"
+        manager.cache_volumes.get_mounts.return_value = ({"tauridock-npm-cache": {"bind": "/cache/npm"}}, {})
+
+        def run_with_archives(image, command, uploads, downloads, volumes, environment, log):
+            bundle_dir = downloads[0][1] / "bundle" / "deb"
+            bundle_dir.mkdir(parents=True)
+            (bundle_dir / "app.deb").write_bytes(b"debian package")
+            return 0, ""
+        manager.run_with_archives.side_effect = run_with_archives
+
+        builder = PlatformBuilder(self.config, MagicMock())
+        artifacts = builder.build_for_platform("linux", "x64", DockerHost("box", manager))
+
+        self.assertEqual([path.name for path in artifacts], ["app.deb"])
+        manager.run_container.assert_not_called()
+        kwargs = manager.run_with_archives.call_args[1]
+        self.assertEqual(kwargs["uploads"][0][0], "/app")
+        with tarfile.open(kwargs["uploads"][0][1]) as tar:
+            self.assertIn("src-tauri/Cargo.toml", tar.getnames())
+        self.assertNotIn(str(Path.cwd()), kwargs["volumes"])
+        self.assertIn("cp -r $CARGO_TARGET_DIR", kwargs["command"])
+
+
+class TestFileWatcher(unittest.TestCase):
+    """Test FileWatcher debouncing and the polling backend"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.root = Path(self.temp_dir.name)
+
+    def test_debounces_bursts_into_one_batch(self):
+        """Test a burst of events is reported once, without ignored paths"""
+        watcher = FileWatcher(self.root, debounce=0.05, backend="poll",
+                              excluded_paths=(self.root / "dist",))
+        for path in ["src/main.ts", "src/App.vue", "src/main.ts", "node_modules/vue/index.js",
+                     "src-tauri/target/debug/app", "src/.App.vue.swp", "dist/index.html"]:
+            watcher.record(path)
+        watcher.record(str(self.root / "index.html"))
+
+        self.assertEqual(watcher.wait(timeout=2), ["index.html", "src/App.vue", "src/main.ts"])
+        self.assertEqual(watcher.wait(timeout=0.05), [])
+
+    def test_steady_stream_flushes_after_max_delay(self):
+        """Test continuous changes still produce batches"""
+        watcher = FileWatcher(self.root, debounce=10, max_delay=0.05, backend="poll")
+        watcher.record("src/main.ts")
+
+        start = time.monotonic()
+        self.assertEqual(watcher.wait(timeout=5), ["src/main.ts"])
+        self.assertLess(time.monotonic() - start, 5)
+
+    def test_polling_backend_detects_changes(self):
+        """Test the fallback backend reports created and modified files"""
+        (self.root / "src").mkdir()
+        (self.root / "src" / "main.ts").write_text("one")
+        (self.root / "node_modules").mkdir()
+
+        with FileWatcher(self.root, debounce=0.05, poll_interval=0.02, backend="poll") as watcher:
+            time.sleep(0.05)
+            (self.root / "src" / "main.ts").write_text("two, longer")
+            (self.root / "src" / "new.ts").write_text("new")
+            (self.root / "node_modules" / "dep.js").write_text("ignored")
+
+            self.assertEqual(watcher.wait(timeout=5), ["src/main.ts", "src/new.ts"])
+
+
+class TestDevSession(unittest.TestCase):
+    """Test DevSession change classification and actions"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.root = Path(self.temp_dir.name)
+        self.config = BuildConfig(
+            dockerfile=self.root / "Dockerfile",
+            frontend_port=3003,
+            mode="dev",
+            platforms=["linux"],
+            architectures=["x64"],
+            app_name="TestApp",
+            version="1.0.0",
+            output_dir=self.root / "dist",
+            optimize=False,
+            sign=False,
+            bundle_types={},
+            docker_image="rust:latest",
+            docker_cache=True,
+            watch=True
+        )
+        self.manager = MagicMock()
+        self.manager.exec_command.return_value = 0
+        self.session = DevSession(self.config, self.manager, root=self.root, watcher=MagicMock())
+        self.container = MagicMock()
+        self.session.container = self.container
+        self.session.image = "tauridock-linux-x64:latest"
+
+    def test_classifies_changes(self):
+        """Test each change maps to the cheapest sufficient action"""
+        self.assertEqual(self.session.plan(["src/App.vue", "index.html"]), "frontend")
+        self.assertEqual(self.session.plan(["src/App.vue", "src-tauri/src/main.rs"]), "rust")
+        self.assertEqual(self.session.plan(["src-tauri/Cargo.toml"]), "rust")
+        self.assertEqual(self.session.plan(["src-tauri/tauri.conf.json"]), "config")
+        self.assertEqual(self.session.plan(["package-lock.json", "src-tauri/src/lib.rs"]), "config")
+        self.assertEqual(self.session.plan(["Dockerfile", "src/App.vue"]), "docker")
+        self.assertEqual(self.session.plan([".tauridock.yml"]), "docker")
+
+    def test_dockerfile_outside_project(self):
+        """Test a Dockerfile outside the watched root does not break the session"""
+        with tempfile.TemporaryDirectory() as other:
+            self.config.dockerfile = Path(other) / "Dockerfile"
+            session = DevSession(self.config, self.manager, root=self.root, watcher=MagicMock())
+
+        self.assertIsNone(session.dockerfile)
+        self.assertEqual(session.plan(["Dockerfile"]), "frontend")
+        self.assertEqual(session.plan([".dockerignore"]), "docker")
+
+    def test_frontend_change_touches_files_in_container(self):
+        """Test frontend changes are forwarded to the dev server's watcher"""
+        (self.root / "src").mkdir()
+        (self.root / "src" / "App Main.vue").write_text("<template/>")
+
+        self.session.apply(["src/App Main.vue", "src/deleted.ts"])
+
+        self.manager.exec_command.assert_called_once_with(
+            self.container, "touch -c -- '/app/src/App Main.vue'")
+        self.container.restart.assert_not_called()
+
+    def test_rust_change_rebuilds_then_restarts(self):
+        """Test Rust changes compile in place and restart only the dev process on success"""
+        self.session.apply(["src-tauri/src/main.rs"])
+
+        commands = [c[0][1] for c in self.manager.exec_command.call_args_list]
+        self.assertEqual(commands, [DevSession.REBUILD_COMMAND, DevSession.RESTART_COMMAND])
+        self.container.restart.assert_not_called()
+
+        self.manager.exec_command.reset_mock()
+        self.manager.exec_command.return_value = 101
+        self.session.apply(["src-tauri/src/main.rs"])
+        self.assertEqual(self.manager.exec_command.call_count, 1)
+        self.container.restart.assert_not_called()
+
+    def test_rebuild_uses_tauri_dev_features(self):
+        """Test the rebuild drops default features like tauri dev does for a dev server URL"""
+        (self.root / "src-tauri").mkdir()
+        (self.root / "src-tauri" / "tauri.conf.json").write_text(
+            json.dumps({"build": {"devPath": "http://localhost:1420"}}))
+
+        session = DevSession(self.config, self.manager, root=self.root, watcher=MagicMock())
+
+        self.assertEqual(session.rebuild_command, DevSession.REBUILD_COMMAND + " --no-default-features")
+
+    def test_config_change_reinstalls_and_restarts_dev_process(self):
+        """Test config changes reinstall dependencies, restarting the container only as a fallback"""
+        self.session.apply(["package.json"])
+
+        commands = [c[0][1] for c in self.manager.exec_command.call_args_list]
+        self.assertEqual(commands, [DevSession.INSTALL_COMMAND, DevSession.RESTART_COMMAND])
+        self.container.restart.assert_not_called()
+
+        self.manager.exec_command.side_effect = [0, 1]
+        self.session.apply(["package.json"])
+        self.container.restart.assert_called_once()
+
+    def test_dockerfile_change_recreates_container(self):
+        """Test a rebuilt image replaces the container, an unchanged one restarts it"""
+        digests = iter(["sha256:new", "sha256:new"])
+        self.manager.image_digests = {self.session.image: "sha256:old"}
+
+        def build_image(platform, arch):
+            self.manager.image_digests[self.session.image] = next(digests)
+            return self.session.image
+        self.manager.build_image.side_effect = build_image
+        replacement = MagicMock()
+        self.manager.start_dev_container.return_value = replacement
+
+        self.session.apply(["Dockerfile"])
+
+        self.container.remove.assert_called_once_with(force=True)
+        self.manager.start_dev_container.assert_called_once_with(
+            self.session.image, self.root.resolve(), DevSession.DEV_COMMAND)
+        self.assertIs(self.session.container, replacement)
+
+        self.session.apply(["Dockerfile"])
+        self.assertEqual(self.manager.exec_command.call_args[0][1], DevSession.RESTART_COMMAND)
+        replacement.restart.assert_not_called()
+        self.manager.start_dev_container.assert_called_once()
+
+
 class TestPlatformBuilder(unittest.TestCase):
     """Test PlatformBuilder class"""
 
@@ -197,25 +1507,106 @@ class TestPlatformBuilder(unittest.TestCase):
         self.assertIn("--target x86_64-unknown-linux-gnu", cmd)
         self.assertIn("--release", cmd)  # Because optimize=True
         self.assertIn("--bundles deb", cmd)
+        # Bundles are exported from the target dir cache volume
+        self.assertIn("cp -r $CARGO_TARGET_DIR/x86_64-unknown-linux-gnu/release/bundle "
+                      "/app/target/linux-x64/release/", cmd)
+        # Stale bundles on the volume are cleared before building
+        self.assertLess(cmd.index("rm -rf $CARGO_TARGET_DIR/x86_64-unknown-linux-gnu/release/bundle"),
+                        cmd.index("cargo tauri build"))
+
+    def test_prepare_build_command_skips_baked_setup(self):
+        """Test setup steps satisfied by the image toolchain are skipped"""
+        builder = PlatformBuilder(self.config, self.mock_docker_manager)
+        baked = {"rustc": "rustc 1.75.0", "tauri": "tauri-cli 1.5.9", "node": "v20.10.0",
+                 "targets": ["x86_64-unknown-linux-gnu"]}
 
-    @patch('pathlib.Path.exists')
-    @patch('pathlib.Path.glob')
-    @patch('shutil.copy2')
-    def test_collect_artifacts(self, mock_copy, mock_glob, mock_exists):
-        """Test artifact collection"""
+        cmd = builder._prepare_build_command("linux", "x64", "x86_64-unknown-linux-gnu", toolchain=baked)
+        self.assertNotIn("rustup", cmd)
+        self.assertNotIn("cargo install", cmd)
+
+        cmd = builder._prepare_build_command("linux", "arm64", "aarch64-unknown-linux-gnu",
+                                             toolchain={**baked, "tauri": None})
+        self.assertIn("rustup target add aarch64-unknown-linux-gnu", cmd)
+        self.assertIn("cargo install tauri-cli", cmd)
+
+    def test_prepare_build_command_with_shared_frontend(self):
+        """Test the per-target command only compiles and bundles"""
         builder = PlatformBuilder(self.config, self.mock_docker_manager)
+        builder.frontend_output = FrontendOutput(Path("/cache/frontend/abc"), "dist")
 
-        # Mock file system
-        mock_exists.return_value = True
-        mock_file = MagicMock()
-        mock_file.is_file.return_value = True
-        mock_file.name = "app.deb"
-        mock_glob.return_value = [mock_file]
+        cmd = builder._prepare_build_command("linux", "x64", "x86_64-unknown-linux-gnu")
 
-        artifacts = builder._collect_artifacts("linux", "x64")
+        self.assertNotIn("npm", cmd)
+        self.assertIn("cargo tauri build", cmd)
+        self.assertIn('--config \'{"build": {"beforeBuildCommand": ""}}\'', cmd)
 
-        self.assertEqual(len(artifacts), 1)
-        mock_copy.assert_called_once()
+    def test_prepare_build_command_without_cache_volumes(self):
+        """Test bundles stay in place when the target dir is not on a volume"""
+        self.config.cache_volumes = False
+        builder = PlatformBuilder(self.config, self.mock_docker_manager)
+
+        cmd = builder._prepare_build_command("linux", "x64", "x86_64-unknown-linux-gnu")
+
+        self.assertNotIn("CARGO_TARGET_DIR", cmd)
+
+    def test_collect_artifacts(self):
+        """Test artifact collection"""
+        import hashlib
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cwd = os.getcwd()
+            os.chdir(temp_dir)
+            self.addCleanup(os.chdir, cwd)
+
+            bundle_dir = Path("target") / "linux-x64" / "release" / "bundle" / "deb"
+            bundle_dir.mkdir(parents=True)
+            (bundle_dir / "app.deb").write_bytes(b"debian package")
+            self.config.output_dir = Path(temp_dir) / "dist"
+
+            builder = PlatformBuilder(self.config, self.mock_docker_manager)
+            artifacts = builder._collect_artifacts("linux", "x64")
+
+            self.assertEqual(artifacts, [Path(temp_dir) / "dist" / "linux" / "app.deb"])
+            self.assertEqual(artifacts[0].read_bytes(), b"debian package")
+
+            record = builder.manifest.get(artifacts[0])
+            self.assertEqual(record.size, len(b"debian package"))
+            self.assertEqual(record.sha256, hashlib.sha256(b"debian package").hexdigest())
+
+    def test_build_merged(self):
+        """Test architectures of a platform share one container run"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cwd = os.getcwd()
+            os.chdir(temp_dir)
+            self.addCleanup(os.chdir, cwd)
+            self.config.output_dir = Path(temp_dir) / "dist"
+            self.config.cache_dir = Path(temp_dir) / ".tauri-cache"
+
+            manager = MagicMock(remote=False, toolchains={})
+            manager.build_image.return_value = "tauridock-linux-x64:latest"
+            manager.cache_volumes.get_mounts.return_value = ({}, {"CARGO_TARGET_DIR": "/cache/target"})
+
+            def run_container(image, command, volumes, environment, log):
+                for arch in ("x64", "arm64"):
+                    bundle_dir = Path("target") / f"linux-{arch}" / "release" / "bundle" / "deb"
+                    bundle_dir.mkdir(parents=True)
+                    (bundle_dir / f"app_{arch}.deb").write_bytes(arch.encode())
+                return 0, ""
+            manager.run_container.side_effect = run_container
+
+            builder = PlatformBuilder(self.config, manager)
+            artifacts = builder.build_merged("linux", ["x64", "arm64"])
+
+            self.assertEqual({arch: [path.name for path in paths] for arch, paths in artifacts.items()},
+                             {"x64": ["app_x64.deb"], "arm64": ["app_arm64.deb"]})
+            manager.run_container.assert_called_once()
+            manager.cache_volumes.get_mounts.assert_called_once_with(
+                "linux", "x64-arm64", "rust:latest", sccache=False, project=Path.cwd())
+            command = manager.run_container.call_args[1]["command"]
+            self.assertEqual(command.count("npm run build"), 1)
+            self.assertLess(command.index("--target x86_64-unknown-linux-gnu"),
+                            command.index("--target aarch64-unknown-linux-gnu"))
+            self.assertIn("/app/target/linux-arm64/release/", command)
 
 
 class TestGitHubPublisher(unittest.TestCase):
@@ -302,6 +1693,177 @@ class TestGitHubPublisher(unittest.TestCase):
         finally:
             temp_path.unlink()
 
+    def test_publication_stays_draft_when_targets_fail(self):
+        """Test a pipelined release is only published once every target landed"""
+        release = MagicMock(draft=True, html_url="https://github.com/user/repo/releases/v1.0.0")
+        batch = MagicMock()
+        batch.finish.return_value = {"app.deb": "uploaded"}
+        publication = ReleasePublication(self.config, release, batch, publish=True)
+
+        publication.add("linux-x64", [Path("app.deb")])
+        batch.add.assert_called_once_with({Path("app.deb"): "app.deb (linux)"},
+                                          on_complete=ANY, digests={})
+
+        with self.assertRaisesRegex(RuntimeError, "windows-x64"):
+            publication.finish(["windows-x64"])
+        release.update_release.assert_not_called()
+
+        publication.finish()
+        release.update_release.assert_called_once_with(
+            name=release.title, message=release.body, draft=False, prerelease=False)
+
+
+class FakeGitHubServer:
+    """Minimal in-process GitHub releases API used to exercise uploads"""
+
+    def __init__(self):
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        from urllib.parse import urlparse, parse_qs
+
+        self.assets = {}
+        self.uploads = []
+        self.fail_uploads = {}
+        self._next_id = 1
+        self._lock = threading.Lock()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body=b"", content_type="application/json"):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                path = urlparse(self.path).path
+                if path == "/repos/owner/repo/releases/1/assets":
+                    listing = [{k: v for k, v in a.items() if k != "content"} for a in fake.assets.values()]
+                    return self._send(200, json.dumps(listing).encode())
+                asset_id = int(path.rsplit("/", 1)[1])
+                self._send(200, fake.assets[asset_id]["content"], "application/octet-stream")
+
+            def do_POST(self):
+                url = urlparse(self.path)
+                name = parse_qs(url.query)["name"][0]
+                content = self.rfile.read(int(self.headers["Content-Length"]))
+                with fake._lock:
+                    if fake.fail_uploads.get(name, 0) > 0:
+                        fake.fail_uploads[name] -= 1
+                        return self._send(502)
+                    fake.uploads.append(name)
+                    fake.add_asset(name, content)
+                self._send(201, b"{}")
+
+            def do_DELETE(self):
+                asset_id = int(urlparse(self.path).path.rsplit("/", 1)[1])
+                with fake._lock:
+                    fake.assets.pop(asset_id, None)
+                self._send(204)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.05},
+                                       daemon=True)
+        self.thread.start()
+
+    def add_asset(self, name, content):
+        self.assets[self._next_id] = {"id": self._next_id, "name": name,
+                                      "size": len(content), "content": content}
+        self._next_id += 1
+
+    def asset_content(self, name):
+        return next(a["content"] for a in self.assets.values() if a["name"] == name)
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class TestReleaseUploader(unittest.TestCase):
+    """Test ReleaseUploader against a fake GitHub API"""
+
+    def setUp(self):
+        import hashlib
+
+        self.server = FakeGitHubServer()
+        self.addCleanup(self.server.close)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+        self.files = {}
+        self.digests = {}
+        for name, content in [("app.deb", b"debian"), ("app.msi", b"windows installer"), ("app.dmg", b"mac")]:
+            path = Path(self.temp_dir.name) / name
+            path.write_bytes(content)
+            self.files[path] = f"{name} (label)"
+            self.digests[name] = hashlib.sha256(content).hexdigest()
+
+        self.uploader = ReleaseUploader(
+            "token", "owner/repo", api_url=self.server.url, concurrency=3, backoff=0
+        )
+        self.upload_url = f"{self.server.url}/uploads/repos/owner/repo/releases/1/assets{{?name,label}}"
+
+    def test_uploads_assets_and_checksum_manifest(self):
+        """Test all assets are uploaded once along with SHA256SUMS"""
+        results = self.uploader.upload(1, self.upload_url, self.files)
+
+        self.assertEqual(set(results.values()), {"uploaded"})
+        self.assertEqual(sorted(self.server.uploads), ["SHA256SUMS", "app.deb", "app.dmg", "app.msi"])
+        manifest = self.server.asset_content("SHA256SUMS").decode()
+        self.assertIn(f"{self.digests['app.deb']}  app.deb", manifest)
+        self.assertEqual(len(manifest.splitlines()), 3)
+
+    def test_retries_transient_failures(self):
+        """Test a failed upload is retried without failing the release"""
+        self.server.fail_uploads["app.msi"] = 2
+
+        results = self.uploader.upload(1, self.upload_url, self.files)
+
+        self.assertEqual(results["app.msi"], "uploaded")
+        self.assertEqual(self.server.asset_content("app.msi"), b"windows installer")
+
+    def test_reports_persistent_failures(self):
+        """Test assets failing every attempt are reported and left out of SHA256SUMS"""
+        self.server.fail_uploads["app.msi"] = 10
+
+        results = self.uploader.upload(1, self.upload_url, self.files)
+
+        self.assertEqual(results["app.msi"], "failed")
+        self.assertEqual(results["app.deb"], "uploaded")
+        self.assertNotIn("app.msi", self.server.asset_content("SHA256SUMS").decode())
+
+    def test_resumes_existing_release(self):
+        """Test matching assets are skipped and mismatching ones replaced"""
+        self.server.add_asset("app.deb", b"debian")
+        self.server.add_asset("app.msi", b"stale installer")
+        self.server.add_asset("SHA256SUMS", f"{self.digests['app.deb']}  app.deb\n".encode())
+
+        results = self.uploader.upload(1, self.upload_url, self.files)
+
+        self.assertEqual(results, {"app.deb": "skipped", "app.msi": "uploaded", "app.dmg": "uploaded"})
+        self.assertNotIn("app.deb", self.server.uploads)
+        self.assertEqual(self.server.asset_content("app.msi"), b"windows installer")
+        self.assertEqual(len(self.server.asset_content("SHA256SUMS").decode().splitlines()), 3)
+
+    def test_batch_accepts_files_while_uploading(self):
+        """Test files added to a running batch share one SHA256SUMS"""
+        completed = []
+        batch = self.uploader.start(1, self.upload_url)
+        for path, label in self.files.items():
+            batch.add({path: label}, on_complete=lambda file_path, outcome: completed.append(file_path.name))
+
+        results = batch.finish()
+
+        self.assertEqual(set(results.values()), {"uploaded"})
+        self.assertEqual(sorted(completed), ["app.deb", "app.dmg", "app.msi"])
+        self.assertEqual(self.server.uploads.count("SHA256SUMS"), 1)
+        self.assertEqual(len(self.server.asset_content("SHA256SUMS").decode().splitlines()), 3)
+
 
 class TestConfigManager(unittest.TestCase):
     """Test ConfigManager class"""
@@ -350,6 +1912,352 @@ class TestConfigManager(unittest.TestCase):
             temp_path.unlink()
 
 
+class TestBuildCache(unittest.TestCase):
+    """Test BuildCache class"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        (self.root / "src-tauri").mkdir()
+        (self.root / "src-tauri" / "main.rs").write_text("fn main() {}")
+        (self.root / "Dockerfile").write_text("FROM rust:latest")
+        (self.root / "package-lock.json").write_text("{}")
+
+        self.config = BuildConfig(
+            dockerfile=self.root / "Dockerfile",
+            frontend_port=3003,
+            mode="build",
+            platforms=["linux"],
+            architectures=["x64"],
+            app_name="TestApp",
+            version="1.0.0",
+            output_dir=self.root / "dist",
+            optimize=True,
+            sign=False,
+            bundle_types={"linux": ["deb"]},
+            docker_image="rust:latest",
+            docker_cache=False,
+            cache_dir=self.root / ".tauri-cache"
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_fingerprint_is_stable(self):
+        """Test fingerprint does not change without input changes"""
+        first = BuildCache(self.config, root=self.root).fingerprint("linux", "x64")
+        second = BuildCache(self.config, root=self.root).fingerprint("linux", "x64")
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, BuildCache(self.config, root=self.root).fingerprint("linux", "arm64"))
+
+    def test_fingerprint_tracks_inputs(self):
+        """Test fingerprint changes with sources, lockfiles and build args"""
+        original = BuildCache(self.config, root=self.root).fingerprint("linux", "x64")
+
+        (self.root / "src-tauri" / "main.rs").write_text("fn main() { println!(); }")
+        changed_source = BuildCache(self.config, root=self.root).fingerprint("linux", "x64")
+        self.assertNotEqual(original, changed_source)
+
+        (self.root / "package-lock.json").write_text('{"lockfileVersion": 3}')
+        changed_lock = BuildCache(self.config, root=self.root).fingerprint("linux", "x64")
+        self.assertNotEqual(changed_source, changed_lock)
+
+        self.config.optimize = False
+        changed_args = BuildCache(self.config, root=self.root).fingerprint("linux", "x64")
+        self.assertNotEqual(changed_lock, changed_args)
+
+    def test_fingerprint_ignores_build_outputs(self):
+        """Test build outputs and caches do not affect the fingerprint"""
+        original = BuildCache(self.config, root=self.root).fingerprint("linux", "x64")
+
+        (self.root / "target").mkdir()
+        (self.root / "target" / "app").write_bytes(b"binary")
+        (self.root / "dist").mkdir()
+        (self.root / "dist" / "app.deb").write_bytes(b"bundle")
+
+        self.assertEqual(original, BuildCache(self.config, root=self.root).fingerprint("linux", "x64"))
+
+    def test_store_and_restore(self):
+        """Test artifacts round-trip through the cache"""
+        cache = BuildCache(self.config, root=self.root)
+        fingerprint = cache.fingerprint("linux", "x64")
+
+        self.assertIsNone(cache.restore(fingerprint, "linux"))
+
+        artifact = self.root / "app.deb"
+        artifact.write_bytes(b"debian package")
+        cache.store(fingerprint, "linux", [artifact])
+
+        restored = cache.restore(fingerprint, "linux")
+        self.assertEqual(restored, [self.root / "dist" / "linux" / "app.deb"])
+        self.assertEqual(restored[0].read_bytes(), b"debian package")
+
+
+class TestDeltas(unittest.TestCase):
+    """Test the artifact store, delta patches and updater manifest"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.root = Path(self.temp_dir.name)
+        self.store = ArtifactStore(self.root / ".tauri-cache")
+        self.config = BuildConfig(
+            dockerfile=Path("Dockerfile"),
+            frontend_port=3003,
+            mode="publish",
+            platforms=["linux"],
+            architectures=["x64"],
+            app_name="TestApp",
+            version="1.1.0",
+            output_dir=self.root / "dist",
+            optimize=True,
+            sign=False,
+            bundle_types={"linux": ["AppImage"]},
+            docker_image="rust:latest",
+            docker_cache=False,
+            github_repo="user/repo",
+            release_tag="v1.1.0",
+            deltas=True
+        )
+
+    def _artifact(self, name, content):
+        path = self.root / "dist" / "linux" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+        return path
+
+    def test_store_orders_versions(self):
+        """Test the previous version is found by version order"""
+        for version in ("1.10.0", "1.2.0", "1.9.3"):
+            self.store.add(version, "linux-x64", [self._artifact(f"app_{version}.deb", version.encode())])
+
+        self.assertEqual(self.store.versions(), ["1.2.0", "1.9.3", "1.10.0"])
+        self.assertEqual(self.store.previous_version("1.10.0"), "1.9.3")
+        self.assertIsNone(self.store.previous_version("1.2.0"))
+        records = self.store.get("1.9.3", "linux-x64")
+        self.assertEqual(records[0]["name"], "app_1.9.3.deb")
+        self.assertEqual(records[0]["path"].read_bytes(), b"1.9.3")
+
+    def test_collect_links_output_to_store(self):
+        """Test the output file is a link to a read-only object, not to the build output"""
+        source = self.root / "target" / "app.deb"
+        source.parent.mkdir()
+        source.write_bytes(b"debian package")
+        dest = self.root / "dist" / "linux" / "app.deb"
+        dest.parent.mkdir(parents=True)
+
+        record = self.store.collect(source, dest)
+
+        obj = self.store.object_path(record.sha256)
+        self.assertTrue(os.path.samefile(dest, obj))
+        self.assertFalse(os.path.samefile(source, obj))
+        self.assertEqual(obj.stat().st_mode & 0o777, 0o444)
+
+    @patch.object(ArtifactStore, "GRACE_PERIOD", 0)
+    def test_gc_retention(self):
+        """Test old versions go first, then the least recently used, never protected ones"""
+        for i, version in enumerate(("1.0.0", "1.1.0", "1.2.0")):
+            path = self._artifact(f"app_{version}.deb", bytes([i]) * 1000)
+            self.store.collect(path, path)
+            self.store.add(version, "linux-x64", [path])
+        old_link = self.root / "dist" / "linux" / "app_1.0.0.deb"
+        os.utime(self.store._index_path("1.2.0"), (1, 1))
+
+        stats = self.store.gc(keep_versions=2, linked_dirs=[self.root / "dist"])
+        self.assertEqual((stats["versions"], stats["objects"]), (1, 1))
+        self.assertFalse(old_link.exists())
+        self.assertEqual(self.store.versions(), ["1.1.0", "1.2.0"])
+
+        # 1.2.0 was used least recently, but it is protected
+        stats = self.store.gc(budget=1000, protect=["1.2.0"])
+        self.assertEqual(stats["bytes"], 1000)
+        self.assertEqual(self.store.versions(), ["1.2.0"])
+
+    @patch.object(ArtifactStore, "GRACE_PERIOD", 0)
+    def test_gc_bounds_build_cache_entries(self):
+        """Test cache entries go with their version and are capped per target by default retention"""
+        self.config.cache_dir = self.root / ".tauri-cache"
+        for i, version in enumerate(("1.0.0", "1.1.0", "1.1.0", "1.1.0")):
+            self.config.version = version
+            path = self._artifact(f"app_{i}.deb", bytes([i]) * 100)
+            BuildCache(self.config).store(f"fp{i}", "linux", [path])
+            os.utime(self.store.entries_dir / f"fp{i}.json", (i + 1, i + 1))
+        self.store.add("1.0.0", "linux-x64", [self._artifact("app_1.0.0.deb", b"1.0.0")])
+        self.store.add("1.1.0", "linux-x64", [self._artifact("app_1.1.0.deb", b"1.1.0")])
+
+        stats = self.store.gc(keep_versions=1)
+
+        # fp0 belonged to 1.0.0, fp1 and fp2 are older than the one entry kept per target
+        self.assertEqual((stats["versions"], stats["entries"]), (1, 3))
+        self.assertEqual(sorted(p.stem for p in self.store.entries_dir.glob("*.json")), ["fp3"])
+
+    @unittest.skipUnless(DeltaGenerator.detect(), "neither zstd nor bsdiff4 is installed")
+    def test_generates_patch_from_previous_release(self):
+        """Test a verified patch is produced against the matching old artifact"""
+        old = os.urandom(256 * 1024)
+        self.store.add("1.0.0", "linux-x64", [self._artifact("app_1.0.0_amd64.AppImage", old)])
+        new = self._artifact("app_1.1.0_amd64.AppImage", old[:1000] + b"patched" + old[1000:])
+
+        generator = DeltaGenerator(self.store)
+        deltas = generator.generate("1.1.0", "linux-x64", [new])
+
+        self.assertEqual(len(deltas), 1)
+        delta = deltas[0]
+        self.assertEqual((delta.source, delta.from_version), ("app_1.0.0_amd64.AppImage", "1.0.0"))
+        self.assertEqual(delta.path.parent, new.parent)
+        self.assertLess(delta.size, len(old) // 10)
+        patched = self.root / "patched"
+        DeltaGenerator.apply(delta.algorithm, self.store.get("1.0.0", "linux-x64")[0]["path"], delta.path, patched)
+        self.assertEqual(patched.read_bytes(), new.read_bytes())
+
+    @unittest.skipUnless(shutil.which("zstd"), "zstd is not installed")
+    def test_patch_for_large_bundle(self):
+        """Test a bundle larger than zstd's default window still yields a tiny patch"""
+        old = self._artifact("app_1.0.0_amd64.AppImage", b"")
+        with open(old, "wb") as f:
+            for _ in range(192):
+                f.write(os.urandom(1024 * 1024))
+        self.store.add("1.0.0", "linux-x64", [old])
+        new = self._artifact("app_1.1.0_amd64.AppImage", b"")
+        shutil.copyfile(old, new)
+        with open(new, "r+b") as f:
+            f.seek(150 * 1024 * 1024)
+            f.write(b"patched")
+
+        generator = DeltaGenerator(self.store)
+        generator.algorithm = "zstd"
+        deltas = generator.generate("1.1.0", "linux-x64", [new])
+
+        self.assertEqual(len(deltas), 1)
+        self.assertLess(deltas[0].size, 1024 * 1024)
+
+    def test_updater_manifest(self):
+        """Test the manifest points Tauri at the full bundle and lists its patches"""
+        bundle = self._artifact("app_1.1.0_amd64.AppImage", b"appimage")
+        self._artifact("app_1.1.0_amd64.AppImage.sig", b"c2lnbmF0dXJl\n")
+        patch_path = self._artifact("app_1.1.0_amd64.AppImage.1.0.0.zstpatch", b"patch")
+        delta = Delta(path=patch_path, source="app_1.0.0_amd64.AppImage", target=bundle.name,
+                      from_version="1.0.0", algorithm="zstd", sha256="abc", size=5)
+
+        manifest = UpdaterManifest(self.config)
+        manifest.add("linux", "x64", [bundle, patch_path], [delta])
+        data = json.loads(manifest.write(self.root / "dist" / "latest.json").read_text())
+
+        self.assertEqual(data["version"], "1.1.0")
+        entry = data["platforms"]["linux-x86_64"]
+        self.assertEqual(entry["signature"], "c2lnbmF0dXJl")
+        self.assertEqual(entry["url"],
+                         "https://github.com/user/repo/releases/download/v1.1.0/app_1.1.0_amd64.AppImage")
+        self.assertEqual(entry["deltas"][0]["from"], "1.0.0")
+        self.assertTrue(entry["deltas"][0]["url"].endswith("/app_1.1.0_amd64.AppImage.1.0.0.zstpatch"))
+
+
+class TestBuildScheduler(unittest.TestCase):
+    """Test BuildScheduler class"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.config = BuildConfig(
+            dockerfile=Path("Dockerfile"),
+            frontend_port=3003,
+            mode="build",
+            platforms=["linux", "windows"],
+            architectures=["x64", "arm64"],
+            app_name="TestApp",
+            version="1.0.0",
+            output_dir=Path("dist"),
+            optimize=True,
+            sign=False,
+            bundle_types={},
+            docker_image="rust:latest",
+            docker_cache=False,
+            cache_dir=Path(self.temp_dir.name)
+        )
+
+    def _job(self, platform, arch, order, **kwargs):
+        return BuildJob(platform=platform, arch=arch,
+                        fn=lambda: order.append(f"{platform}-{arch}") or [], **kwargs)
+
+    def test_sizes_from_configured_budget(self):
+        """Test configured job and memory budgets take precedence"""
+        self.config.max_parallel_jobs = 5
+        self.config.memory_budget = 8 * BuildScheduler.GIB
+
+        scheduler = BuildScheduler(self.config)
+
+        self.assertEqual(scheduler.max_workers, 5)
+        self.assertEqual(scheduler.memory_budget, 8 * BuildScheduler.GIB)
+
+    @patch('os.cpu_count', return_value=64)
+    def test_sizes_from_resources(self, mock_cpu_count):
+        """Test concurrency is limited by both CPUs and memory"""
+        self.config.memory_budget = 12 * BuildScheduler.GIB
+        self.assertEqual(BuildScheduler(self.config).max_workers, 3)
+
+        self.config.memory_budget = 256 * BuildScheduler.GIB
+        self.assertEqual(BuildScheduler(self.config).max_workers, 16)
+
+    def test_orders_by_priority_then_duration(self):
+        """Test high priority and historically slow jobs start first"""
+        (Path(self.temp_dir.name) / "durations.json").write_text(
+            json.dumps({"windows-x64": 900.0, "linux-x64": 300.0})
+        )
+        self.config.max_parallel_jobs = 1
+        order = []
+
+        with BuildScheduler(self.config) as scheduler:
+            scheduled = scheduler.schedule([
+                self._job("linux", "x64", order),
+                self._job("linux", "arm64", order, priority=10),
+                self._job("windows", "x64", order),
+            ])
+            for job, future in scheduled:
+                future.result()
+
+        self.assertEqual(order, ["linux-arm64", "windows-x64", "linux-x64"])
+
+    def test_records_durations(self):
+        """Test job durations are persisted for later runs"""
+        with BuildScheduler(self.config) as scheduler:
+            for job, future in scheduler.schedule([self._job("linux", "x64", [])]):
+                future.result()
+
+        history = json.loads((Path(self.temp_dir.name) / "durations.json").read_text())
+        self.assertIn("linux-x64", history)
+
+    def test_memory_admission(self):
+        """Test jobs wait until their estimated memory is free"""
+        import threading
+        import time
+
+        self.config.max_parallel_jobs = 3
+        self.config.memory_budget = 4 * BuildScheduler.GIB
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def work():
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.pop()
+            return []
+
+        with BuildScheduler(self.config) as scheduler:
+            scheduled = scheduler.schedule([
+                BuildJob(platform="linux", arch=arch, fn=work, memory=3 * BuildScheduler.GIB)
+                for arch in ("x64", "arm64", "riscv")
+            ])
+            for job, future in scheduled:
+                future.result()
+
+        self.assertEqual(max(peak), 1)
+
+
 class TestTauriBuilder(unittest.TestCase):
     """Test TauriBuilder main class"""
 
@@ -367,7 +2275,9 @@ class TestTauriBuilder(unittest.TestCase):
             sign=False,
             bundle_types={"linux": ["deb"]},
             docker_image="rust:latest",
-            docker_cache=False
+            docker_cache=False,
+            artifact_store=False,
+            docker_gc=False
         )
 
     @patch('tauri_builder.DockerManager')
@@ -410,6 +2320,321 @@ class TestTauriBuilder(unittest.TestCase):
         self.assertEqual(len(artifacts["linux-x64"]), 1)
         mock_platform_builder.build_for_platform.assert_called_once_with("linux", "x64")
 
+    @patch('tauri_builder.DockerManager')
+    def test_run_build_mode_cache_hit(self, mock_docker_manager_class):
+        """Test cached targets are restored instead of rebuilt"""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.config.output_dir = Path(temp_dir.name)
+        self.config.cache_dir = Path(temp_dir.name) / ".tauri-cache"
+        builder = TauriBuilder(self.config)
+        builder.platform_builder = MagicMock()
+        builder.build_cache = MagicMock()
+        builder.build_cache.restore.return_value = [Path("dist/linux/app.deb")]
+
+        artifacts = builder._run_build_mode()
+
+        self.assertEqual(artifacts["linux-x64"], [Path("dist/linux/app.deb")])
+        builder.platform_builder.build_for_platform.assert_not_called()
+        builder.build_cache.store.assert_not_called()
+
+    @patch('tauri_builder.DockerManager')
+    def test_run_build_mode_cache_miss(self, mock_docker_manager_class):
+        """Test built targets are stored in the cache"""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.config.output_dir = Path(temp_dir.name)
+        self.config.cache_dir = Path(temp_dir.name) / ".tauri-cache"
+        builder = TauriBuilder(self.config)
+        builder.platform_builder = MagicMock()
+        builder.platform_builder.build_for_platform.return_value = [Path("app.deb")]
+        builder.build_cache = MagicMock()
+        builder.build_cache.fingerprint.return_value = "abc123"
+        builder.build_cache.restore.return_value = None
+
+        artifacts = builder._run_build_mode()
+
+        self.assertEqual(artifacts["linux-x64"], [Path("app.deb")])
+        builder.build_cache.store.assert_called_once_with("abc123", "linux", [Path("app.deb")])
+
+    @patch('tauri_builder.DockerManager')
+    def test_run_build_mode_merged_architectures(self, mock_docker_manager_class):
+        """Test a platform's architectures run as one job and are split back out"""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.config.output_dir = Path(temp_dir.name)
+        self.config.cache_dir = Path(temp_dir.name) / ".tauri-cache"
+        self.config.architectures = ["x64", "arm64"]
+        self.config.merge_architectures = True
+        self.config.dockerfile = Path(temp_dir.name) / "Dockerfile"
+        self.config.dockerfile.write_text("FROM rust AS base\nFROM base AS linux-builder\n")
+        mock_docker_manager_class._get_target_stage.side_effect = DockerManager._get_target_stage
+        builder = TauriBuilder(self.config)
+        builder.platform_builder = MagicMock()
+        builder.platform_builder.build_merged.return_value = {
+            "x64": [Path("app_amd64.deb")], "arm64": [Path("app_arm64.deb")]
+        }
+        builder.build_cache = MagicMock()
+        builder.build_cache.fingerprint.side_effect = lambda platform, arch: f"fp-{arch}"
+        builder.build_cache.restore.return_value = None
+
+        artifacts = builder._run_build_mode()
+
+        builder.platform_builder.build_merged.assert_called_once_with("linux", ["x64", "arm64"])
+        builder.platform_builder.build_for_platform.assert_not_called()
+        self.assertEqual(artifacts, {"linux-x64": [Path("app_amd64.deb")],
+                                     "linux-arm64": [Path("app_arm64.deb")]})
+        builder.build_cache.store.assert_any_call("fp-arm64", "linux", [Path("app_arm64.deb")])
+
+    @patch('tauri_builder.DockerManager')
+    def test_run_build_mode_merges_only_archs_sharing_a_stage(self, mock_docker_manager_class):
+        """Test architectures needing their own cross-toolchain stage are not merged"""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.config.output_dir = Path(temp_dir.name)
+        self.config.build_cache = False
+        self.config.architectures = ["x64", "arm64"]
+        self.config.merge_architectures = True
+        self.config.dockerfile = Path(temp_dir.name) / "Dockerfile"
+        dockerfile = "FROM rust AS base\nFROM base AS linux-builder\nFROM base AS arm64-builder\n"
+        self.config.dockerfile.write_text(dockerfile)
+        mock_docker_manager_class._get_target_stage.side_effect = DockerManager._get_target_stage
+        builder = TauriBuilder(self.config)
+        builder.platform_builder = MagicMock()
+        builder.platform_builder.build_for_platform.side_effect = \
+            lambda platform, arch: [Path(f"app_{arch}.deb")]
+
+        artifacts = builder._run_build_mode()
+
+        self.assertEqual(DockerManager._get_target_stage(dockerfile, "linux", "x64"), "linux-builder")
+        self.assertEqual(DockerManager._get_target_stage(dockerfile, "linux", "arm64"), "arm64-builder")
+        builder.platform_builder.build_merged.assert_not_called()
+        builder.platform_builder.build_for_platform.assert_any_call("linux", "x64")
+        builder.platform_builder.build_for_platform.assert_any_call("linux", "arm64")
+        self.assertEqual(set(artifacts), {"linux-x64", "linux-arm64"})
+
+    @patch('tauri_builder.DockerManager')
+    def test_pipelined_publish(self, mock_docker_manager_class):
+        """Test each target is uploaded as it finishes and failures reach the release"""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.config.output_dir = Path(temp_dir.name)
+        self.config.build_cache = False
+        self.config.platforms = ["linux", "windows"]
+        self.config.bundle_types = {"linux": ["deb"], "windows": ["msi"]}
+        self.config.mode = "publish"
+        self.config.pipeline_publish = True
+        self.config.github_token = "token"
+        builder = TauriBuilder(self.config)
+        builder.platform_builder = MagicMock()
+
+        def build_for_platform(platform, arch):
+            if platform == "windows":
+                raise RuntimeError("Build failed with status 101")
+            return [Path("app.deb")]
+        builder.platform_builder.build_for_platform.side_effect = build_for_platform
+        builder.github_publisher = MagicMock()
+        publication = builder.github_publisher.start_release.return_value
+        publication.finish.return_value = "https://github.com/user/repo/releases/v1.0.0"
+
+        artifacts = builder._run_pipelined_publish()
+
+        self.assertEqual(artifacts, {"linux-x64": [Path("app.deb")]})
+        builder.github_publisher.start_release.assert_called_once_with(builder.manifest, pipelined=True)
+        publication.add.assert_called_once_with("linux-x64", [Path("app.deb")])
+        publication.finish.assert_called_once_with(["windows-x64"])
+        self.assertEqual(builder.release_url, "https://github.com/user/repo/releases/v1.0.0")
+
+
+try:
+    import flask
+except ImportError:
+    flask = None
+
+
+class FakeBuilder:
+    """Stands in for TauriBuilder, blocking until released"""
+
+    def __init__(self, config, log_consumers=None):
+        self.config = config
+        self.log_consumers = log_consumers or []
+        self.timings = {}
+        self.release_url = None
+        self.release = FakeBuilder.release
+
+    def execute(self):
+        for consumer in self.log_consumers:
+            consumer("Compiling app v0.1.0")
+        self.release.wait(5)
+        if self.config.version == 'broken':
+            raise RuntimeError("Build failed with status 101")
+        self.timings = {'build': 1.5, 'total': 2.0}
+        return {'linux-x64': [Path('dist/linux/app.deb')]}
+
+
+@unittest.skipIf(flask is None, "Flask is not installed")
+class TestBuildApi(unittest.TestCase):
+    """Test the asynchronous REST API"""
+
+    def setUp(self):
+        import threading
+        from api import tauri_builder_api as api
+
+        FakeBuilder.release = threading.Event()
+        self.api = api
+        self.queue = api.JobQueue(max_workers=2, max_queued=2, builder_factory=FakeBuilder)
+        patcher = patch.object(api, 'jobs', self.queue)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.queue.shutdown)
+        self.addCleanup(FakeBuilder.release.set)
+        self.client = api.app.test_client()
+        self.payload = {
+            'dockerfile': 'Dockerfile',
+            'platforms': 'linux',
+            'architectures': ['x64'],
+            'output_dir': 'dist',
+            'mode': 'build',
+            'optimize': True,
+            'docker_image': 'rust:latest',
+            'version': '1.0.0',
+        }
+
+    def wait_for(self, job_id):
+        job = self.queue.get(job_id)
+        deadline = time.time() + 5
+        while not job.done and time.time() < deadline:
+            time.sleep(0.01)
+        return self.client.get(f'/jobs/{job_id}').get_json()
+
+    def test_build_returns_job_immediately(self):
+        response = self.client.post('/build', json=self.payload)
+
+        self.assertEqual(response.status_code, 202)
+        body = response.get_json()
+        self.assertIn(body['status'], ('queued', 'running'))
+
+        FakeBuilder.release.set()
+        job = self.wait_for(body['job_id'])
+        self.assertEqual(job['status'], 'succeeded')
+        self.assertEqual(job['artifacts'], {'linux-x64': ['dist/linux/app.deb']})
+        self.assertEqual(job['timings'], {'build': 1.5, 'total': 2.0})
+
+    def test_identical_requests_are_merged(self):
+        first = self.client.post('/build', json=self.payload).get_json()
+        second = self.client.post('/build', json=dict(self.payload)).get_json()
+        other = self.client.post('/build', json={**self.payload, 'version': '2.0.0'}).get_json()
+
+        self.assertEqual(first['job_id'], second['job_id'])
+        self.assertTrue(second['merged'])
+        self.assertNotEqual(first['job_id'], other['job_id'])
+
+        # Queue is full with two distinct jobs in flight
+        response = self.client.post('/build', json={**self.payload, 'version': '3.0.0'})
+        self.assertEqual(response.status_code, 503)
+
+    def test_failed_build_is_reported(self):
+        FakeBuilder.release.set()
+        body = self.client.post('/build', json={**self.payload, 'version': 'broken'}).get_json()
+
+        job = self.wait_for(body['job_id'])
+        self.assertEqual(job['status'], 'failed')
+        self.assertIn('status 101', job['error'])
+
+    def test_invalid_request(self):
+        response = self.client.post('/build', json={**self.payload, 'bogus': 1})
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.post('/build', json={'platforms': 'linux'})
+        self.assertEqual(response.status_code, 400)
+
+        self.assertEqual(self.client.get('/jobs/missing').status_code, 404)
+
+    def test_build_config_types_and_defaults(self):
+        """Test request fields are converted and defaulted as BuildConfig declares them"""
+        config = self.api.build_config({
+            'dockerfile': 'Dockerfile',
+            'platforms': 'linux,macos',
+            'trace_file': 'trace.json',
+            'layer_cache': 'layers',
+        })
+
+        self.assertEqual(config.platforms, ['linux', 'macos'])
+        self.assertEqual(config.trace_file, Path('trace.json'))
+        self.assertEqual(config.layer_cache, Path('layers'))
+        self.assertEqual(config.output_dir, Path('dist'))
+        self.assertEqual(config.architectures, ['x64'])
+        self.assertIsNone(self.api.build_config({'dockerfile': 'Dockerfile', 'trace_file': None}).trace_file)
+
+    def test_metrics(self):
+        self.client.post('/build', json=self.payload)
+
+        response = self.client.get('/metrics')
+        text = response.get_data(as_text=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('# TYPE tauridock_api_queue_depth gauge', text)
+        self.assertRegex(text, r'tauridock_api_jobs_running 1\n|tauridock_api_queue_depth 1\n')
+        self.assertIn('process_resident_memory_bytes', text)
+
+    def test_log_stream(self):
+        body = self.client.post('/build', json=self.payload).get_json()
+        FakeBuilder.release.set()
+
+        response = self.client.get(f"/jobs/{body['job_id']}/logs")
+        stream = response.get_data(as_text=True)
+
+        self.assertEqual(response.mimetype, 'text/event-stream')
+        self.assertIn('data: Compiling app v0.1.0\n\n', stream)
+        self.assertTrue(stream.endswith('event: end\ndata: succeeded\n\n'))
+
+
+class TestStartup(unittest.TestCase):
+    """CLI startup must not pay for Docker, GitHub or YAML support"""
+
+    IMPORT_BUDGET = 1.0
+
+    def run_python(self, code):
+        import subprocess
+        return subprocess.run(
+            [sys.executable, '-c', code], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)), timeout=30
+        )
+
+    def test_import_skips_heavy_modules(self):
+        result = self.run_python(
+            "import sys, time\n"
+            "start = time.perf_counter()\n"
+            "import tauridock\n"
+            "elapsed = time.perf_counter() - start\n"
+            "heavy = [m for m in ('docker', 'github', 'requests', 'yaml') if m in sys.modules]\n"
+            "print(elapsed, ','.join(heavy))\n"
+        )
+        if result.returncode != 0 and 'ModuleNotFoundError' in result.stderr:
+            self.skipTest(result.stderr.strip().splitlines()[-1])
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+        elapsed, _, heavy = result.stdout.strip().partition(' ')
+        self.assertEqual(heavy, '')
+        self.assertLess(float(elapsed), self.IMPORT_BUDGET)
+
+    def test_help_skips_heavy_modules(self):
+        result = self.run_python(
+            "import sys, runpy\n"
+            "sys.argv = ['tauridock.py', '--help']\n"
+            "try:\n"
+            "    runpy.run_path('tauridock.py', run_name='__main__')\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print([m for m in ('docker', 'github', 'requests', 'yaml') if m in sys.modules])\n"
+        )
+        if result.returncode != 0 and 'ModuleNotFoundError' in result.stderr:
+            self.skipTest(result.stderr.strip().splitlines()[-1])
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+        self.assertIn('Usage:', result.stdout)
+        self.assertTrue(result.stdout.strip().endswith('[]'))
+
 
 class TestIntegration(unittest.TestCase):
     """Integration tests"""